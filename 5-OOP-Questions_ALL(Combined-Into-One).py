@@ -13,8 +13,26 @@
 #
 # Note: The commented-out line shows an example of what happens if you try to call a
 # method (start_engine) on an instance that doesn’t have it, which would raise an AttributeError.
+#
+# A 'Fleet' container indexes many vehicles by their exact class and by model year, and keeps running
+# seating-capacity totals per class. Questions like "all SchoolBus instances" or "total capacity" follow the
+# class hierarchy (Vehicle -> SchoolBus) through those indexes instead of checking every vehicle.
+#
+# Starting an engine can also be done asynchronously (start_engine_async), which simulates a round-trip to a
+# telematics service. 'EngineStartDispatcher' starts many vehicles concurrently with a concurrency limit,
+# per-call timeouts and retries, and reports percentiles of the start latency and of the time spent queued.
+#
+# 'SchoolBusPlanner' uses each SchoolBus's capacity to seat the students of many schools, using a
+# first-fit-decreasing heuristic over sorted capacity lists to keep the number of buses low.
+
+import math
+import time
+from bisect import bisect_left, insort
 
 class Vehicle:
+    # Simulated telematics round-trip time (seconds) used by start_engine_async.
+    telematics_delay = 0.01
+
     def __init__(self, name, model):
         # Initialize the protected attributes.
         # Using a single underscore (_name, _model) signals that these should not be accessed directly.
@@ -29,6 +47,14 @@ class Vehicle:
         # Simulates the action of starting the vehicle's engine.
         return "Engine started."
 
+    async def start_engine_async(self):
+        # Asynchronous variant of start_engine: waits for the (simulated) telematics
+        # round-trip without blocking other vehicles, then starts the engine.
+        # asyncio is imported where it is used so that importing this module stays fast.
+        import asyncio
+        await asyncio.sleep(self.telematics_delay)
+        return self.start_engine()
+
 class SchoolBus(Vehicle):
     def __init__(self, name, model, capacity):
         # Call the parent constructor to initialize shared attributes: name and model.
@@ -40,6 +66,193 @@ class SchoolBus(Vehicle):
         # Overrides the parent's __str__ method to include capacity information.
         return f"INFO: {self._name} School Bus, made in {self._model}, with a capacity of {self.capacity} passengers."
 
+# Container that indexes vehicles by class and by model.
+class Fleet:
+    def __init__(self, vehicles=()):
+        # Each index maps a key to {id(vehicle): vehicle}, which keeps insertion order
+        # and makes removal O(1).
+        self._by_class = {}
+        self._by_model = {}
+        self._capacity_by_class = {}
+        self._count = 0
+        for vehicle in vehicles:
+            self.add(vehicle)
+
+    def add(self, vehicle):
+        # Register a vehicle under its exact class and its model year. Adding a vehicle that is
+        # already in the fleet does nothing.
+        if not isinstance(vehicle, Vehicle):
+            raise TypeError("Fleet can only hold Vehicle instances")
+        cls = type(vehicle)
+        same_class = self._by_class.setdefault(cls, {})
+        if id(vehicle) in same_class:
+            return
+        same_class[id(vehicle)] = vehicle
+        self._by_model.setdefault(vehicle._model, {})[id(vehicle)] = vehicle
+        self._capacity_by_class[cls] = self._capacity_by_class.get(cls, 0) + getattr(vehicle, 'capacity', 0)
+        self._count += 1
+
+    def remove(self, vehicle):
+        # Remove a vehicle from every index (KeyError if it is not in the fleet).
+        cls = type(vehicle)
+        del self._by_class[cls][id(vehicle)]
+        del self._by_model[vehicle._model][id(vehicle)]
+        self._capacity_by_class[cls] -= getattr(vehicle, 'capacity', 0)
+        self._count -= 1
+
+    def _classes(self, cls, include_subclasses):
+        # The indexed classes a query covers. This loops over classes, never over vehicles.
+        if not include_subclasses:
+            return [cls] if cls in self._by_class else []
+        return [indexed for indexed in self._by_class if issubclass(indexed, cls)]
+
+    def of_type(self, cls=Vehicle, include_subclasses=True):
+        # Iterate over every vehicle of class 'cls' (and, by default, its subclasses).
+        for indexed in self._classes(cls, include_subclasses):
+            yield from self._by_class[indexed].values()
+
+    def count(self, cls=Vehicle, include_subclasses=True):
+        return sum(len(self._by_class[indexed]) for indexed in self._classes(cls, include_subclasses))
+
+    def total_capacity(self, cls=Vehicle, include_subclasses=True):
+        # Seating capacity of the selected classes, read from the running totals.
+        return sum(self._capacity_by_class[indexed] for indexed in self._classes(cls, include_subclasses))
+
+    def of_model(self, model):
+        # All vehicles with the given model year.
+        return list(self._by_model.get(model, {}).values())
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return self.of_type(Vehicle)
+
+# Starts many vehicles concurrently.
+class EngineStartDispatcher:
+    def __init__(self, concurrency=100, timeout=1.0, retries=2, backoff=0.05):
+        # concurrency: at most this many start requests are in flight at once.
+        # timeout: seconds allowed for a single attempt.
+        # retries: extra attempts after a failure; the wait before retry n is backoff * 2 ** n.
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+
+    async def _start(self, vehicle, semaphore, report):
+        # Start one vehicle, retrying failed or timed-out attempts. Returns (latency, queue wait,
+        # error): the latency is the duration of the successful attempt alone (timed once the
+        # semaphore is held), and the queue wait is the total time spent waiting for the semaphore.
+        import asyncio
+        queue_wait = 0.0
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+            report['attempts'] += 1
+            queued = time.perf_counter()
+            try:
+                async with semaphore:
+                    began = time.perf_counter()
+                    queue_wait += began - queued
+                    await asyncio.wait_for(vehicle.start_engine_async(), self.timeout)
+                    return time.perf_counter() - began, queue_wait, None
+            except asyncio.TimeoutError:
+                error = f"timed out after {self.timeout}s"
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+        return None, queue_wait, error
+
+    async def dispatch(self, vehicles):
+        # Start every vehicle (any iterable, such as a Fleet) and return a report with the
+        # number started, the failures, total attempts, wall time, and percentiles of the start
+        # latency (successful attempts) and of the queue wait (every vehicle).
+        import asyncio
+        vehicles = list(vehicles)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        report = {'started': 0, 'failed': [], 'attempts': 0}
+        began = time.perf_counter()
+        outcomes = await asyncio.gather(*(self._start(vehicle, semaphore, report) for vehicle in vehicles))
+        report['wall_time'] = time.perf_counter() - began
+        latencies = []
+        for vehicle, (latency, _, error) in zip(vehicles, outcomes):
+            if error is None:
+                report['started'] += 1
+                latencies.append(latency)
+            else:
+                report['failed'].append((vehicle, error))
+        report['latency'] = self.percentiles(latencies)
+        report['queue_wait'] = self.percentiles([queue_wait for _, queue_wait, _ in outcomes])
+        return report
+
+    def run(self, vehicles):
+        # Synchronous entry point: runs dispatch() in a fresh event loop.
+        import asyncio
+        return asyncio.run(self.dispatch(vehicles))
+
+    @staticmethod
+    def percentiles(values, points=(50, 90, 99)):
+        # Nearest-rank percentiles of 'values' (seconds), plus the maximum.
+        ordered = sorted(values)
+        if not ordered:
+            return {}
+        result = {f"p{p}": ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)] for p in points}
+        result['max'] = ordered[-1]
+        return result
+
+# Assigns students from many schools to a set of school buses.
+class SchoolBusPlanner:
+    def __init__(self, buses):
+        self.buses = list(buses)
+        # A bus without seats would never reduce a school's remaining riders.
+        for bus in self.buses:
+            if bus.capacity <= 0:
+                raise ValueError(f"Bus capacity must be positive, got {bus.capacity} for {bus._name}")
+
+    def assign(self, schools):
+        # 'schools' maps a school name to its number of riders, or to a roster (anything with a
+        # len(), such as a list of grades or a School). Schools are placed largest first. Each school goes into
+        # the already-used bus whose free seats fit it most tightly; if none fits, the smallest
+        # unused bus that holds the whole school is taken. A school is only split across buses
+        # when it is bigger than every remaining bus.
+        riders = {name: value if isinstance(value, int) else len(value) for name, value in schools.items()}
+        for name, need in riders.items():
+            if need < 0:
+                raise ValueError(f"Rider count must not be negative, got {need} for {name}")
+        unused = sorted((bus.capacity, number) for number, bus in enumerate(self.buses))
+        free_seats = []  # sorted (free seats, bus number) for buses already in use
+        loads = {}
+        unassigned = {}
+        for name, need in sorted(riders.items(), key=lambda item: item[1], reverse=True):
+            while need:
+                position = bisect_left(free_seats, (need, -1))
+                if position < len(free_seats):
+                    seats, number = free_seats.pop(position)
+                elif unused and unused[-1][0] >= need:
+                    seats, number = unused.pop(bisect_left(unused, (need, -1)))
+                elif unused:
+                    seats, number = unused.pop()  # Largest unused bus; the school will be split.
+                elif free_seats:
+                    seats, number = free_seats.pop()  # Out of buses: use the biggest leftover space.
+                else:
+                    unassigned[name] = need
+                    break
+                placed = min(seats, need)
+                loads.setdefault(number, []).append((name, placed))
+                need -= placed
+                if seats > placed:
+                    insort(free_seats, (seats - placed, number))
+
+        assignments = {self.buses[number]: load for number, load in sorted(loads.items())}
+        seated = sum(riders.values()) - sum(unassigned.values())
+        capacity = sum(bus.capacity for bus in assignments)
+        return {
+            'assignments': assignments,
+            'buses_used': len(assignments),
+            'unassigned': unassigned,
+            'utilisation': seated / capacity if capacity else 0.0,
+        }
+
 # Unrelated class that does not derive from Vehicle.
 class Fruit:
     def __init__(self, name, color):
@@ -52,24 +265,86 @@ class Fruit:
         return f"INFO: {self.color} {self.name}"
 
 # --- Q1 OUTPUT ---
-print("\nQ1: Determine if School bus is also an instance of the Vehicle class")
-print("___________________________________________________________________")
-print("------ Testing with a Vehicle instance ------")
-bus = SchoolBus("Mitsubishi L300XV", "2014", 17)  # Create a SchoolBus instance.
-print(bus.start_engine())  # Inherited method from Vehicle demonstrating abstraction.
-print(bus)                 # Demonstrates polymorphism: the overridden __str__ method is called.
-print(f"Is {bus._name} School Bus an instance of Vehicle?", isinstance(bus, Vehicle))
-
-print("\n------ Testing with a Non-Vehicle instance ------")
-fruit = Fruit("Apple", "Red")  # Create a Fruit instance.
-print(fruit)                   # Uses its own __str__ method from the Fruit class.
-print(f"Is {fruit.name} an instance of Vehicle?", isinstance(fruit, Vehicle))
-
-# Uncommenting the next line would raise an AttributeError because 'fruit'
-# does not have a start_engine method (since it is not a Vehicle).
-# print(fruit.start_engine())
-
-print("\n==================================================================\n")
+def demo_q1():
+    # Runs the Q1 demonstration. It is only called when this file is executed
+    # directly, so importing the file defines the classes without printing anything.
+    print("\nQ1: Determine if School bus is also an instance of the Vehicle class")
+    print("___________________________________________________________________")
+    print("------ Testing with a Vehicle instance ------")
+    bus = SchoolBus("Mitsubishi L300XV", "2014", 17)  # Create a SchoolBus instance.
+    print(bus.start_engine())  # Inherited method from Vehicle demonstrating abstraction.
+    print(bus)                 # Demonstrates polymorphism: the overridden __str__ method is called.
+    print(f"Is {bus._name} School Bus an instance of Vehicle?", isinstance(bus, Vehicle))
+
+    print("\n------ Testing with a Non-Vehicle instance ------")
+    fruit = Fruit("Apple", "Red")  # Create a Fruit instance.
+    print(fruit)                   # Uses its own __str__ method from the Fruit class.
+    print(f"Is {fruit.name} an instance of Vehicle?", isinstance(fruit, Vehicle))
+
+    # Uncommenting the next line would raise an AttributeError because 'fruit'
+    # does not have a start_engine method (since it is not a Vehicle).
+    # print(fruit.start_engine())
+
+    # Keep a mixed fleet in an indexed registry and query it by class and by model year.
+    print("\n------ Testing with a Fleet ------")
+    fleet = Fleet([bus, Vehicle("Toyota Hiace", "2014"), SchoolBus("Isuzu NQR", "2019", 30)])
+    fleet.add(SchoolBus("Hino Blue Ribbon", "2014", 45))
+    print("Vehicles in the fleet:", len(fleet))
+    print("School buses:", fleet.count(SchoolBus))
+    print("Plain vehicles only:", fleet.count(Vehicle, include_subclasses=False))
+    print("Total seating capacity:", fleet.total_capacity())
+    print("Vehicles from 2014:", len(fleet.of_model("2014")))
+    for school_bus in fleet.of_type(SchoolBus):
+        print(" ", school_bus)
+    try:
+        fleet.add(fruit)
+    except TypeError as error:
+        print("ERROR:", error)
+
+    # Start a large fleet concurrently; total time is bounded by the concurrency limit rather than
+    # by the sum of every vehicle's round-trip.
+    print("\n------ Starting a fleet concurrently ------")
+    import random
+
+    import asyncio
+
+    class UnreliableBus(SchoolBus):
+        # Stand-in for a bus with a slow, flaky telematics link.
+        async def start_engine_async(self):
+            if random.random() < 0.2:
+                await asyncio.sleep(1)  # Longer than the dispatcher's timeout.
+            return await super().start_engine_async()
+
+    random.seed(1)
+    big_fleet = Fleet(SchoolBus(f"Bus {number}", "2020", 40) for number in range(2_000))
+    for number in range(50):
+        big_fleet.add(UnreliableBus(f"Unreliable {number}", "2012", 20))
+    report = EngineStartDispatcher(concurrency=500, timeout=0.1, retries=2, backoff=0.01).run(big_fleet)
+    print(f"Started {report['started']} of {len(big_fleet)} vehicles in {report['wall_time']:.2f}s "
+          f"({report['attempts']} attempts; one at a time would take ~{len(big_fleet) * Vehicle.telematics_delay:.0f}s)")
+    print("Latency:", ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in report['latency'].items()))
+    print("Queue wait:", ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in report['queue_wait'].items()))
+    for vehicle, error in report['failed']:
+        print(f"  FAILED {vehicle._name}: {error}")
+
+    # Seat the students of several schools on the fleet's buses.
+    print("\n------ Assigning students to school buses ------")
+    planner = SchoolBusPlanner(fleet.of_type(SchoolBus))
+    plan = planner.assign({"Greenwood High": [88, 92, 79, 85, 91], "Maple Leaf School": 40, "Riverside": 22})
+    for school_bus, load in plan['assignments'].items():
+        print(f"  {school_bus._name} ({school_bus.capacity} seats): {load}")
+    print(f"  Buses used: {plan['buses_used']}, utilisation: {plan['utilisation']:.0%}, unassigned: {plan['unassigned']}")
+
+    district_buses = [SchoolBus(f"Bus {number}", "2020", random.choice([17, 30, 45, 60])) for number in range(4_000)]
+    district_schools = {f"School {number}": random.randint(20, 400) for number in range(600)}
+    start = time.perf_counter()
+    plan = SchoolBusPlanner(district_buses).assign(district_schools)
+    print(f"  {sum(district_schools.values()):,} students on {plan['buses_used']:,} of {len(district_buses):,} buses "
+          f"in {time.perf_counter() - start:.3f}s, utilisation {plan['utilisation']:.1%}")
+
+if __name__ == "__main__":
+    demo_q1()
+    print("\n==================================================================\n")
 
 ##############################################
 # Q2: Build a class Employee with multiple constructors
@@ -84,8 +359,69 @@ print("\n==================================================================\n")
 #
 # The multiple ways to construct an instance showcase the flexibility of class methods
 # in providing alternate constructors for different data representations.
+#
+# For large imports there are streaming versions of these constructors (iter_from_lines, iter_from_csv and
+# iter_from_jsonl). They are generators that read the file in large buffered chunks, yield one Employee at
+# a time, and collect malformed rows into a reject list instead of stopping at the first bad row.
+#
+# 'EmployeeDirectory' is a container that indexes employees by emp_id (a dict, so lookups are O(1)) and by
+# department (one dict per department), keeping both indexes consistent on insert, update and delete.
+#
+# 'EmployeeTable' is a memory-compact alternative to a list of Employee objects. It keeps one array per field
+# (struct of arrays): ids as integers, departments as small integer codes, and all names packed into one byte
+# pool. Rows are handed out as read-only EmployeeRecord views with the same attributes and display_info() as
+# Employee objects. The views are not Employee subclasses, so they can use __slots__ and carry no __dict__.
+#
+# Valid departments live in a 'DepartmentRegistry' (a set, so checks are O(1)) that can be changed at run
+# time. It can also validate a whole column of departments at once, and the constructors accept strict=True
+# to reject employees whose department is not registered.
+#
+# 'EmployeeSnapshot' saves a collection of employees in a compact binary file (versioned header, fixed-width
+# records, a string pool and a sorted id index). Reopening it maps the file with mmap, so startup does no
+# parsing at all and each record is only decoded when it is accessed.
+#
+# 'EmployeeReportWriter' renders many employees (display_info text, CSV or JSON Lines) into one reusable
+# in-memory buffer and writes it to the output file in large blocks instead of one write per line.
+
+import csv
+import io
+import json
+import mmap
+import struct
+from array import array
+from collections import Counter
+
+class DepartmentRegistry:
+    def __init__(self, departments=()):
+        # The registered departments, kept in a set for constant-time membership checks.
+        self._departments = set(departments)
+
+    def add(self, department):
+        self._departments.add(department)
+
+    def remove(self, department):
+        self._departments.discard(department)
+
+    def __contains__(self, department):
+        return department in self._departments
+
+    def __iter__(self):
+        return iter(sorted(self._departments))
+
+    def validate_batch(self, departments):
+        # Validate a whole column of departments. Each distinct value is looked up only once;
+        # returns (validity mask in input order, {department: number of occurrences}).
+        departments = list(departments)
+        counts = Counter(departments)
+        valid = {department: department in self._departments for department in counts}
+        return list(map(valid.__getitem__, departments)), dict(counts)
+
 
 class Employee:
+    # Registry used by is_valid_department and by strict construction; change it at run time
+    # with Employee.departments.add(...) / remove(...).
+    departments = DepartmentRegistry(['HR', 'IT', 'Marketing', 'Finance'])
+
     def __init__(self, emp_id, name, department):
         # Primary constructor that initializes an Employee's attributes.
         self.emp_id = emp_id          
@@ -93,55 +429,596 @@ class Employee:
         self.department = department  
 
     @classmethod
-    def from_string(cls, emp_str):
+    def from_string(cls, emp_str, strict=False):
         # Alternative constructor that expects a string formatted as "emp_id-name-department".
-        emp_id, name, department = emp_str.split('-')
+        # The id is everything before the first '-' and the department everything after the last,
+        # so hyphenated names such as "002-Mary-Jane-HR" are kept whole.
+        emp_id, _, rest = emp_str.partition('-')
+        name, _, department = rest.rpartition('-')
+        if not emp_id or not name or not department:
+            raise ValueError(f"Expected 'emp_id-name-department', got {emp_str!r}")
+        if strict:
+            cls._check_department(department)
         return cls(emp_id, name, department)
 
     @classmethod
-    def from_dict(cls, emp_dict):
+    def from_dict(cls, emp_dict, strict=False):
         # Alternative constructor that expects a dictionary with keys: 'emp_id', 'name', 'department'.
+        if strict:
+            cls._check_department(emp_dict['department'])
         return cls(emp_dict['emp_id'], emp_dict['name'], emp_dict['department'])
 
+    @classmethod
+    def _check_department(cls, department):
+        # Strict mode: refuse departments that are not in the registry.
+        if department not in cls.departments:
+            raise ValueError(f"Unknown department {department!r}")
+
+    # Roughly how many bytes of input the streaming constructors read per chunk.
+    READ_CHUNK_SIZE = 1 << 20
+
+    @staticmethod
+    def _read_chunks(fileobj):
+        # Yield lists of lines, about READ_CHUNK_SIZE bytes at a time, so a file of any size is
+        # read in a few large reads without ever holding all of it in memory.
+        return iter(lambda: fileobj.readlines(Employee.READ_CHUNK_SIZE), [])
+
+    @classmethod
+    def iter_from_lines(cls, fileobj, rejects=None, strict=False):
+        # Streaming version of from_string: yields one Employee per "emp_id-name-department" line.
+        # Malformed lines are appended to 'rejects' (if given) as (line number, line, reason).
+        # With strict=True, rows with an unregistered department are rejected as well.
+        departments = cls.departments
+        line_number = 0
+        for lines in cls._read_chunks(fileobj):
+            for line in lines:
+                line_number += 1
+                line = line.strip()
+                if not line:
+                    continue
+                # Same parsing as from_string, inlined to avoid a method call per row.
+                emp_id, _, rest = line.partition('-')
+                name, _, department = rest.rpartition('-')
+                if not (emp_id and name and department):
+                    reason = "expected 'emp_id-name-department'"
+                elif strict and department not in departments:
+                    reason = f"unknown department {department!r}"
+                else:
+                    yield cls(emp_id, name, department)
+                    continue
+                if rejects is not None:
+                    rejects.append((line_number, line, reason))
+
+    @classmethod
+    def iter_from_csv(cls, fileobj, rejects=None, strict=False):
+        # Streaming constructor for CSV files whose header names the emp_id, name and department columns.
+        reader = csv.reader(line for lines in cls._read_chunks(fileobj) for line in lines)
+        header = next(reader, None)
+        if header is None:
+            return
+        try:
+            columns = [header.index(key) for key in ('emp_id', 'name', 'department')]
+        except ValueError:
+            raise ValueError("CSV header must contain emp_id, name and department") from None
+        for row in reader:
+            if not row:
+                continue
+            try:
+                emp_id, name, department = (row[column] for column in columns)
+            except IndexError:
+                reason = "missing columns"
+            else:
+                if not strict or department in cls.departments:
+                    yield cls(emp_id, name, department)
+                    continue
+                reason = f"unknown department {department!r}"
+            if rejects is not None:
+                rejects.append((reader.line_num, ','.join(row), reason))
+
+    @classmethod
+    def iter_from_jsonl(cls, fileobj, rejects=None, strict=False):
+        # Streaming version of from_dict for JSON Lines files (one JSON object per line).
+        line_number = 0
+        for lines in cls._read_chunks(fileobj):
+            for line in lines:
+                line_number += 1
+                if not line.strip():
+                    continue
+                # Only the parsing is guarded: errors raised by the consumer while the generator
+                # is suspended at 'yield' must not be recorded as rejected rows.
+                try:
+                    employee = cls.from_dict(json.loads(line), strict)
+                except (ValueError, KeyError, TypeError) as error:
+                    if rejects is not None:
+                        rejects.append((line_number, line.strip(), f"{type(error).__name__}: {error}"))
+                    continue
+                yield employee
+
     @staticmethod
     def is_valid_department(department):
         # Static method to validate if the given department is one of the allowed ones.
-        valid_departments = ['HR', 'IT', 'Marketing', 'Finance']
-        return department in valid_departments
+        return department in Employee.departments
 
     def display_info(self):
         # Instance method to return a formatted string containing employee information.
         return f"Employee ID: {self.emp_id}, Name: {self.name}, Department: {self.department}"
 
 
-print("Q2: Build a class Employee with multiple constructors")
-print("___________________________________________________________________")
-
-# Using the primary constructor:
-print("\nUsing __init__:")
-emp1 = Employee("001", "Alice", "IT")  # Initializing using __init__
-print(emp1.display_info())
-print("METHOD: initialized using __init__ | Employee('001', 'Alice', 'IT')")
-
-# Using the alternative constructor from a string:
-print("\nUsing from_string:")
-emp1 = Employee.from_string("001-Alice-IT")  # Reassigning emp1 using from_string
-print(emp1.display_info())
-print("METHOD: initialized using from_string() | Employee.from_string('001-Alice-IT')")
-
-# Using the alternative constructor from a dictionary:
-print("\nUsing from_dict:")
-emp1 = Employee.from_dict({'emp_id': "001", 'name': "Alice", 'department': "IT"})  # Reassigning emp1 using from_dict
-print(emp1.display_info())
-print("METHOD: initialized using from_dict() | Employee.from_dict({'emp_id': '001', 'name': 'Alice', 'department': 'IT'})")
-
-# Demonstrate the use of the static method is_valid_department:
-print("\nUsing is_valid_department:")
-dept_to_check = "IT"
-is_valid = Employee.is_valid_department(dept_to_check)
-print(f"Department '{dept_to_check}' is valid: {is_valid}")
+class EmployeeRecord:
+    # A read-only view onto one row of an EmployeeTable; fields are read on access. It does not
+    # inherit from Employee (whose instances have a __dict__), so __slots__ keeps it to two fields.
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    @property
+    def emp_id(self):
+        return self._table._emp_id(self._row)
+
+    @property
+    def name(self):
+        return self._table._name(self._row)
+
+    @property
+    def department(self):
+        return self._table._departments[self._table._department_codes[self._row]]
+
+    # Same formatting as an Employee.
+    display_info = Employee.display_info
+
+
+class EmployeeTable:
+    def __init__(self, employees=()):
+        # emp_id "000042" is stored as the integer 42 plus its width (6) so leading zeros survive.
+        self._ids = array('q')
+        self._id_widths = array('B')
+        # Each department string is stored once; rows keep a small code into _departments.
+        self._departments = []
+        self._department_codes_by_name = {}
+        self._department_codes = array('H')
+        # All names are UTF-8 encoded into one pool; row i spans _name_offsets[i]:_name_offsets[i + 1].
+        self._name_pool = bytearray()
+        self._name_offsets = array('Q', [0])
+        self.extend(employees)
+
+    def append(self, employee):
+        # Every field is checked and encoded before any column changes, so a bad row leaves
+        # the columns untouched (and all the same length).
+        emp_id = employee.emp_id
+        if not isinstance(emp_id, str) or not emp_id.isdigit():
+            raise ValueError(f"EmployeeTable needs numeric emp_id strings, got {emp_id!r}")
+        if len(emp_id) > 255:
+            raise ValueError("EmployeeTable emp_id strings can be at most 255 digits long")
+        value = int(emp_id)
+        if value >= 1 << 63:
+            raise ValueError(f"EmployeeTable emp_id {emp_id!r} is too large")
+        name = employee.name.encode()
+        department = employee.department
+        code = self._department_codes_by_name.get(department)
+        if code is None:
+            if len(self._departments) > 0xFFFF:
+                raise ValueError("EmployeeTable can hold at most 65536 departments")
+            code = len(self._departments)
+        self._ids.append(value)
+        self._id_widths.append(len(emp_id))
+        if code == len(self._departments):
+            self._department_codes_by_name[department] = code
+            self._departments.append(department)
+        self._department_codes.append(code)
+        self._name_pool += name
+        self._name_offsets.append(len(self._name_pool))
+
+    def extend(self, employees):
+        for employee in employees:
+            self.append(employee)
+
+    def _emp_id(self, row):
+        return str(self._ids[row]).zfill(self._id_widths[row])
+
+    def _name(self, row):
+        return self._name_pool[self._name_offsets[row]:self._name_offsets[row + 1]].decode()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, row):
+        # Return a lightweight view of one row (negative indexes count from the end).
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("EmployeeTable index out of range")
+        return EmployeeRecord(self, row)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield EmployeeRecord(self, row)
+
+    def nbytes(self):
+        # Bytes used by the column storage (the department list is a handful of shared strings).
+        columns = (self._ids, self._id_widths, self._department_codes, self._name_offsets)
+        return sum(column.itemsize * len(column) for column in columns) + len(self._name_pool)
+
+
+class EmployeeSnapshot:
+    # File layout (all integers little-endian):
+    #   header      magic, format version, record count, department count and section offsets
+    #   records     one fixed-width entry per employee: (id offset, id length, name offset,
+    #               name length, department code); offsets point into the string pool
+    #   departments (offset, length) of each department name in the string pool
+    #   pool        UTF-8 bytes of every id, name and department
+    #   index       record numbers sorted by emp_id, for binary-search lookups
+    MAGIC = b'EMPS'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHxxQQQQQQ')
+    # Record and department entry layouts for every format version this class can read.
+    RECORD_FORMATS = {1: struct.Struct('<QIQIH')}
+    DEPARTMENT_FORMATS = {1: struct.Struct('<QI')}
+    INDEX_ENTRY = struct.Struct('<Q')
 
-print("\n==================================================================\n")
+    @classmethod
+    def write(cls, path, employees):
+        # Write 'employees' (any iterable) in a single pass: records stream straight to the file
+        # while the string pool and id index are collected; the header is filled in at the end.
+        record = cls.RECORD_FORMATS[cls.VERSION]
+        department_entry = cls.DEPARTMENT_FORMATS[cls.VERSION]
+        pool = bytearray()
+        department_codes = {}
+        ids = []
+        with open(path, 'wb') as out:
+            out.write(bytes(cls.HEADER.size))
+            for employee in employees:
+                emp_id = employee.emp_id.encode()
+                name = employee.name.encode()
+                code = department_codes.setdefault(employee.department, len(department_codes))
+                out.write(record.pack(len(pool), len(emp_id), len(pool) + len(emp_id), len(name), code))
+                pool += emp_id
+                pool += name
+                ids.append(emp_id)
+            departments_offset = out.tell()
+            for department in department_codes:
+                encoded = department.encode()
+                out.write(department_entry.pack(len(pool), len(encoded)))
+                pool += encoded
+            pool_offset = out.tell()
+            out.write(pool)
+            index_offset = out.tell()
+            for number in sorted(range(len(ids)), key=ids.__getitem__):
+                out.write(cls.INDEX_ENTRY.pack(number))
+            out.seek(0)
+            out.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(ids), len(department_codes),
+                                      cls.HEADER.size, departments_offset, pool_offset, index_offset))
+        return len(ids)
+
+    def __init__(self, path):
+        # Open a snapshot. Only the header and the (tiny) department table are read here.
+        # Any problem with the file raises ValueError, with the file already closed again.
+        self._file = open(path, 'rb')
+        self._map = None
+        try:
+            self._open(path)
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self, path):
+        size = self._file.seek(0, 2)
+        if size < self.HEADER.size:
+            raise ValueError(f"{path!r} is not an employee snapshot (only {size} bytes)")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self._count, department_count, self._records_offset,
+         departments_offset, self._pool_offset, self._index_offset) = self.HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC:
+            raise ValueError(f"{path!r} is not an employee snapshot")
+        if version not in self.RECORD_FORMATS:
+            raise ValueError(f"Unsupported employee snapshot version {version}")
+        if self._index_offset + self._count * self.INDEX_ENTRY.size > size:
+            raise ValueError(f"{path!r} is truncated")
+        self.version = version
+        self._record = self.RECORD_FORMATS[version]
+        department_entry = self.DEPARTMENT_FORMATS[version]
+        self._departments = [
+            self._string(*department_entry.unpack_from(self._map, departments_offset + i * department_entry.size))
+            for i in range(department_count)
+        ]
+
+    def _string(self, offset, length):
+        start = self._pool_offset + offset
+        return self._map[start:start + length].decode()
+
+    def _unpack(self, number):
+        return self._record.unpack_from(self._map, self._records_offset + number * self._record.size)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, number):
+        # Decode record 'number' into an Employee (only this record is read).
+        if number < 0:
+            number += self._count
+        if not 0 <= number < self._count:
+            raise IndexError("EmployeeSnapshot index out of range")
+        id_offset, id_length, name_offset, name_length, code = self._unpack(number)
+        return Employee(self._string(id_offset, id_length), self._string(name_offset, name_length),
+                        self._departments[code])
+
+    def __iter__(self):
+        for number in range(self._count):
+            yield self[number]
+
+    def find(self, emp_id):
+        # Binary search of the id index; returns the Employee or None. Only about
+        # log2(len) ids are decoded along the way.
+        target = emp_id.encode()
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            number = self.INDEX_ENTRY.unpack_from(self._map, self._index_offset + middle * self.INDEX_ENTRY.size)[0]
+            id_offset, id_length = self._unpack(number)[:2]
+            start = self._pool_offset + id_offset
+            candidate = self._map[start:start + id_length]
+            if candidate < target:
+                low = middle + 1
+            elif candidate > target:
+                high = middle
+            else:
+                return self[number]
+        return None
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class EmployeeReportWriter:
+    FORMATS = ('text', 'csv', 'json')
+
+    def __init__(self, fileobj, format='text', buffer_size=1 << 20):
+        # 'fileobj' is any text file object; output is collected in a StringIO buffer and
+        # handed to fileobj.write() whenever roughly 'buffer_size' characters are waiting.
+        if format not in self.FORMATS:
+            raise ValueError(f"format must be one of {', '.join(self.FORMATS)}")
+        self.fileobj = fileobj
+        self.format = format
+        self.buffer_size = buffer_size
+        self._buffer = io.StringIO()
+        self._csv = csv.writer(self._buffer, lineterminator='\n')
+        if format == 'csv':
+            self._csv.writerow(('emp_id', 'name', 'department'))
+
+    def write(self, employees):
+        # Render any iterable of employees (streamed, never collected into a list).
+        # Returns how many employees were written.
+        buffer = self._buffer
+        write = buffer.write
+        count = 0
+        for employee in employees:
+            if self.format == 'text':
+                # One display_info() line per employee (subclasses' overrides are respected).
+                write(employee.display_info())
+                write('\n')
+            elif self.format == 'csv':
+                self._csv.writerow((employee.emp_id, employee.name, employee.department))
+            else:
+                write(json.dumps({'emp_id': employee.emp_id, 'name': employee.name,
+                                  'department': employee.department}))
+                write('\n')
+            count += 1
+            if buffer.tell() >= self.buffer_size:
+                self.flush()
+        return count
+
+    def flush(self):
+        # Hand everything buffered so far to the file in one write, then reuse the buffer.
+        if self._buffer.tell():
+            self.fileobj.write(self._buffer.getvalue())
+            self._buffer.seek(0)
+            self._buffer.truncate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+
+class EmployeeDirectory:
+    def __init__(self, employees=()):
+        # Primary index: emp_id -> Employee.
+        # Secondary index: department -> {emp_id: Employee}, so a department's members can be
+        # listed or counted without looking at anyone else.
+        self._by_id = {}
+        self._by_department = {}
+        self.bulk_load(employees)
+
+    def bulk_load(self, employees):
+        # Add many employees at once (any iterable, including the streaming constructors).
+        by_id = self._by_id
+        by_department = self._by_department
+        for employee in employees:
+            if employee.emp_id in by_id:
+                raise ValueError(f"Duplicate emp_id {employee.emp_id!r}")
+            by_id[employee.emp_id] = employee
+            members = by_department.get(employee.department)
+            if members is None:
+                members = by_department[employee.department] = {}
+            members[employee.emp_id] = employee
+
+    def add(self, employee):
+        self.bulk_load((employee,))
+
+    def remove(self, emp_id):
+        # Delete an employee from both indexes and return it (KeyError if unknown).
+        employee = self._by_id.pop(emp_id)
+        members = self._by_department[employee.department]
+        del members[emp_id]
+        if not members:
+            del self._by_department[employee.department]
+        return employee
+
+    def update(self, emp_id, **changes):
+        # Change an employee's emp_id, name and/or department and re-index them. Changes should go
+        # through here rather than straight to the Employee so the indexes stay correct.
+        unknown = set(changes) - {'emp_id', 'name', 'department'}
+        if unknown:
+            raise TypeError(f"Unknown Employee fields: {', '.join(sorted(unknown))}")
+        new_id = changes.get('emp_id', emp_id)
+        if new_id != emp_id and new_id in self._by_id:
+            raise ValueError(f"Duplicate emp_id {new_id!r}")
+        employee = self.remove(emp_id)
+        for field, value in changes.items():
+            setattr(employee, field, value)
+        self.add(employee)
+        return employee
+
+    def get(self, emp_id, default=None):
+        return self._by_id.get(emp_id, default)
+
+    def __getitem__(self, emp_id):
+        return self._by_id[emp_id]
+
+    def __contains__(self, emp_id):
+        return emp_id in self._by_id
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def in_department(self, department):
+        # Iterate over the employees of one department only.
+        return iter(self._by_department.get(department, {}).values())
+
+    def count(self, department=None):
+        # Number of employees overall, or in one department.
+        if department is None:
+            return len(self._by_id)
+        return len(self._by_department.get(department, ()))
+
+    def departments(self):
+        # {department: number of employees} for every department in the directory.
+        return {department: len(members) for department, members in self._by_department.items()}
+
+# --- Q2 OUTPUT ---
+def demo_q2():
+    # Runs the Q2 demonstration. It is only called when this file is executed
+    # directly, so importing the file defines the classes without printing anything.
+    print("Q2: Build a class Employee with multiple constructors")
+    print("___________________________________________________________________")
+
+    # Using the primary constructor:
+    print("\nUsing __init__:")
+    emp1 = Employee("001", "Alice", "IT")  # Initializing using __init__
+    print(emp1.display_info())
+    print("METHOD: initialized using __init__ | Employee('001', 'Alice', 'IT')")
+
+    # Using the alternative constructor from a string:
+    print("\nUsing from_string:")
+    emp1 = Employee.from_string("001-Alice-IT")  # Reassigning emp1 using from_string
+    print(emp1.display_info())
+    print("METHOD: initialized using from_string() | Employee.from_string('001-Alice-IT')")
+
+    # Using the alternative constructor from a dictionary:
+    print("\nUsing from_dict:")
+    emp1 = Employee.from_dict({'emp_id': "001", 'name': "Alice", 'department': "IT"})  # Reassigning emp1 using from_dict
+    print(emp1.display_info())
+    print("METHOD: initialized using from_dict() | Employee.from_dict({'emp_id': '001', 'name': 'Alice', 'department': 'IT'})")
+
+    # Demonstrate the use of the static method is_valid_department:
+    print("\nUsing is_valid_department:")
+    dept_to_check = "IT"
+    is_valid = Employee.is_valid_department(dept_to_check)
+    print(f"Department '{dept_to_check}' is valid: {is_valid}")
+
+    # Validate a whole column of departments at once, and register a new department at run time.
+    print("\nUsing the department registry:")
+    column = ["IT", "HR", "Legal", "IT", "Sales", "Finance"]
+    mask, counts = Employee.departments.validate_batch(column)
+    print(f"Validity mask: {mask}")
+    print(f"Counts: {counts}")
+    Employee.departments.add("Legal")
+    print(f"After registering Legal: {Employee.departments.validate_batch(column)[0]}")
+    try:
+        Employee.from_string("009-Frank-Sales", strict=True)
+    except ValueError as error:
+        print("ERROR:", error)
+    Employee.departments.remove("Legal")
+
+    # Stream employees from text, CSV and JSON Lines sources, collecting bad rows instead of stopping.
+    print("\nUsing the streaming constructors:")
+    rejects = []
+    text_rows = io.StringIO("002-Mary-Jane-HR\n003-Bob-Finance\nnot a valid row\n004-Carol-IT\n")
+    print([emp.name for emp in Employee.iter_from_lines(text_rows, rejects)])
+    csv_rows = io.StringIO("emp_id,name,department\n005,Dan,Marketing\n006\n")
+    print([emp.name for emp in Employee.iter_from_csv(csv_rows, rejects)])
+    jsonl_rows = io.StringIO('{"emp_id": "007", "name": "Eve", "department": "IT"}\n{"emp_id": "008"}\n')
+    print([emp.name for emp in Employee.iter_from_jsonl(jsonl_rows, rejects)])
+    print("Rejected rows:")
+    for line_number, line, reason in rejects:
+        print(f"  line {line_number}: {line!r} ({reason})")
+
+    # A small fixed roster for the containers below. Throughput and memory at scale are
+    # measured by the benchmark suite instead (python -m oop_questions bench).
+    rows = "".join(f"{i:06d}-Employee {i}-{('HR', 'IT', 'Marketing', 'Finance')[i % 4]}\n" for i in range(1, 13))
+
+    # Keep employees in a directory indexed by id and by department.
+    print("\nUsing EmployeeDirectory:")
+    directory = EmployeeDirectory(Employee.iter_from_lines(io.StringIO(rows)))
+    print(f"Loaded {len(directory):,} employees: {directory.departments()}")
+    print(directory["000006"].display_info())
+    directory.update("000006", department="HR", name="Employee Six")
+    print(directory["000006"].display_info())
+    directory.remove("000006")
+    print(f"After removing 000006: {directory.count('HR'):,} in HR, '000006' in directory: {'000006' in directory}")
+    print("First in Finance:", next(directory.in_department("Finance")).display_info())
+
+    # Store the same employees column by column.
+    print("\nUsing EmployeeTable:")
+    table = EmployeeTable(Employee.iter_from_lines(io.StringIO(rows)))
+    print(table[5].display_info())
+    print(f"Is a table row an Employee? {isinstance(table[5], Employee)}")
+    print(f"{len(table)} records in {table.nbytes()} bytes of columns")
+
+    # Strict mode on the streaming constructor rejects unregistered departments.
+    rejects = []
+    strict_rows = io.StringIO("010-Gina-IT\n011-Hank-Sales\n")
+    print([emp.name for emp in Employee.iter_from_lines(strict_rows, rejects, strict=True)], rejects)
+
+    # Save the employees to a binary snapshot and reopen it without parsing any text.
+    print("\nUsing EmployeeSnapshot:")
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as folder:
+        snapshot_path = os.path.join(folder, "employees.snapshot")
+        written = EmployeeSnapshot.write(snapshot_path, Employee.iter_from_lines(io.StringIO(rows)))
+        with EmployeeSnapshot(snapshot_path) as snapshot:
+            print(f"Wrote {written} employees in {os.path.getsize(snapshot_path)} bytes")
+            print(snapshot[5].display_info())
+            print(snapshot.find("000012").display_info())
+            print(f"Lookup of a missing id: {snapshot.find('999999')}")
+
+    # Render reports through one large buffer instead of one print() per employee.
+    print("\nUsing EmployeeReportWriter:")
+    sample = [Employee("001", "Alice", "IT"), Employee("002", "Smith, Mary-Jane", "HR")]
+    for report_format in EmployeeReportWriter.FORMATS:
+        output = io.StringIO()
+        with EmployeeReportWriter(output, report_format) as writer:
+            writer.write(sample)
+        print(f"{report_format}:\n{output.getvalue()}", end="")
+
+if __name__ == "__main__":
+    demo_q2()
+    print("\n==================================================================\n")
 
 ##############################################
 # Q3: Build two classes SchoolOne and SchoolTwo that display students' average grades and GPA.
@@ -152,17 +1029,139 @@ print("\n==================================================================\n")
 #   - Encapsulation: The student grades are stored in a protected attribute (_students).
 #   - Aggregation: Each school contains a list of student grades.
 #   - Nested Class: 'GradeCalculator' is a nested helper class providing static methods to calculate average and GPA.
+#   - Nested Class: 'RunningStats' keeps running totals (count, sum, sum of squares, min, max) that are
+#     updated as grades are added or removed, so the statistics never need to walk the whole roster again.
+#   - Nested Class: 'GradeIndex' counts how many students have each grade from 0 to 100 in a Fenwick tree,
+#     which answers median, percentile, rank and top-N questions without sorting the roster.
+#     Rosters with other grades (fractional, above 100, ...) use 'SortedGrades', a sorted list with the
+#     same interface, instead.
+#   - Multiple grading systems: calculate_gpas() converts one roster under many GPA scales or
+#     conversion tables at once, reusing a cached average that is refreshed only when grades change.
+#
+# Rosters too large for memory can be kept on disk in a 'GradeFile' (one byte per grade) that is read through
+# mmap in fixed-size chunks. School.from_grade_file() builds a school on top of one.
+# 'SchoolBatchRunner' spreads many such roster files over a process pool: workers sum slices of the files
+# and the parent merges those partial sums into each school's average and GPA.
+#
+# A 'District' aggregates many schools. It keeps one NumPy column each of per-school sums, counts and
+# GPA scales, taken from the schools' running totals, so averages and GPAs for all schools come out of a
+# single vectorized pass without copying any grades (rosters backed by a GradeFile stay on disk).
 #
 # This design ensures that every subclass of School implements its own methods for calculating
 # the average and GPA while reusing the common display logic provided in display_stats().
 
 from abc import ABC, abstractmethod  # Import abstract class support
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from numbers import Integral
 
 class School(ABC):
     def __init__(self, name, students):
         # 'name' is public; 'students' (a list of grades) is protected.
         self.name = name            
         self._students = students   
+        # Running totals and the grade index are kept in step with _students
+        # by add_grade() and remove_grade(). Both are built from one count of each distinct grade.
+        counts = School._count_grades(students)
+        self._stats = School.RunningStats.from_counts(counts, students)
+        self._grade_index = School.GradeIndex.build(counts, students)
+        # Bumped on every change so aggregates (such as District) can tell what is stale.
+        self._version = 0
+        # (version, average) pair; the average is recomputed only when the version moves on.
+        self._average_cache = (None, None)
+
+    @staticmethod
+    def _count_grades(students):
+        # How many students have each grade, counted at C speed (a GradeFile chunk by chunk).
+        counts = Counter()
+        if isinstance(students, GradeFile):
+            for chunk in students.chunks():
+                counts.update(chunk)
+        else:
+            counts.update(students)
+        return counts
+
+    @classmethod
+    def from_grade_file(cls, name, path):
+        # Alternative constructor that uses a memory-mapped GradeFile as the (read-only) roster,
+        # so the grades are streamed from disk in chunks instead of being loaded as a list.
+        # Close the school (or use it in a 'with' block) to release the file.
+        return cls(name, GradeFile(path))
+
+    def close(self):
+        # Release the roster's file if it is a GradeFile; nothing to do for a list.
+        if isinstance(self._students, GradeFile):
+            self._students.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        # Number of students, read from the running totals (so a GradeFile roster is not scanned).
+        return self._stats.count
+
+    def _check_writable(self):
+        if isinstance(self._students, GradeFile):
+            raise TypeError(f"{self.name} has a read-only roster (GradeFile); grades cannot be added or removed")
+
+    def add_grade(self, grade):
+        # Add a student's grade and update the running totals in O(1). The roster is changed
+        # first, so the totals and the index stay in step if that fails.
+        self._check_writable()
+        self._students.append(grade)
+        if not self._grade_index.fits(grade):
+            # First grade outside the 0-100 whole-number range: switch to the sorted fallback.
+            self._grade_index = School.SortedGrades(self._students[:-1])
+        self._grade_index.add(grade)
+        self._stats.add(grade)
+        self._version += 1
+
+    def remove_grade(self, grade):
+        # Remove one occurrence of a grade (ValueError if missing) and update the running totals.
+        # The index is updated first, since it is the step that can fail; nothing else has
+        # changed at that point.
+        self._check_writable()
+        index = self._grade_index
+        if not index.fits(grade):
+            # Such as 85.0 for a stored 85: equal for the list, but not a GradeIndex key.
+            index = School.SortedGrades(self._students)
+        index.remove(grade)
+        self._grade_index = index
+        self._students.remove(grade)
+        self._stats.remove(grade, self._students)
+        self._version += 1
+
+    def cached_average(self):
+        # The result of calculate_average(), reused until the grades change.
+        if self._average_cache[0] != self._version:
+            self._average_cache = (self._version, self.calculate_average())
+        return self._average_cache[1]
+
+    def calculate_gpas(self, scales):
+        # GPAs for many grading systems at once. Each entry of 'scales' is either a divisor
+        # (like gpa_scale) or a conversion table {minimum grade: points}. The per-grade counts
+        # come from the grade index, so the roster itself is not traversed at all.
+        return self.GradeCalculator.convert_all(self.cached_average(), self._stats.count,
+                                                self._grade_index.frequencies(), scales)
+
+    def median(self):
+        # Middle grade of the roster (mean of the two middle grades for an even count).
+        return self._grade_index.percentile(50)
+
+    def percentile(self, p):
+        # Grade below which p percent of the roster falls.
+        return self._grade_index.percentile(p)
+
+    def percentile_rank(self, grade):
+        # Percentage of the roster scoring below 'grade' (ties count as half).
+        return self._grade_index.percentile_rank(grade)
+
+    def top_grades(self, n):
+        # The n highest grades, best first.
+        return self._grade_index.top(n)
 
     @abstractmethod
     def calculate_average(self):
@@ -183,12 +1182,295 @@ class School(ABC):
         @staticmethod
         def gpa(grades, scale):
             avg = School.GradeCalculator.average(grades)
+            return School.GradeCalculator.gpa_from_average(avg, scale)
+
+        @staticmethod
+        def gpa_from_average(avg, scale):
             # Convert the average grade to a GPA using a provided scale divisor.
             return round(avg / scale, 2)
 
+        @staticmethod
+        def multi_gpa(grades, scales):
+            # GPAs for many scales from a single pass over 'grades': the pass collects the total
+            # and how often each grade occurs, and every scale is converted from those numbers.
+            total = count = 0
+            frequencies = {}
+            for grade in grades:
+                total += grade
+                count += 1
+                frequencies[grade] = frequencies.get(grade, 0) + 1
+            avg = total / count if count else 0
+            return School.GradeCalculator.convert_all(avg, count, frequencies.items(), scales)
+
+        @staticmethod
+        def convert_all(avg, count, frequencies, scales):
+            # Convert one roster, summarised by its average, size and (grade, times) pairs, under
+            # every scale. A number is a divisor like gpa_scale; a dict is a conversion table
+            # {minimum grade: points} where each student earns the points of the highest
+            # threshold they reach (0 below every threshold) and the GPA is the mean.
+            frequencies = list(frequencies)
+            results = []
+            for scale in scales:
+                if isinstance(scale, dict):
+                    thresholds = sorted(scale)
+                    points = 0
+                    for grade, times in frequencies:
+                        position = bisect_right(thresholds, grade)
+                        if position:
+                            points += times * scale[thresholds[position - 1]]
+                    results.append(round(points / count, 2) if count else 0)
+                else:
+                    results.append(School.GradeCalculator.gpa_from_average(avg, scale))
+            return results
+
+    # Nested class that keeps running statistics for a list of grades.
+    class RunningStats:
+        __slots__ = ('count', 'total', 'total_squares', '_minimum', '_maximum', '_grades')
+
+        def __init__(self, grades=()):
+            self.count = 0
+            self.total = 0
+            self.total_squares = 0
+            self._minimum = None
+            self._maximum = None
+            self._grades = None  # Roster to rescan if a removal invalidates min or max.
+            for grade in grades:
+                self.add(grade)
+
+        @classmethod
+        def from_counts(cls, counts, grades):
+            # Build the totals from a Counter of grades in O(distinct grades). Non-integer totals
+            # are summed over 'grades' in roster order, so they match sum(grades) exactly.
+            stats = cls()
+            stats.count = sum(counts.values())
+            if all(isinstance(grade, Integral) for grade in counts):
+                stats.total = sum(grade * times for grade, times in counts.items())
+            else:
+                stats.total = sum(grades)
+            stats.total_squares = sum(grade * grade * times for grade, times in counts.items())
+            if counts:
+                stats._minimum = min(counts)
+                stats._maximum = max(counts)
+            return stats
+
+        def add(self, grade):
+            # Fold one grade into the totals.
+            self.count += 1
+            self.total += grade
+            self.total_squares += grade * grade
+            if self._grades is None:
+                if self._minimum is None or grade < self._minimum:
+                    self._minimum = grade
+                if self._maximum is None or grade > self._maximum:
+                    self._maximum = grade
+
+        def remove(self, grade, remaining_grades):
+            # Take one grade back out of the totals. If it was the current minimum or maximum,
+            # those are recomputed from 'remaining_grades' the next time they are read.
+            self.count -= 1
+            self.total -= grade
+            self.total_squares -= grade * grade
+            if grade == self._minimum or grade == self._maximum:
+                self._grades = remaining_grades
+
+        def _refresh_extremes(self):
+            if self._grades is not None:
+                self._minimum = min(self._grades, default=None)
+                self._maximum = max(self._grades, default=None)
+                self._grades = None
+
+        @property
+        def minimum(self):
+            self._refresh_extremes()
+            return self._minimum
+
+        @property
+        def maximum(self):
+            self._refresh_extremes()
+            return self._maximum
+
+        def average(self):
+            # Same result as GradeCalculator.average, without walking the grades.
+            return self.total / self.count if self.count else 0
+
+        def variance(self):
+            # Population variance from the sum and sum of squares.
+            if not self.count:
+                return 0
+            mean = self.total / self.count
+            return max(self.total_squares / self.count - mean * mean, 0)
+
+    # Nested class that indexes whole-number grades from 0 to 100 for order statistics.
+    # A Fenwick (binary indexed) tree over the 101 possible grades gives prefix counts
+    # and "k-th smallest grade" lookups in O(log 101) steps.
+    class GradeIndex:
+        MAX_GRADE = 100
+
+        def __init__(self, grades=()):
+            self._counts = [0] * (self.MAX_GRADE + 1)
+            self._tree = [0] * (self.MAX_GRADE + 2)  # 1-based Fenwick tree
+            self.count = 0
+            for grade in grades:
+                self.add(grade)
+
+        @classmethod
+        def build(cls, counts, grades):
+            # Index 'grades' (counted in the Counter 'counts') in a GradeIndex, or in a SortedGrades
+            # if any of them does not fit. The tree is built bottom-up in O(MAX_GRADE).
+            index = cls()
+            if not all(map(index.fits, counts)):
+                return School.SortedGrades(grades)
+            for grade, times in counts.items():
+                index._counts[grade] += times
+            index.count = sum(index._counts)
+            tree = index._tree
+            for i in range(1, len(tree)):
+                tree[i] += index._counts[i - 1]
+                parent = i + (i & -i)
+                if parent < len(tree):
+                    tree[parent] += tree[i]
+            return index
+
+        def fits(self, grade):
+            # Whole numbers (including NumPy integers) from 0 to MAX_GRADE can be indexed.
+            return isinstance(grade, Integral) and 0 <= grade <= self.MAX_GRADE
+
+        def _check(self, grade):
+            if not self.fits(grade):
+                raise ValueError(f"Grade must be a whole number from 0 to {self.MAX_GRADE}, got {grade!r}")
+
+        def _update(self, grade, delta):
+            self._counts[grade] += delta
+            self.count += delta
+            i = grade + 1
+            while i < len(self._tree):
+                self._tree[i] += delta
+                i += i & -i
+
+        def add(self, grade):
+            self._check(grade)
+            self._update(int(grade), 1)
+
+        def remove(self, grade):
+            self._check(grade)
+            if not self._counts[grade]:
+                raise ValueError(f"Grade {grade} is not in the index")
+            self._update(int(grade), -1)
+
+        def count_equal(self, grade):
+            return self._counts[grade] if self.fits(grade) else 0
+
+        def frequencies(self):
+            # (grade, number of students) pairs in ascending grade order.
+            return [(grade, times) for grade, times in enumerate(self._counts) if times]
+
+        def count_below(self, grade):
+            # Number of grades strictly lower than 'grade'.
+            if grade <= 0:
+                return 0
+            if grade > self.MAX_GRADE:
+                return self.count
+            i = int(grade)
+            if i < grade:
+                i += 1  # A fractional grade such as 84.5 still counts 84 as below it.
+            total = 0
+            while i > 0:
+                total += self._tree[i]
+                i -= i & -i
+            return total
+
+        def kth(self, k):
+            # The k-th smallest grade (0-based), found by walking down the tree.
+            if not 0 <= k < self.count:
+                raise IndexError("Grade rank out of range")
+            position = 0
+            step = 1 << (len(self._tree) - 1).bit_length()
+            while step:
+                nxt = position + step
+                if nxt < len(self._tree) and self._tree[nxt] <= k:
+                    position = nxt
+                    k -= self._tree[nxt]
+                step >>= 1
+            return position
+
+        def percentile(self, p):
+            # Linear interpolation between the closest ranks (the same rule as statistics.median
+            # for p=50). Returns 0 for an empty index, like GradeCalculator.average.
+            if not 0 <= p <= 100:
+                raise ValueError("Percentile must be between 0 and 100")
+            if not self.count:
+                return 0
+            position = p / 100 * (self.count - 1)
+            lower = int(position)
+            low_grade = self.kth(lower)
+            if lower == position:
+                return low_grade
+            high_grade = self.kth(lower + 1)
+            return low_grade + (high_grade - low_grade) * (position - lower)
+
+        def percentile_rank(self, grade):
+            # Percentage of grades below 'grade', counting equal grades as half.
+            if not self.count:
+                return 0
+            return (self.count_below(grade) + self.count_equal(grade) / 2) / self.count * 100
+
+        def top(self, n):
+            # The n highest grades, best first, read from the per-grade counts.
+            result = []
+            for grade in range(self.MAX_GRADE, -1, -1):
+                if len(result) >= n:
+                    break
+                result.extend([grade] * min(self._counts[grade], n - len(result)))
+            return result
+
+    # Fallback for rosters with grades GradeIndex cannot hold (fractional grades, bonus points above
+    # 100, ...): the grades are kept in a sorted list, so updates cost O(n) instead of O(log 101).
+    # percentile() and percentile_rank() are inherited unchanged.
+    class SortedGrades(GradeIndex):
+        def __init__(self, grades=()):
+            self._sorted = sorted(grades)
+            self.count = len(self._sorted)
+
+        def fits(self, grade):
+            return True
+
+        def add(self, grade):
+            insort(self._sorted, grade)
+            self.count += 1
+
+        def remove(self, grade):
+            i = bisect_left(self._sorted, grade)
+            if i == len(self._sorted) or self._sorted[i] != grade:
+                raise ValueError(f"Grade {grade} is not in the index")
+            del self._sorted[i]
+            self.count -= 1
+
+        def count_below(self, grade):
+            return bisect_left(self._sorted, grade)
+
+        def count_equal(self, grade):
+            return bisect_right(self._sorted, grade) - bisect_left(self._sorted, grade)
+
+        def frequencies(self):
+            result = []
+            for grade in self._sorted:
+                if result and result[-1][0] == grade:
+                    result[-1] = (grade, result[-1][1] + 1)
+                else:
+                    result.append((grade, 1))
+            return result
+
+        def kth(self, k):
+            if not 0 <= k < self.count:
+                raise IndexError("Grade rank out of range")
+            return self._sorted[k]
+
+        def top(self, n):
+            return self._sorted[:-n - 1:-1] if n > 0 else []
+
     def display_stats(self):
         # Display statistics if student data is available.
-        if not self._students:
+        if not self._stats.count:
             print(f"{self.__class__.__name__} - {self.name}: No student data available.\n")
             return
 
@@ -198,8 +1480,8 @@ class School(ABC):
             print(f"  Student {idx}: {grade}")
 
         # Compute and show details of the average calculation.
-        total = sum(self._students)
-        count = len(self._students)
+        total = self._stats.total
+        count = self._stats.count
         avg = self.calculate_average()
         print("\n  -- Average Calculation Breakdown --")
         print(f"     Sum of grades = {total}")
@@ -218,34 +1500,339 @@ class SchoolOne(School):
     gpa_scale = 25  # Defines the divisor for converting average grade to GPA.
 
     def calculate_average(self):
-        # Uses the nested GradeCalculator to compute the average.
-        return self.GradeCalculator.average(self._students)
+        # Reads the average from the running totals instead of summing the roster again.
+        return self._stats.average()
 
     def calculate_gpa(self):
         # Uses the nested GradeCalculator with SchoolOne's GPA scale.
-        return self.GradeCalculator.gpa(self._students, self.gpa_scale)
+        return self.GradeCalculator.gpa_from_average(self.calculate_average(), self.gpa_scale)
 
 # SchoolTwo with a different GPA scale.
 class SchoolTwo(School):
     gpa_scale = 20  # This scale is different, simulating a different grading system.
 
     def calculate_average(self):
-        return self.GradeCalculator.average(self._students)
+        return self._stats.average()
 
     def calculate_gpa(self):
-        return self.GradeCalculator.gpa(self._students, self.gpa_scale)
+        return self.GradeCalculator.gpa_from_average(self.calculate_average(), self.gpa_scale)
+
+import mmap
+import weakref
+from array import array
+
+class GradeFile:
+    # Default number of grades handed out per chunk while streaming.
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        # Map a binary roster (one unsigned byte per grade) into memory. Pages are only read
+        # from disk when they are touched, so memory use stays bounded for any file size.
+        self.path = path
+        self.chunk_size = chunk_size
+        self._file = open(path, 'rb')
+        size = self._file.seek(0, 2)
+        # mmap cannot map an empty file, so an empty roster uses an empty buffer instead.
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._view = memoryview(self._map)
+        # Iterators still holding a chunk; close() finishes them first.
+        self._iterators = weakref.WeakSet()
 
-# --- Q3 OUTPUT ---
-print("Q3: Build a two class call SchoolOne and SchoolTwo that")
-print("    display there list of students average grades and GPA.")
-print("___________________________________________________________________")
-school_one = SchoolOne("Greenwood High", [88, 92, 79, 85, 91])
-school_two = SchoolTwo("Maple Leaf School", [75, 84, 90, 68, 82])
+    @classmethod
+    def create(cls, path, grades, chunk_size=CHUNK_SIZE):
+        # Write any iterable of grades (0-100) to 'path' in chunks and open the result.
+        # A byte could hold up to 255, so out-of-range grades are rejected here.
+        with open(path, 'wb') as out:
+            buffer = array('B')
+            for grade in grades:
+                if not 0 <= grade <= 100:
+                    raise ValueError(f"Grade must be between 0 and 100, got {grade}")
+                buffer.append(grade)
+                if len(buffer) >= chunk_size:
+                    buffer.tofile(out)
+                    buffer = array('B')
+            buffer.tofile(out)
+        return cls(path, chunk_size)
 
-school_one.display_stats()
-school_two.display_stats()
+    @classmethod
+    def from_text(cls, text_path, path, chunk_size=CHUNK_SIZE):
+        # Convert a text or CSV roster (grades separated by commas, spaces or newlines)
+        # into a GradeFile, reading the text one line at a time.
+        def grades():
+            with open(text_path) as roster:
+                for line in roster:
+                    for field in line.replace(',', ' ').split():
+                        yield int(field)
+        return cls.create(path, grades(), chunk_size)
+
+    def chunks(self, start=0, stop=None):
+        # Yield zero-copy memoryview slices of at most chunk_size grades,
+        # optionally limited to the grades between 'start' and 'stop'.
+        stop = len(self._view) if stop is None else min(stop, len(self._view))
+        for begin in range(start, stop, self.chunk_size):
+            yield self._view[begin:min(begin + self.chunk_size, stop)]
+
+    def __iter__(self):
+        iterator = self._iterate()
+        self._iterators.add(iterator)
+        return iterator
+
+    def _iterate(self):
+        # Each chunk is released as soon as it is used up, or when the iterator is closed early,
+        # so a half-consumed iterator does not keep close() from releasing the mapping.
+        for chunk in self.chunks():
+            try:
+                yield from chunk
+            finally:
+                chunk.release()
+
+    def __len__(self):
+        return len(self._view)
+
+    def __getitem__(self, index):
+        return self._view[index]
+
+    def close(self):
+        # Release the mapping and the file handle, after any half-consumed iterators.
+        for iterator in list(self._iterators):
+            iterator.close()
+        self._view.release()
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+import os
+import time
+
+def _sum_grade_range(task):
+    # Worker function (module level so it can be sent to another process): add up the grades
+    # in one slice of a grade file and report which process did the work and how long it took.
+    school_index, path, start, stop = task
+    began = time.perf_counter()
+    total = 0
+    with GradeFile(path) as grades:
+        for chunk in grades.chunks(start, stop):
+            total += sum(chunk)
+            chunk.release()
+    return school_index, stop - start, total, os.getpid(), time.perf_counter() - began
+
+class SchoolBatchRunner:
+    def __init__(self, max_workers=None, grades_per_task=1 << 20, chunksize=8):
+        # max_workers: size of the process pool (None lets Python pick the CPU count).
+        # grades_per_task: large rosters are split into slices of at most this many grades.
+        # chunksize: how many slices are sent to a worker in one message.
+        self.max_workers = max_workers
+        self.grades_per_task = grades_per_task
+        self.chunksize = chunksize
+
+    def _tasks(self, jobs):
+        # Split every roster file into (school index, path, start, stop) slices.
+        for index, (_, _, path) in enumerate(jobs):
+            size = os.path.getsize(path)
+            for start in range(0, size, self.grades_per_task):
+                yield index, path, start, min(start + self.grades_per_task, size)
+
+    def run(self, jobs):
+        # 'jobs' is a list of (School subclass, school name, grade file path). Returns the
+        # (name, average, GPA) of every school plus timing and per-worker throughput.
+        jobs = list(jobs)
+        counts = [0] * len(jobs)
+        totals = [0] * len(jobs)
+        workers = {}
+        # Imported here so that importing this module stays fast for short-lived workers.
+        from concurrent.futures import ProcessPoolExecutor
+
+        began = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            for index, count, total, pid, seconds in executor.map(
+                _sum_grade_range, self._tasks(jobs), chunksize=self.chunksize
+            ):
+                # Merge the partial sums of each slice into its school's totals.
+                counts[index] += count
+                totals[index] += total
+                worker = workers.setdefault(pid, {'tasks': 0, 'grades': 0, 'seconds': 0.0})
+                worker['tasks'] += 1
+                worker['grades'] += count
+                worker['seconds'] += seconds
+        wall_time = time.perf_counter() - began
+
+        results = []
+        for (school_class, name, _), count, total in zip(jobs, counts, totals):
+            # Same arithmetic as RunningStats.average and calculate_gpa, so the numbers match exactly.
+            avg = total / count if count else 0
+            results.append((name, avg, School.GradeCalculator.gpa_from_average(avg, school_class.gpa_scale)))
+        for worker in workers.values():
+            worker['grades_per_second'] = worker['grades'] / worker['seconds'] if worker['seconds'] else 0.0
+        return {'results': results, 'wall_time': wall_time, 'workers': workers}
+
+# NumPy is optional and slow to import: the schools work without it, and it is only
+# loaded the first time District needs it.
+np = None
+
+def _load_numpy(feature):
+    # Import NumPy on first use and return it; raises ImportError naming 'feature' if it is missing.
+    global np
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(f"{feature} requires NumPy") from None
+    return np
+
+class District:
+    def __init__(self, schools=()):
+        # Columnar layout: entry i of each column belongs to school i. Each school's GPA scale sits in 'scales'.
+        _load_numpy("District")
+        self._schools = list(schools)
+        self._versions = [school._version for school in self._schools]
+        self.scales = np.array([school.gpa_scale for school in self._schools], dtype=np.float64)
+        # Per-school sums and counts come from each school's running totals, so they match
+        # calculate_average() exactly and can be refreshed without reading any grades.
+        self._sums = np.array([school._stats.total for school in self._schools], dtype=np.float64)
+        self._counts = np.array([school._stats.count for school in self._schools], dtype=np.int64)
+        self._update_results(np.arange(len(self._schools)))
+
+    def _update_results(self, indices):
+        # Recompute averages and GPAs for the given schools only.
+        if not hasattr(self, '_averages'):
+            self._averages = np.zeros(len(self._schools))
+            self._gpas = np.zeros(len(self._schools))
+        counts = self._counts[indices]
+        averages = np.divide(self._sums[indices], counts, out=np.zeros(len(indices)), where=counts > 0)
+        self._averages[indices] = averages
+        # Python's round() is used for the final step so the GPAs match calculate_gpa() exactly
+        # (np.round can differ on values that sit half-way between two hundredths).
+        self._gpas[indices] = [round(gpa, 2) for gpa in (averages / self.scales[indices]).tolist()]
+
+    def refresh(self):
+        # Find schools whose grades changed since the last refresh and recompute only those,
+        # from their running totals.
+        changed = [i for i, school in enumerate(self._schools) if school._version != self._versions[i]]
+        if not changed:
+            return []
+        for i in changed:
+            school = self._schools[i]
+            self._versions[i] = school._version
+            self._sums[i] = school._stats.total
+            self._counts[i] = school._stats.count
+        self._update_results(np.array(changed))
+        return [self._schools[i].name for i in changed]
+
+    def averages(self):
+        # Average grade of every school, in the order the schools were given.
+        return self._averages
+
+    def gpas(self):
+        # GPA of every school, each using its own class's gpa_scale.
+        return self._gpas
+
+    def results(self):
+        # (school name, average, GPA) for every school.
+        return list(zip((school.name for school in self._schools), self._averages.tolist(), self._gpas.tolist()))
 
-print("==================================================================\n")
+# --- Q3 OUTPUT ---
+def demo_q3():
+    # Runs the Q3 demonstration. It is only called when this file is executed
+    # directly, so importing the file defines the classes without printing anything.
+    print("Q3: Build a two class call SchoolOne and SchoolTwo that")
+    print("    display there list of students average grades and GPA.")
+    print("___________________________________________________________________")
+    school_one = SchoolOne("Greenwood High", [88, 92, 79, 85, 91])
+    school_two = SchoolTwo("Maple Leaf School", [75, 84, 90, 68, 82])
+
+    school_one.display_stats()
+    school_two.display_stats()
+
+    # Update a roster incrementally; the running totals follow every change.
+    print("------ Updating Greenwood High incrementally ------")
+    school_one.add_grade(97)
+    school_one.remove_grade(79)
+    stats = school_one._stats
+    print(f"  Grades: {school_one._students}")
+    print(f"  Count = {stats.count}, Sum = {stats.total}, Min = {stats.minimum}, Max = {stats.maximum}")
+    print(f"  Average = {school_one.calculate_average():.2f}, GPA = {school_one.calculate_gpa():.2f}, "
+          f"Std. deviation = {stats.variance() ** 0.5:.2f}\n")
+
+    # Order statistics come from the grade index rather than from sorting the roster.
+    print("------ Order statistics for Maple Leaf School ------")
+    print(f"  Median = {school_two.median()}")
+    print(f"  Quartiles = {school_two.percentile(25)}, {school_two.percentile(50)}, {school_two.percentile(75)}")
+    print(f"  A grade of 84 is at the {school_two.percentile_rank(84):.0f}th percentile")
+    print(f"  Top 3 grades = {school_two.top_grades(3)}\n")
+
+    # Report one roster under several grading systems at once.
+    print("------ Greenwood High under several grading systems ------")
+    letter_table = {90: 4.0, 80: 3.0, 70: 2.0, 60: 1.0}
+    for label, gpa in zip(["Scale 25", "Scale 20", "Letter table"], school_one.calculate_gpas([25, 20, letter_table])):
+        print(f"  {label}: GPA = {gpa:.2f}")
+    print(f"  Single pass over a plain list: {School.GradeCalculator.multi_gpa([75, 84, 90, 68, 82], [25, 20, letter_table])}\n")
+
+    # Aggregate both schools into a district and compute every average and GPA at once.
+    print("------ District-wide statistics ------")
+    try:
+        _load_numpy("District")
+    except ImportError:
+        print("  NumPy is not installed; skipping District demo.\n")
+    else:
+        district = District([school_one, school_two])
+        for name, avg, gpa in district.results():
+            print(f"  {name}: Average = {avg:.2f}, GPA = {gpa:.2f}")
+        school_two.add_grade(100)
+        print(f"  Recomputed after adding a grade to {school_two.name}: {district.refresh()}")
+        for name, avg, gpa in district.results():
+            print(f"  {name}: Average = {avg:.2f}, GPA = {gpa:.2f}")
+        print()
+
+    # Back a school with a memory-mapped grade file and check it matches the in-memory school.
+    print("------ Streaming a roster from a grade file ------")
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as folder:
+        text_roster = os.path.join(folder, "greenwood.csv")
+        with open(text_roster, "w") as roster:
+            roster.write(", ".join(map(str, school_one._students)) + "\n")
+        GradeFile.from_text(text_roster, os.path.join(folder, "greenwood.grades")).close()
+        with SchoolOne.from_grade_file("Greenwood High (from file)", os.path.join(folder, "greenwood.grades")) as file_school:
+            file_school.display_stats()
+            print(f"  Same average and GPA as the in-memory school? "
+                  f"{(file_school.calculate_average(), file_school.calculate_gpa()) == (school_one.calculate_average(), school_one.calculate_gpa())}")
+            print(f"  GradeCalculator.average over the file = {School.GradeCalculator.average(file_school._students):.2f}\n")
+
+    # Fan many roster files out to a process pool and merge the partial sums.
+    print("------ Batch statistics with a process pool ------")
+    import random
+
+    random.seed(3)
+    with tempfile.TemporaryDirectory() as folder:
+        jobs = []
+        for number in range(1, 9):
+            school_class = SchoolOne if number % 2 else SchoolTwo
+            path = os.path.join(folder, f"school_{number}.grades")
+            GradeFile.create(path, (random.randint(50, 100) for _ in range(50_000))).close()
+            jobs.append((school_class, f"School {number}", path))
+
+        report = SchoolBatchRunner(max_workers=2, grades_per_task=20_000).run(jobs)
+        for name, avg, gpa in report['results'][:3]:
+            print(f"  {name}: Average = {avg:.2f}, GPA = {gpa:.2f}")
+        print(f"  ... {len(report['results'])} schools in {report['wall_time']:.3f}s")
+        for pid, worker in sorted(report['workers'].items()):
+            print(f"  Worker {pid}: {worker['tasks']} slices, {worker['grades_per_second']:,.0f} grades/s")
+
+        matches = True
+        for (school_class, name, path), (_, avg, gpa) in zip(jobs, report['results']):
+            with school_class.from_grade_file(name, path) as school:
+                matches = matches and (avg, gpa) == (school.calculate_average(), school.calculate_gpa())
+        print(f"  Same as calculate_average / calculate_gpa? {matches}\n")
+
+if __name__ == "__main__":
+    demo_q3()
+    print("==================================================================\n")
 
 ##############################################
 # Q4: Operator Overloading - Create a Vector class that supports addition using the + operator.
@@ -256,11 +1843,31 @@ print("==================================================================\n")
 #   - The __repr__ method is provided for an unambiguous representation of the vector.
 #   - A static method (dot_product) computes the dot product of two vectors.
 #   - A class method (origin) is provided as a factory for a vector at the origin.
+#   - __slots__ keeps each Vector compact (no per-instance __dict__), and the in-place operators
+#     (+=, -=, *=) update the vector without allocating a new object.
+#   - A class method (sum) reduces many vectors into a single accumulator; __radd__ also lets the
+#     built-in sum() work by accepting its 0 start value.
 #
 # If an operand that is not a Vector is provided during addition, the code raises a TypeError,
 # ensuring type safety.
+#
+# A companion class 'VectorArray' stores many 2-D vectors in one contiguous (N, 2) NumPy buffer
+# so that addition and dot products run over the whole batch at once instead of one object at a time.
+#
+# 'VectorN' generalises Vector to any number of dimensions. It is an array('d') subclass, so it exports
+# the buffer protocol: memoryview, NumPy, struct and file writes read its components directly without
+# copying them out into a tuple first. VectorN.from_buffer() wraps a caller-supplied buffer (bytearray,
+# mmap, ...) without copying it, in a VectorN.View that supports the same operations.
+#
+# 'VectorGrid' is a spatial index over Vector objects. It buckets them into square cells of a uniform
+# grid, so nearest-neighbour, radius and bounding-box queries only look at nearby cells instead of
+# scanning every vector. A Vector can be changed in place (v += w) while it is in the grid, but the grid
+# only sees the new position after grid.move(v); until then queries still use the position it had.
 
 class Vector:
+    # Only these two (name-mangled) attributes are allowed, so no __dict__ is created per instance.
+    __slots__ = ('__x', '__y')
+
     def __init__(self, x, y):
         # Private attributes: prepending with __ makes them name-mangled.
         self.__x = x  
@@ -271,13 +1878,52 @@ class Vector:
         if isinstance(other, Vector):
             # Create and return a new Vector with each corresponding component added together.
             return Vector(self.__x + other.__x, self.__y + other.__y)
+        if isinstance(other, VectorArray):
+            # Let VectorArray.__radd__ broadcast this vector over the batch.
+            return NotImplemented
         # If 'other' is not a Vector, raise an error.
         raise TypeError("Operand must be of type Vector")
 
+    def __radd__(self, other):
+        # Called for '0 + vector', which is how the built-in sum() starts its total.
+        if other == 0:
+            return Vector(self.__x, self.__y)
+        raise TypeError("Operand must be of type Vector")
+
+    def __iadd__(self, other):
+        # Overload '+=' to update this vector in place instead of creating a new one.
+        if isinstance(other, Vector):
+            self.__x += other.__x
+            self.__y += other.__y
+            return self
+        raise TypeError("Operand must be of type Vector")
+
+    def __isub__(self, other):
+        # Overload '-=' to update this vector in place.
+        if isinstance(other, Vector):
+            self.__x -= other.__x
+            self.__y -= other.__y
+            return self
+        raise TypeError("Operand must be of type Vector")
+
+    def __imul__(self, scalar):
+        # Overload '*=' to scale this vector in place by a number.
+        if isinstance(scalar, (int, float)):
+            self.__x *= scalar
+            self.__y *= scalar
+            return self
+        raise TypeError("Operand must be a number")
+
     def __repr__(self):
         # Provide a clear representation of the vector for debugging.
         return f"Vector({self.__x}, {self.__y})"
 
+    def __iter__(self):
+        # Yield the components in order so a Vector can be unpacked (x, y = v) without
+        # exposing the private attributes themselves.
+        yield self.__x
+        yield self.__y
+
     @staticmethod
     def dot_product(v1, v2):
         # Calculate the dot product from two vectors using their private attributes.
@@ -288,33 +1934,576 @@ class Vector:
         # Return a new Vector instance at the origin (0,0).
         return cls(0, 0)
 
-# --- Q4 OUTPUT ---
-print("Q4: Operator Overloading Create a Vector class that supports addition")
-print("    using the + operator, allowing you to add two vectors.")
-print("___________________________________________________________________")
-vector1 = Vector(5, 6)    # Creating the first vector.
-vector2 = Vector(7, 8)  # Creating the second vector.
-vector3 = vector1 + vector2  # Using the overloaded addition operator.
+    @classmethod
+    def sum(cls, vectors):
+        # Add up any iterable of vectors using two running totals, so no temporary
+        # Vector objects are created along the way; only the result is allocated.
+        total_x = total_y = 0
+        for v in vectors:
+            if not isinstance(v, Vector):
+                raise TypeError("Operand must be of type Vector")
+            total_x += v.__x
+            total_y += v.__y
+        return cls(total_x, total_y)
+
+# NumPy is optional and slow to import: the scalar Vector above works without it, and it is
+# only loaded the first time VectorArray needs it.
+np = None
+
+def _load_numpy(feature):
+    # Import NumPy on first use and return it; raises ImportError naming 'feature' if it is missing.
+    global np
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(f"{feature} requires NumPy") from None
+    return np
+
+class VectorArray:
+    def __init__(self, data):
+        # Store every vector as one row of a contiguous (N, 2) float64 buffer.
+        _load_numpy("VectorArray")
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != 2:
+            raise ValueError("VectorArray data must have shape (N, 2)")
+        self._data = data
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        # Alternative constructor that packs a list of Vector objects into one buffer.
+        _load_numpy("VectorArray")
+        vectors = list(vectors)
+        flat = np.fromiter((c for v in vectors for c in v), dtype=np.float64, count=2 * len(vectors))
+        return cls(flat.reshape(-1, 2))
+
+    @classmethod
+    def origin(cls, n):
+        # Return a VectorArray holding n vectors at the origin (0,0).
+        return cls(_load_numpy("VectorArray").zeros((n, 2)))
+
+    def to_vectors(self):
+        # Convert back to a list of individual Vector objects.
+        return [Vector(x, y) for x, y in self._data.tolist()]
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        # A single index returns a Vector; a slice returns a VectorArray view (no copy).
+        if isinstance(index, slice):
+            return VectorArray(self._data[index])
+        x, y = self._data[index].tolist()
+        return Vector(x, y)
+
+    def __add__(self, other):
+        # Overload the '+' operator for the whole batch at once.
+        if isinstance(other, VectorArray):
+            if len(other) != len(self):
+                raise ValueError("VectorArray operands must have the same length")
+            return VectorArray(self._data + other._data)
+        if isinstance(other, Vector):
+            # Broadcast a single Vector against every row.
+            return VectorArray(self._data + np.array(tuple(other), dtype=np.float64))
+        # Keep the same contract as Vector: anything else is a type error.
+        raise TypeError("Operand must be of type Vector or VectorArray")
+
+    def __radd__(self, other):
+        # Called for 'vector + batch' (addition is commutative) and for the 0 that sum() starts with.
+        if isinstance(other, int) and other == 0:
+            return VectorArray(self._data.copy())
+        return self.__add__(other)
+
+    def __repr__(self):
+        return f"VectorArray({self._data.tolist()})"
+
+    @staticmethod
+    def _as_buffer(value):
+        # Helper that turns either operand type into an array, rejecting anything else.
+        _load_numpy("VectorArray")
+        if isinstance(value, VectorArray):
+            return value._data
+        if isinstance(value, Vector):
+            return np.array(tuple(value), dtype=np.float64)
+        raise TypeError("Operand must be of type Vector or VectorArray")
+
+    @staticmethod
+    def dot_product(a, b):
+        # Element-wise dot product: row i of 'a' with row i of 'b' (or with a single Vector).
+        _load_numpy("VectorArray")
+        a_data = VectorArray._as_buffer(a)
+        b_data = VectorArray._as_buffer(b)
+        if a_data.ndim == 2 and b_data.ndim == 2:
+            if len(a_data) != len(b_data):
+                raise ValueError("VectorArray operands must have the same length")
+            return np.einsum("ij,ij->i", a_data, b_data)
+        return a_data @ b_data if a_data.ndim == 2 else b_data @ a_data
+
+    @staticmethod
+    def pairwise_dot_product(a, b):
+        # Pairwise dot products: entry [i, j] is row i of 'a' dotted with row j of 'b'.
+        if not isinstance(a, VectorArray) or not isinstance(b, VectorArray):
+            raise TypeError("Operands must be of type VectorArray")
+        return a._data @ b._data.T
+
+from array import array
+from operator import mul
+
+def _components(vector):
+    # The memoryview of doubles behind a VectorN or a VectorN.View (TypeError for anything else).
+    if isinstance(vector, VectorN):
+        return memoryview(vector)
+    if isinstance(vector, VectorN.View):
+        return vector._data
+    raise TypeError("Operand must be of type VectorN")
+
+class VectorN(array):
+    # The components are the array's own C doubles; subclassing array gives every VectorN the
+    # buffer protocol on any Python version. No per-instance __dict__ is added.
+    __slots__ = ()
+
+    def __new__(cls, *components):
+        return super().__new__(cls, 'd', components)
+
+    def __reduce__(self):
+        # array's own pickling would call VectorN('d', data); rebuild from the components instead.
+        return (type(self), tuple(self))
+
+    # A vector over a buffer it does not own (see from_buffer). Changes to the buffer show up in
+    # the vector. It has the same operations as VectorN; results are new VectorN objects.
+    class View:
+        __slots__ = ('_data',)
+
+        def __init__(self, data):
+            self._data = data
+
+        def view(self):
+            return self._data
+
+        def __buffer__(self, flags):
+            # Buffer protocol hook (Python 3.12+); on older versions use view().
+            return self._data
 
-print(f"vector1: {vector1}")
-print(f"vector2: {vector2}")
-print(f"\nvector1 + vector2 = {vector3}")
+        def __len__(self):
+            return len(self._data)
 
-# Demonstrate the dot product static method.
-print("\nDot Product of vector1 and vector2:", Vector.dot_product(vector1, vector2))
+        def __iter__(self):
+            return iter(self._data)
 
-# Demonstrate the class method for obtaining a vector at the origin.
-print("\nOrigin vector:", Vector.origin())
+        def __getitem__(self, index):
+            return self._data[index]
 
-# Testing error handling with non-Vector input.
-print("\n------ Testing with non-Vector input ------")
-try:
-    # This should fail because 5 is not a Vector.
-    result = vector1 + 5
-except TypeError as error:
-    print("ERROR:", error)
+        def __add__(self, other):
+            return VectorN.__add__(self, other)
 
-print("\n==================================================================\n")
+        def __repr__(self):
+            return f"VectorN.View({', '.join(map(str, self._data))})"
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        # Alternative constructor that wraps an existing buffer (bytearray, array, mmap,
+        # NumPy array, ...) in a VectorN.View without copying it.
+        # The buffer must be 1-D and contiguous, and hold either doubles or raw bytes.
+        view = memoryview(buffer)
+        if view.ndim != 1 or not view.c_contiguous:
+            raise ValueError("Buffer must be one-dimensional and contiguous")
+        if view.format in ('B', 'b', 'c'):
+            view = view.cast('B').cast('d')
+        elif view.format != 'd':
+            raise TypeError(f"Buffer must hold doubles ('d') or raw bytes, not format {view.format!r}")
+        return cls.View(view)
+
+    @classmethod
+    def from_vector(cls, vector):
+        # Alternative constructor that converts a 2-D Vector.
+        return cls(*vector)
+
+    @classmethod
+    def origin(cls, dimension=2):
+        # Return a new VectorN at the origin with the requested number of dimensions.
+        return cls(*([0.0] * dimension))
+
+    def view(self):
+        # Return a zero-copy memoryview of the components (format 'd').
+        return memoryview(self)
+
+    def __add__(self, other):
+        # Overload the '+' operator for vectors of the same dimension (array's '+' would
+        # concatenate instead).
+        a, b = _components(self), _components(other)
+        if len(a) != len(b):
+            raise ValueError("Vectors must have the same dimension")
+        return VectorN(*map(float.__add__, a, b))
+
+    def __iadd__(self, other):
+        # Overload '+=' to add in place (array's '+=' would extend the array).
+        b = _components(other)
+        if len(b) != len(self):
+            raise ValueError("Vectors must have the same dimension")
+        for i, value in enumerate(b):
+            self[i] += value
+        return self
+
+    def __mul__(self, other):
+        # array's '*' repeats the array; that makes no sense for a vector.
+        raise TypeError("VectorN does not support '*'")
+
+    __rmul__ = __imul__ = __mul__
+
+    def __repr__(self):
+        return f"VectorN({', '.join(map(str, self))})"
+
+    @staticmethod
+    def dot_product(v1, v2):
+        # Calculate the dot product of two vectors of the same dimension.
+        a, b = _components(v1), _components(v2)
+        if len(a) != len(b):
+            raise ValueError("Vectors must have the same dimension")
+        return sum(map(mul, a, b))
+
+import heapq
+import math
+
+class VectorGrid:
+    def __init__(self, cell_size):
+        # Each cell (column, row) maps to a list of (x, y, vector) entries inside it.
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells = {}
+        self._count = 0
+        # id(vector) -> key of the cell it was put in, so remove() and move() still find a
+        # vector after it has been changed in place.
+        self._cell_of = {}
+        # Number of occupied cells in each column and row, and the (min_col, min_row, max_col,
+        # max_row) bounds of the occupied cells. The bounds are recomputed lazily (None = stale)
+        # only when an edge column or row is emptied.
+        self._col_cells = {}
+        self._row_cells = {}
+        self._bounds = None
+
+    @classmethod
+    def bulk_load(cls, vectors, points_per_cell=4):
+        # Alternative constructor that picks a cell size from the data's bounding box so that
+        # each cell holds about 'points_per_cell' vectors, then inserts everything in one pass.
+        # The longer side also sets a lower bound (about n / points_per_cell cells along it), so
+        # points on a line do not get a microscopic cell size; identical points fall back to 1.0.
+        vectors = list(vectors)
+        if not vectors:
+            return cls(1.0)
+        xs, ys = zip(*vectors)
+        width, height = max(xs) - min(xs), max(ys) - min(ys)
+        share = min(points_per_cell / len(vectors), 1.0)
+        cell_size = max(math.sqrt(width * height * share), max(width, height) * share)
+        grid = cls(cell_size or 1.0)
+        for v in vectors:
+            grid.insert(v)
+        return grid
+
+    def _cell(self, x, y):
+        # Return the (column, row) of the cell containing the point (x, y).
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def __len__(self):
+        return self._count
+
+    def insert(self, vector):
+        # Add a vector to the cell it falls into. Each vector object can be in the grid once.
+        if not isinstance(vector, Vector):
+            raise TypeError("Operand must be of type Vector")
+        if id(vector) in self._cell_of:
+            raise ValueError("Vector is already in the grid")
+        x, y = vector
+        key = self._cell(x, y)
+        entries = self._cells.get(key)
+        if entries is None:
+            entries = self._cells[key] = []
+            self._occupy(key)
+        entries.append((x, y, vector))
+        self._cell_of[id(vector)] = key
+        self._count += 1
+
+    def _occupy(self, key):
+        # Record a newly occupied cell and widen the bounds if they are known.
+        col, row = key
+        self._col_cells[col] = self._col_cells.get(col, 0) + 1
+        self._row_cells[row] = self._row_cells.get(row, 0) + 1
+        if self._bounds is not None:
+            min_col, min_row, max_col, max_row = self._bounds
+            self._bounds = (min(min_col, col), min(min_row, row), max(max_col, col), max(max_row, row))
+        elif len(self._cells) == 1:
+            self._bounds = (col, row, col, row)
+
+    def _vacate(self, key):
+        # Forget an emptied cell; the bounds go stale only if its column or row was on the edge.
+        col, row = key
+        for counts, index in ((self._col_cells, col), (self._row_cells, row)):
+            counts[index] -= 1
+            if not counts[index]:
+                del counts[index]
+                self._bounds = None
+
+    def _occupied_bounds(self):
+        # Return (min_col, min_row, max_col, max_row) of the occupied cells.
+        if self._bounds is None:
+            self._bounds = (min(self._col_cells), min(self._row_cells),
+                            max(self._col_cells), max(self._row_cells))
+        return self._bounds
+
+    def remove(self, vector):
+        # Remove a previously inserted vector (matched by identity). It is looked up in the cell
+        # it was inserted into, not the one its current coordinates fall into.
+        key = self._cell_of.pop(id(vector), None)
+        if key is None:
+            raise ValueError("Vector is not in the grid")
+        entries = self._cells[key]
+        for i, entry in enumerate(entries):
+            if entry[2] is vector:
+                del entries[i]
+                break
+        if not entries:
+            del self._cells[key]
+            self._vacate(key)
+        self._count -= 1
+
+    def move(self, vector):
+        # Re-index a vector after it was changed in place, so queries see its new position.
+        self.remove(vector)
+        self.insert(vector)
+
+    def _entries_in_box(self, min_x, min_y, max_x, max_y):
+        # Yield the (x, y, vector) entries of every cell that overlaps the box. The box is first
+        # clipped to the occupied cells; if it still spans more cells than are occupied, the
+        # occupied cells are scanned instead of the (mostly empty) box.
+        if not self._cells:
+            return
+        low_col, low_row, high_col, high_row = self._occupied_bounds()
+        min_col, min_row = self._cell(min_x, min_y)
+        max_col, max_row = self._cell(max_x, max_y)
+        min_col, min_row = max(min_col, low_col), max(min_row, low_row)
+        max_col, max_row = min(max_col, high_col), min(max_row, high_row)
+        if min_col > max_col or min_row > max_row:
+            return
+        if (max_col - min_col + 1) * (max_row - min_row + 1) > len(self._cells):
+            for (col, row), entries in self._cells.items():
+                if min_col <= col <= max_col and min_row <= row <= max_row:
+                    yield from entries
+            return
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                yield from self._cells.get((col, row), ())
+
+    def in_box(self, min_corner, max_corner):
+        # Return every vector inside the axis-aligned box spanned by the two corners.
+        min_x, min_y = min_corner
+        max_x, max_y = max_corner
+        return [
+            v for x, y, v in self._entries_in_box(min_x, min_y, max_x, max_y)
+            if min_x <= x <= max_x and min_y <= y <= max_y
+        ]
+
+    def within_radius(self, point, radius):
+        # Return every vector whose distance from 'point' is at most 'radius'.
+        px, py = point
+        limit = radius * radius
+        return [
+            v for x, y, v in self._entries_in_box(px - radius, py - radius, px + radius, py + radius)
+            if (x - px) ** 2 + (y - py) ** 2 <= limit
+        ]
+
+    def nearest(self, point, k=1):
+        # Return the k vectors closest to 'point', nearest first. Cells are visited in rings
+        # around the point's cell, clipped to the occupied cells (rings that cannot reach them
+        # are skipped), and the search stops once no unvisited ring can hold anything closer
+        # than the current k-th best match.
+        if self._count == 0 or k <= 0:
+            return []
+        px, py = point
+        center_col, center_row = self._cell(px, py)
+        min_col, min_row, max_col, max_row = self._occupied_bounds()
+        first_ring = max(0, min_col - center_col, center_col - max_col, min_row - center_row, center_row - max_row)
+        last_ring = max(center_col - min_col, max_col - center_col, center_row - min_row, max_row - center_row)
+        best = []  # max-heap of (-distance squared, tie breaker, vector)
+        for ring in range(first_ring, last_ring + 1):
+            top, bottom = center_row - ring, center_row + ring
+            for col in range(max(center_col - ring, min_col), min(center_col + ring, max_col) + 1):
+                if col in (center_col - ring, center_col + ring):
+                    # Left and right edges of the ring: every row.
+                    rows = range(max(top, min_row), min(bottom, max_row) + 1)
+                else:
+                    # Inner columns: only the top and bottom rows of the ring.
+                    rows = [row for row in (top, bottom) if min_row <= row <= max_row]
+                for row in rows:
+                    for x, y, v in self._cells.get((col, row), ()):
+                        item = (-((x - px) ** 2 + (y - py) ** 2), id(v), v)
+                        if len(best) < k:
+                            heapq.heappush(best, item)
+                        elif item > best[0]:
+                            heapq.heapreplace(best, item)
+            if len(best) == k and -best[0][0] <= (ring * self.cell_size) ** 2:
+                break
+        return [v for _, _, v in sorted(best, reverse=True)]
+
+# --- Q4 OUTPUT ---
+def demo_q4():
+    # Runs the Q4 demonstration. It is only called when this file is executed
+    # directly, so importing the file defines the classes without printing anything.
+    print("Q4: Operator Overloading Create a Vector class that supports addition")
+    print("    using the + operator, allowing you to add two vectors.")
+    print("___________________________________________________________________")
+    vector1 = Vector(5, 6)    # Creating the first vector.
+    vector2 = Vector(7, 8)  # Creating the second vector.
+    vector3 = vector1 + vector2  # Using the overloaded addition operator.
+
+    print(f"vector1: {vector1}")
+    print(f"vector2: {vector2}")
+    print(f"\nvector1 + vector2 = {vector3}")
+
+    # Demonstrate the dot product static method.
+    print("\nDot Product of vector1 and vector2:", Vector.dot_product(vector1, vector2))
+
+    # Demonstrate the class method for obtaining a vector at the origin.
+    print("\nOrigin vector:", Vector.origin())
+
+    # Testing error handling with non-Vector input.
+    print("\n------ Testing with non-Vector input ------")
+    try:
+        # This should fail because 5 is not a Vector.
+        result = vector1 + 5
+    except TypeError as error:
+        print("ERROR:", error)
+
+    # Demonstrate the in-place operators and the summing helpers.
+    print("\n------ Testing in-place operators and sum ------")
+    moving = Vector(1, 1)
+    moving_id = id(moving)
+    moving += vector1
+    moving -= Vector(1, 1)
+    moving *= 2
+    print("Vector(1, 1) += vector1, -= Vector(1, 1), *= 2 ->", moving)
+    print("Same object after in-place updates?", id(moving) == moving_id)
+    print("Vector.sum([vector1, vector2, vector3]) =", Vector.sum([vector1, vector2, vector3]))
+    print("sum([vector1, vector2, vector3]) =", sum([vector1, vector2, vector3]))
+
+    # Demonstrate the N-dimensional vector and its zero-copy buffer.
+    print("\n------ Testing with VectorN ------")
+    import struct
+
+    point = VectorN(1, 2, 3)
+    print("point:", point)
+    print("point + VectorN(4, 5, 6) =", point + VectorN(4, 5, 6))
+    print("Dot product of point and VectorN(4, 5, 6):", VectorN.dot_product(point, VectorN(4, 5, 6)))
+    print("Origin in 4 dimensions:", VectorN.origin(4))
+    print("From a 2-D Vector:", VectorN.from_vector(vector1))
+    print("Read through struct without copying:", struct.unpack_from("3d", point.view()))
+
+    # Build a vector on top of an existing bytearray; writing to the bytearray updates the vector.
+    raw = bytearray(struct.pack("2d", 7.0, 8.0))
+    shared = VectorN.from_buffer(raw)
+    struct.pack_into("d", raw, 0, 70.0)
+    print("VectorN over a bytearray after changing the bytes:", shared)
+    print("memoryview(point) reads the same storage:", memoryview(point).format, memoryview(point).tolist())
+
+    # Demonstrate the spatial index and compare it with a brute-force scan.
+    print("\n------ Testing with VectorGrid ------")
+    import random
+    import timeit
+
+    random.seed(4)
+    cloud = [Vector(random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(20_000)]
+    grid = VectorGrid.bulk_load(cloud)
+    target = Vector(500, 500)
+    print(f"Indexed {len(grid)} vectors with a cell size of {grid.cell_size:.2f}")
+    print("3 nearest to", target, "->", grid.nearest(target, k=3))
+    print("Vectors within 10 of", target, "->", len(grid.within_radius(target, 10)))
+    print("Vectors inside the box (0, 0)-(10, 10) ->", len(grid.in_box((0, 0), (10, 10))))
+    extra = Vector(500.5, 500.5)
+    grid.insert(extra)
+    print("After inserting", extra, "nearest is", grid.nearest(target)[0])
+    extra += Vector(400, 400)
+    grid.move(extra)
+    print("After moving it to", extra, "nearest is", grid.nearest(target)[0])
+    grid.remove(extra)
+    print("After removing it again, grid holds", len(grid), "vectors")
+
+    def brute_force_nearest(points, point, k):
+        # Reference implementation: measure every point and keep the k closest.
+        px, py = point
+
+        def distance_squared(v):
+            x, y = v
+            return (x - px) ** 2 + (y - py) ** 2
+
+        return heapq.nsmallest(k, points, key=distance_squared)
+
+    queries = [Vector(random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(100)]
+    print("Same answers as brute force?",
+          all(grid.nearest(q, 5) == brute_force_nearest(cloud, q, 5) for q in queries[:10]))
+    grid_time = timeit.timeit(lambda: [grid.nearest(q, 5) for q in queries], number=1)
+    brute_time = timeit.timeit(lambda: [brute_force_nearest(cloud, q, 5) for q in queries], number=1)
+    print(f"100 nearest(k=5) queries over 20,000 vectors: VectorGrid {grid_time:.4f}s, brute force {brute_time:.4f}s")
+
+    # Compare memory and throughput with a plain class that keeps a per-instance __dict__,
+    # which is how Vector was stored before __slots__ was added.
+    print("\n------ Comparing with a __dict__-based vector ------")
+    import sys
+    import tracemalloc
+
+    class PlainVector:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+        def __add__(self, other):
+            return PlainVector(self.x + other.x, self.y + other.y)
+
+    def bytes_per_instance(factory, count=10_000):
+        # Measure the memory allocated while building 'count' instances.
+        tracemalloc.start()
+        items = [factory(i, i) for i in range(count)]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return (size - sys.getsizeof(items)) / len(items)
+
+    print(f"Bytes per instance: PlainVector ~{bytes_per_instance(PlainVector):.0f}, Vector ~{bytes_per_instance(Vector):.0f}")
+
+    plain_items = [PlainVector(i, i) for i in range(10_000)]
+    slot_items = [Vector(i, i) for i in range(10_000)]
+
+    def plain_loop():
+        # The manual loop that allocates a new object for every addition.
+        total = PlainVector(0, 0)
+        for v in plain_items:
+            total = total + v
+        return total
+
+    plain_time = timeit.timeit(plain_loop, number=20)
+    sum_time = timeit.timeit(lambda: Vector.sum(slot_items), number=20)
+    print(f"Summing 10,000 vectors x20: PlainVector loop {plain_time:.4f}s, Vector.sum {sum_time:.4f}s")
+
+    # Demonstrate batch operations with VectorArray (skipped when NumPy is not installed).
+    print("\n------ Testing with VectorArray ------")
+    try:
+        _load_numpy("VectorArray")
+    except ImportError:
+        print("NumPy is not installed; skipping VectorArray demo.")
+    else:
+        batch = VectorArray.from_vectors([vector1, vector2, Vector(1, 2)])
+        print("batch:", batch)
+        print("batch + vector1 =", batch + vector1)
+        print("batch + batch =", batch + batch)
+        print("Element-wise dot product with vector2:", VectorArray.dot_product(batch, vector2).tolist())
+        print("Pairwise dot products:", VectorArray.pairwise_dot_product(batch, batch).tolist())
+        print("Back to Vectors:", batch.to_vectors())
+        try:
+            # This should fail because 5 is neither a Vector nor a VectorArray.
+            result = batch + 5
+        except TypeError as error:
+            print("ERROR:", error)
+
+if __name__ == "__main__":
+    demo_q4()
+    print("\n==================================================================\n")
 
 ##############################################
 # Q5: Composition Over Inheritance - Create a Book class with an Author class included within it.
@@ -327,6 +2516,27 @@ print("\n==================================================================\n")
 #
 # This design shows how to build complex objects by composing simpler ones,
 # thereby favoring flexible design over deep inheritance hierarchies.
+#
+# The Book also caches the rendered line of every chapter and a running total of pages (a prefix sum), so
+# printing the book only formats chapters that changed, and "which chapter is page P on?" is a binary search.
+# Changes made through add_chapter, insert_chapter, remove_chapter, replace_chapter or by assigning a new
+# chapter list are picked up automatically; after editing the list or a chapter in place, call invalidate().
+#
+# For very large collections, a 'ChapterStore' can stand in for the chapter list. It keeps chapter titles,
+# page counts and text in a file read through mmap, and only builds Chapter objects when they are accessed
+# (keeping the most recently used ones in a small LRU cache).
+#
+# A 'Library' catalogs many books. It indexes them by author name and keeps an inverted index from each
+# word in a book or chapter title to the matching books and chapters, so term and prefix searches do not
+# walk every book. Books tell the library about new chapters, so the index stays up to date.
+
+import mmap
+import re
+import struct
+from bisect import bisect_left, insort
+from heapq import merge
+from array import array
+from collections import OrderedDict
 
 class Author:
     def __init__(self, name):
@@ -341,9 +2551,10 @@ class Author:
 class Book:
     # Nested Chapter class to represent individual chapters.
     class Chapter:
-        def __init__(self, title, num_pages):
+        def __init__(self, title, num_pages, text=None):
             self.title = title          # The chapter’s title.
             self.num_pages = num_pages  # The number of pages in the chapter.
+            self.text = text            # Optional chapter content.
 
         def __str__(self):
             # Returns a string showing the chapter title and its page count.
@@ -353,38 +2564,425 @@ class Book:
         # Initialize the Book with a title and an Author object.
         self.title = title      
         self.author = author    # Composition: the Book directly includes an Author instance.
-        # Aggregation: the Book holds a list of chapters.
-        self.chapters = chapters if chapters is not None else []
+        # Aggregation: the Book holds a list of chapters (or a ChapterStore).
+        self._chapters = chapters if chapters is not None else []
+        # Caches kept in step with the chapter list, filled in lazily by _update():
+        #   _rendered[i]  is the "Chapter n: ..." line of chapter i
+        #   _page_ends[i] is the number of pages in chapters 0..i (a prefix sum)
+        #   _valid        is how many leading chapters the two lists above describe correctly
+        #   _text         is ((title, author line), full rendering) of the last rendering,
+        #                 or None when the chapters changed and it must be rebuilt
+        self._rendered = []
+        self._page_ends = []
+        self._valid = 0
+        self._known_length = len(self.chapters)
+        self._text = None
+        # Objects (such as a Library) told about chapters added to or removed from this book.
+        self._watchers = []
+
+    @property
+    def chapters(self):
+        return self._chapters
+
+    @chapters.setter
+    def chapters(self, chapters):
+        # Assigning a new chapter list drops the caches and is reported to the watchers.
+        for watcher in self._watchers:
+            for position, chapter in enumerate(self._chapters):
+                watcher.chapter_removed(self, position, chapter)
+        self._chapters = chapters
+        self._refresh_from(0)
+        for watcher in self._watchers:
+            for position, chapter in enumerate(chapters):
+                watcher.chapter_added(self, position, chapter)
+
+    def invalidate(self):
+        # Drop the cached rendering and page totals. Needed after changes the Book cannot see:
+        # book.chapters[i] = ..., sorting the list, or editing a chapter's title or num_pages.
+        self._refresh_from(0)
+
+    def _refresh_from(self, start):
+        # Mark the chapters from position 'start' onwards as changed; earlier ones stay cached.
+        self._valid = min(self._valid, start)
+        self._known_length = len(self.chapters)
+        self._text = None
+
+    def _update(self):
+        # Render and total only the chapters that changed since the last update.
+        if len(self.chapters) != self._known_length:
+            # The chapter list was changed directly rather than through add_chapter and friends.
+            self._refresh_from(0)
+        start = self._valid
+        if start == len(self.chapters) == len(self._rendered):
+            return
+        del self._rendered[start:]
+        del self._page_ends[start:]
+        total = self._page_ends[-1] if self._page_ends else 0
+        for number in range(start, len(self.chapters)):
+            chapter = self.chapters[number]
+            self._rendered.append(f"Chapter {number + 1}: {chapter}")
+            total += chapter.num_pages
+            self._page_ends.append(total)
+        self._valid = len(self.chapters)
+        self._text = None
 
     def add_chapter(self, chapter: 'Book.Chapter'):
-        # Adds a chapter to the book’s chapter list.
+        # Adds a chapter to the book’s chapter list; only the new chapter will be formatted.
         self.chapters.append(chapter)
+        self._refresh_from(len(self.chapters) - 1)
+        for watcher in self._watchers:
+            watcher.chapter_added(self, len(self.chapters) - 1, chapter)
+
+    def insert_chapter(self, index, chapter: 'Book.Chapter'):
+        # Inserts a chapter before position 'index'; the chapters after it are renumbered.
+        position = index + len(self.chapters) if index < 0 else index
+        position = max(0, min(position, len(self.chapters)))
+        self.chapters.insert(position, chapter)
+        self._refresh_from(position)
+        for watcher in self._watchers:
+            watcher.chapter_added(self, position, chapter)
+
+    def remove_chapter(self, index):
+        # Removes and returns the chapter at 'index'; the chapters after it are renumbered.
+        position = index + len(self.chapters) if index < 0 else index
+        chapter = self.chapters.pop(position)
+        self._refresh_from(position)
+        for watcher in self._watchers:
+            watcher.chapter_removed(self, position, chapter)
+        return chapter
+
+    def replace_chapter(self, index, chapter: 'Book.Chapter'):
+        # Replaces the chapter at 'index' and returns the old one; later chapters keep their cache.
+        position = index + len(self.chapters) if index < 0 else index
+        old_chapter = self.chapters[position]
+        self.chapters[position] = chapter
+        self._refresh_from(position)
+        for watcher in self._watchers:
+            watcher.chapter_removed(self, position, old_chapter)
+            watcher.chapter_added(self, position, chapter)
+        return old_chapter
+
+    @property
+    def total_pages(self):
+        # Total page count, read from the end of the prefix sum.
+        self._update()
+        return self._page_ends[-1] if self._page_ends else 0
+
+    def chapter_at_page(self, page):
+        # Returns the chapter containing page number 'page' (pages are numbered from 1).
+        if not 1 <= page <= self.total_pages:
+            raise IndexError(f"Page {page} is outside this book (1-{self.total_pages})")
+        return self.chapters[bisect_left(self._page_ends, page)]
 
     def __str__(self):
         # Provides a full description of the book including a numbered listing of chapters.
-        chapter_details = "\n  ".join(
-            f"Chapter {i + 1}: {chapter}" for i, chapter in enumerate(self.chapters)
-        )
-        return f"Book: {self.title}\n{self.author}\nChapters:\n  {chapter_details}"
+        # The title and author are public attributes, so the cached text is keyed on them too.
+        self._update()
+        heading = (self.title, str(self.author))
+        if self._text is None or self._text[0] != heading:
+            chapter_details = "\n  ".join(self._rendered)
+            self._text = (heading, f"Book: {heading[0]}\n{heading[1]}\nChapters:\n  {chapter_details}")
+        return self._text[1]
+
+# File-backed, append-only replacement for a Book's list of chapters.
+class ChapterStore:
+    # Each chapter is stored as a fixed header (title length, page count, text length)
+    # followed by the UTF-8 title and text.
+    RECORD = struct.Struct('<IIQ')
+
+    def __init__(self, path, cache_size=256):
+        # Open (or create) the store. Only the small record headers are scanned here, to find
+        # where each chapter starts; titles and texts are not decoded until a chapter is used.
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # chapter number -> Chapter, least recently used first
+        self._file = open(path, 'a+b')
+        self._map = None
+        self._stale = False  # True when chapters were appended after the file was mapped
+        self._offsets = array('Q')
+        self._remap()
+        position = 0
+        while position < len(self._map):
+            self._offsets.append(position)
+            title_length, _, text_length = self.RECORD.unpack_from(self._map, position)
+            position += self.RECORD.size + title_length + text_length
+
+    def _remap(self):
+        # (Re)map the whole file; needed after appends because a mapping has a fixed size.
+        if self._map is not None and len(self._map):
+            self._map.close()
+        self._file.flush()
+        size = self._file.seek(0, 2)
+        # mmap cannot map an empty file, so an empty store uses an empty buffer instead.
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._stale = False
+
+    def append(self, chapter):
+        # Write a chapter to the end of the file (this is what Book.add_chapter calls).
+        title = chapter.title.encode()
+        text = (chapter.text or '').encode()
+        self._offsets.append(self._file.seek(0, 2))
+        self._file.write(self.RECORD.pack(len(title), chapter.num_pages, len(text)) + title + text)
+        self._stale = True
+
+    def insert(self, index, chapter):
+        raise TypeError("ChapterStore is append-only")
+
+    def __setitem__(self, index, chapter):
+        raise TypeError("ChapterStore is append-only")
+
+    def pop(self, index=-1):
+        raise TypeError("ChapterStore is append-only")
+
+    def _load(self, number):
+        # Decode one chapter straight from the mapped file.
+        if self._stale:
+            self._remap()
+        position = self._offsets[number]
+        title_length, num_pages, text_length = self.RECORD.unpack_from(self._map, position)
+        start = position + self.RECORD.size
+        title = bytes(self._map[start:start + title_length]).decode()
+        text = bytes(self._map[start + title_length:start + title_length + text_length]).decode()
+        return Book.Chapter(title, num_pages, text or None)
+
+    def __getitem__(self, index):
+        # Return chapter 'index', from the LRU cache when possible.
+        if isinstance(index, slice):
+            return [self[number] for number in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ChapterStore index out of range")
+        chapter = self._cache.get(index)
+        if chapter is not None:
+            self._cache.move_to_end(index)
+            return chapter
+        chapter = self._cache[index] = self._load(index)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return chapter
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __iter__(self):
+        for number in range(len(self)):
+            yield self[number]
+
+    def close(self):
+        if len(self._map):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# Catalog of books with an author index and a word index over titles.
+class Library:
+    def __init__(self, books=()):
+        self._books_by_author = {}  # author name -> [Book, ...]
+        self._author_names = {}     # id(book) -> author name the book was filed under
+        # Inverted index: word -> {key: (book, chapter reference)}, see _reference() and _key().
+        # A None reference means the word is in the book's own title.
+        self._postings = {}
+        # key -> words it was indexed under, so it can be unindexed even after a title changes.
+        self._indexed_words = {}
+        # Sorted word lists for prefix searches. New words go into the small sorted _new_words
+        # batch, which is merged into _words once it outgrows about sqrt(len(_words)), so adding
+        # a word costs O(sqrt W) amortized. Removed words stay listed (searches skip them) until
+        # they make up half of _words. _listed is the set of words in either list.
+        self._words = []
+        self._new_words = []
+        self._listed = set()
+        self._dead_words = 0
+        for book in books:
+            self.add(book)
+
+    @staticmethod
+    def _tokens(title):
+        # Lower-cased words of a title, each listed once.
+        return set(re.findall(r"\w+", title.lower()))
+
+    @staticmethod
+    def _reference(book, position, chapter):
+        # How the index refers to a chapter. A ChapterStore rebuilds Chapter objects after they
+        # drop out of its cache, and holding them here would defeat that cache, so its chapters
+        # are referred to by position (stable, as the store is append-only) and read back when
+        # they are found. Chapters in a plain list are referred to directly.
+        return position if isinstance(book.chapters, ChapterStore) else chapter
+
+    @staticmethod
+    def _key(book, reference):
+        if reference is None:
+            return (id(book), None)
+        if isinstance(reference, int):
+            return (id(book), 'position', reference)
+        return (id(book), 'chapter', id(reference))
+
+    @staticmethod
+    def _resolve(entries):
+        # Turn (book, reference) index entries into (book, chapter or None) results.
+        return [(book, book.chapters[reference] if isinstance(reference, int) else reference)
+                for book, reference in entries]
+
+    def _index(self, title, book, reference):
+        key = self._key(book, reference)
+        words = self._tokens(title)
+        previous = self._indexed_words.get(key)
+        self._indexed_words[key] = tuple(words.union(previous) if previous else words)
+        for word in words:
+            entries = self._postings.get(word)
+            if entries is None:
+                entries = self._postings[word] = {}
+                self._list_word(word)
+            entries[key] = (book, reference)
+
+    def _unindex(self, book, reference):
+        key = self._key(book, reference)
+        for word in self._indexed_words.pop(key, ()):
+            entries = self._postings.get(word, {})
+            entries.pop(key, None)
+            if not entries and word in self._postings:
+                del self._postings[word]
+                self._dead_words += 1
+                if self._dead_words * 2 > len(self._words) + len(self._new_words):
+                    self._compact_words()
+
+    def _list_word(self, word):
+        # Called when 'word' gets its first posting.
+        if word in self._listed:
+            self._dead_words -= 1  # It was removed earlier but is still listed.
+            return
+        self._listed.add(word)
+        insort(self._new_words, word)
+        if len(self._new_words) ** 2 > max(len(self._words), 1 << 16):
+            self._words = list(merge(self._words, self._new_words))
+            self._new_words = []
+
+    def _compact_words(self):
+        # Drop removed words from the lists.
+        self._words = [word for word in merge(self._words, self._new_words) if word in self._postings]
+        self._new_words = []
+        self._listed = set(self._words)
+        self._dead_words = 0
+
+    def add(self, book):
+        # Catalog a book: index its author, its title and every chapter title, and
+        # watch it so chapters added later are indexed too.
+        self._books_by_author.setdefault(book.author.name, []).append(book)
+        self._author_names[id(book)] = book.author.name
+        self._index(book.title, book, None)
+        for position, chapter in enumerate(book.chapters):
+            self._index(chapter.title, book, self._reference(book, position, chapter))
+        book._watchers.append(self)
+
+    def remove(self, book):
+        # Take a book and all of its chapters out of the catalog. Everything is looked up by what
+        # was indexed, so renaming the book, its chapters or its author in the meantime is fine.
+        author_name = self._author_names.pop(id(book))
+        self._books_by_author[author_name].remove(book)
+        if not self._books_by_author[author_name]:
+            del self._books_by_author[author_name]
+        self._unindex(book, None)
+        for position, chapter in enumerate(book.chapters):
+            self._unindex(book, self._reference(book, position, chapter))
+        book._watchers.remove(self)
+
+    def chapter_added(self, book, position, chapter):
+        # Called by Book when a chapter is added at 'position'.
+        self._index(chapter.title, book, self._reference(book, position, chapter))
+
+    def chapter_removed(self, book, position, chapter):
+        # Called by Book when the chapter at 'position' is removed.
+        self._unindex(book, self._reference(book, position, chapter))
+
+    def books_by(self, author_name):
+        return list(self._books_by_author.get(author_name, []))
+
+    def search(self, term):
+        # (book, chapter) pairs whose title contains the word 'term'; chapter is None
+        # for a match on the book's own title.
+        return self._resolve(self._postings.get(term.lower(), {}).values())
+
+    def search_prefix(self, prefix):
+        # Like search(), for every indexed word starting with 'prefix'.
+        prefix = prefix.lower()
+        matches = {}
+        for words in (self._words, self._new_words):
+            position = bisect_left(words, prefix)
+            while position < len(words) and words[position].startswith(prefix):
+                matches.update(self._postings.get(words[position], {}))
+                position += 1
+        return self._resolve(matches.values())
 
 # --- Q5 OUTPUT ---
-print("Q5: Composition Over Inheritance: Create a Book class with a Author class")
-print("    included within it, demonstrating composition over inheritance.")
-print("___________________________________________________________________")
-# Create an Author instance.
-author = Author("Koyoharu Gotouge")
-# Create a Book instance, here representing Volume 1 of a manga.
-book = Book("Kimetsu no Yaiba: Volume 1", author)
-
-# Add chapters to the book along with their page counts.
-book.add_chapter(Book.Chapter("Cruelty", 55))
-book.add_chapter(Book.Chapter("The Stranger", 25))
-book.add_chapter(Book.Chapter("Return by Dawn", 23))
-book.add_chapter(Book.Chapter("Tanjiro's Journal, Part One", 19))
-book.add_chapter(Book.Chapter("Tanjiro's Journal, Part Two", 19))
-book.add_chapter(Book.Chapter("A Mountain of Hands", 19))
-book.add_chapter(Book.Chapter("Spirits of the Deceased", 21))
-
-print(book)
-
-print("\n==================================================================")
\ No newline at end of file
+def demo_q5():
+    # Runs the Q5 demonstration. It is only called when this file is executed
+    # directly, so importing the file defines the classes without printing anything.
+    print("Q5: Composition Over Inheritance: Create a Book class with a Author class")
+    print("    included within it, demonstrating composition over inheritance.")
+    print("___________________________________________________________________")
+    # Create an Author instance.
+    author = Author("Koyoharu Gotouge")
+    # Create a Book instance, here representing Volume 1 of a manga.
+    book = Book("Kimetsu no Yaiba: Volume 1", author)
+
+    # Add chapters to the book along with their page counts.
+    book.add_chapter(Book.Chapter("Cruelty", 55))
+    book.add_chapter(Book.Chapter("The Stranger", 25))
+    book.add_chapter(Book.Chapter("Return by Dawn", 23))
+    book.add_chapter(Book.Chapter("Tanjiro's Journal, Part One", 19))
+    book.add_chapter(Book.Chapter("Tanjiro's Journal, Part Two", 19))
+    book.add_chapter(Book.Chapter("A Mountain of Hands", 19))
+    book.add_chapter(Book.Chapter("Spirits of the Deceased", 21))
+
+    print(book)
+
+    # Look up chapters by page number using the running page totals.
+    print(f"\nTotal pages: {book.total_pages}")
+    print(f"Page 1 is in: {book.chapter_at_page(1)}")
+    print(f"Page 56 is in: {book.chapter_at_page(56)}")
+    print(f"Page {book.total_pages} is in: {book.chapter_at_page(book.total_pages)}")
+
+    # Insert and remove chapters; only the chapters after the change are re-rendered.
+    book.insert_chapter(1, Book.Chapter("Bonus Sketches", 4))
+    print(f"\nAfter inserting a chapter at position 2:\n{book}")
+    book.remove_chapter(1)
+    print(f"\nAfter removing it again, total pages: {book.total_pages}")
+
+    # Catalog books and search their titles.
+    print("\n------ Searching a Library ------")
+    volume_two = Book("Kimetsu no Yaiba: Volume 2", author)
+    library = Library([book, volume_two])
+    volume_two.add_chapter(Book.Chapter("It's Tanjiro Kamado!!", 19))
+    print(f"Books by {author.name}: {[listed.title for listed in library.books_by(author.name)]}")
+    for found_book, chapter in library.search("tanjiro"):
+        print(f"  'tanjiro' -> {found_book.title}: {chapter}")
+    for found_book, chapter in library.search_prefix("journ"):
+        print(f"  'journ*'  -> {found_book.title}: {chapter}")
+    print(f"  'volume'  -> {len(library.search('volume'))} book titles")
+
+    # Keep a large series on disk and let the Book read chapters only when it needs them.
+    print("\n------ Storing chapters on disk ------")
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as folder:
+        store_path = os.path.join(folder, "series.chapters")
+        with ChapterStore(store_path) as store:
+            for number in range(1, 20_001):
+                store.append(Book.Chapter(f"Chapter Title {number}", 20 + number % 7, f"Text of chapter {number}."))
+        with ChapterStore(store_path, cache_size=100) as store:
+            series = Book("Kimetsu no Yaiba: Collected Edition", author, store)
+            series.add_chapter(Book.Chapter("Epilogue", 12, "The end."))
+            print(f"Chapters on disk: {len(store)}, cached in memory: {len(store._cache)}")
+            print(f"Page 1000 is in: {series.chapter_at_page(1000)}")
+            print(f"Text of the last chapter: {store[-1].text}")
+            print("\n".join(str(series).splitlines()[:5]))
+            print(f"Chapters cached after printing the whole book: {len(store._cache)}")
+
+if __name__ == "__main__":
+    demo_q5()
+    print("\n==================================================================")
\ No newline at end of file
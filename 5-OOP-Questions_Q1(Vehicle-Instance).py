@@ -13,8 +13,26 @@
 #
 # Note: The commented-out line shows an example of what happens if you try to call a
 # method (start_engine) on an instance that doesn’t have it, which would raise an AttributeError.
+#
+# A 'Fleet' container indexes many vehicles by their exact class and by model year, and keeps running
+# seating-capacity totals per class. Questions like "all SchoolBus instances" or "total capacity" follow the
+# class hierarchy (Vehicle -> SchoolBus) through those indexes instead of checking every vehicle.
+#
+# Starting an engine can also be done asynchronously (start_engine_async), which simulates a round-trip to a
+# telematics service. 'EngineStartDispatcher' starts many vehicles concurrently with a concurrency limit,
+# per-call timeouts and retries, and reports percentiles of the start latency and of the time spent queued.
+#
+# 'SchoolBusPlanner' uses each SchoolBus's capacity to seat the students of many schools, using a
+# first-fit-decreasing heuristic over sorted capacity lists to keep the number of buses low.
+
+import math
+import time
+from bisect import bisect_left, insort
 
 class Vehicle:
+    # Simulated telematics round-trip time (seconds) used by start_engine_async.
+    telematics_delay = 0.01
+
     def __init__(self, name, model):
         # Initialize the protected attributes.
         # Using a single underscore (_name, _model) signals that these should not be accessed directly.
@@ -29,6 +47,14 @@ class Vehicle:
         # Simulates the action of starting the vehicle's engine.
         return "Engine started."
 
+    async def start_engine_async(self):
+        # Asynchronous variant of start_engine: waits for the (simulated) telematics
+        # round-trip without blocking other vehicles, then starts the engine.
+        # asyncio is imported where it is used so that importing this module stays fast.
+        import asyncio
+        await asyncio.sleep(self.telematics_delay)
+        return self.start_engine()
+
 class SchoolBus(Vehicle):
     def __init__(self, name, model, capacity):
         # Call the parent constructor to initialize shared attributes: name and model.
@@ -40,6 +66,193 @@ class SchoolBus(Vehicle):
         # Overrides the parent's __str__ method to include capacity information.
         return f"INFO: {self._name} School Bus, made in {self._model}, with a capacity of {self.capacity} passengers."
 
+# Container that indexes vehicles by class and by model.
+class Fleet:
+    def __init__(self, vehicles=()):
+        # Each index maps a key to {id(vehicle): vehicle}, which keeps insertion order
+        # and makes removal O(1).
+        self._by_class = {}
+        self._by_model = {}
+        self._capacity_by_class = {}
+        self._count = 0
+        for vehicle in vehicles:
+            self.add(vehicle)
+
+    def add(self, vehicle):
+        # Register a vehicle under its exact class and its model year. Adding a vehicle that is
+        # already in the fleet does nothing.
+        if not isinstance(vehicle, Vehicle):
+            raise TypeError("Fleet can only hold Vehicle instances")
+        cls = type(vehicle)
+        same_class = self._by_class.setdefault(cls, {})
+        if id(vehicle) in same_class:
+            return
+        same_class[id(vehicle)] = vehicle
+        self._by_model.setdefault(vehicle._model, {})[id(vehicle)] = vehicle
+        self._capacity_by_class[cls] = self._capacity_by_class.get(cls, 0) + getattr(vehicle, 'capacity', 0)
+        self._count += 1
+
+    def remove(self, vehicle):
+        # Remove a vehicle from every index (KeyError if it is not in the fleet).
+        cls = type(vehicle)
+        del self._by_class[cls][id(vehicle)]
+        del self._by_model[vehicle._model][id(vehicle)]
+        self._capacity_by_class[cls] -= getattr(vehicle, 'capacity', 0)
+        self._count -= 1
+
+    def _classes(self, cls, include_subclasses):
+        # The indexed classes a query covers. This loops over classes, never over vehicles.
+        if not include_subclasses:
+            return [cls] if cls in self._by_class else []
+        return [indexed for indexed in self._by_class if issubclass(indexed, cls)]
+
+    def of_type(self, cls=Vehicle, include_subclasses=True):
+        # Iterate over every vehicle of class 'cls' (and, by default, its subclasses).
+        for indexed in self._classes(cls, include_subclasses):
+            yield from self._by_class[indexed].values()
+
+    def count(self, cls=Vehicle, include_subclasses=True):
+        return sum(len(self._by_class[indexed]) for indexed in self._classes(cls, include_subclasses))
+
+    def total_capacity(self, cls=Vehicle, include_subclasses=True):
+        # Seating capacity of the selected classes, read from the running totals.
+        return sum(self._capacity_by_class[indexed] for indexed in self._classes(cls, include_subclasses))
+
+    def of_model(self, model):
+        # All vehicles with the given model year.
+        return list(self._by_model.get(model, {}).values())
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return self.of_type(Vehicle)
+
+# Starts many vehicles concurrently.
+class EngineStartDispatcher:
+    def __init__(self, concurrency=100, timeout=1.0, retries=2, backoff=0.05):
+        # concurrency: at most this many start requests are in flight at once.
+        # timeout: seconds allowed for a single attempt.
+        # retries: extra attempts after a failure; the wait before retry n is backoff * 2 ** n.
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+
+    async def _start(self, vehicle, semaphore, report):
+        # Start one vehicle, retrying failed or timed-out attempts. Returns (latency, queue wait,
+        # error): the latency is the duration of the successful attempt alone (timed once the
+        # semaphore is held), and the queue wait is the total time spent waiting for the semaphore.
+        import asyncio
+        queue_wait = 0.0
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+            report['attempts'] += 1
+            queued = time.perf_counter()
+            try:
+                async with semaphore:
+                    began = time.perf_counter()
+                    queue_wait += began - queued
+                    await asyncio.wait_for(vehicle.start_engine_async(), self.timeout)
+                    return time.perf_counter() - began, queue_wait, None
+            except asyncio.TimeoutError:
+                error = f"timed out after {self.timeout}s"
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+        return None, queue_wait, error
+
+    async def dispatch(self, vehicles):
+        # Start every vehicle (any iterable, such as a Fleet) and return a report with the
+        # number started, the failures, total attempts, wall time, and percentiles of the start
+        # latency (successful attempts) and of the queue wait (every vehicle).
+        import asyncio
+        vehicles = list(vehicles)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        report = {'started': 0, 'failed': [], 'attempts': 0}
+        began = time.perf_counter()
+        outcomes = await asyncio.gather(*(self._start(vehicle, semaphore, report) for vehicle in vehicles))
+        report['wall_time'] = time.perf_counter() - began
+        latencies = []
+        for vehicle, (latency, _, error) in zip(vehicles, outcomes):
+            if error is None:
+                report['started'] += 1
+                latencies.append(latency)
+            else:
+                report['failed'].append((vehicle, error))
+        report['latency'] = self.percentiles(latencies)
+        report['queue_wait'] = self.percentiles([queue_wait for _, queue_wait, _ in outcomes])
+        return report
+
+    def run(self, vehicles):
+        # Synchronous entry point: runs dispatch() in a fresh event loop.
+        import asyncio
+        return asyncio.run(self.dispatch(vehicles))
+
+    @staticmethod
+    def percentiles(values, points=(50, 90, 99)):
+        # Nearest-rank percentiles of 'values' (seconds), plus the maximum.
+        ordered = sorted(values)
+        if not ordered:
+            return {}
+        result = {f"p{p}": ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)] for p in points}
+        result['max'] = ordered[-1]
+        return result
+
+# Assigns students from many schools to a set of school buses.
+class SchoolBusPlanner:
+    def __init__(self, buses):
+        self.buses = list(buses)
+        # A bus without seats would never reduce a school's remaining riders.
+        for bus in self.buses:
+            if bus.capacity <= 0:
+                raise ValueError(f"Bus capacity must be positive, got {bus.capacity} for {bus._name}")
+
+    def assign(self, schools):
+        # 'schools' maps a school name to its number of riders, or to a roster (anything with a
+        # len(), such as a list of grades or a School). Schools are placed largest first. Each school goes into
+        # the already-used bus whose free seats fit it most tightly; if none fits, the smallest
+        # unused bus that holds the whole school is taken. A school is only split across buses
+        # when it is bigger than every remaining bus.
+        riders = {name: value if isinstance(value, int) else len(value) for name, value in schools.items()}
+        for name, need in riders.items():
+            if need < 0:
+                raise ValueError(f"Rider count must not be negative, got {need} for {name}")
+        unused = sorted((bus.capacity, number) for number, bus in enumerate(self.buses))
+        free_seats = []  # sorted (free seats, bus number) for buses already in use
+        loads = {}
+        unassigned = {}
+        for name, need in sorted(riders.items(), key=lambda item: item[1], reverse=True):
+            while need:
+                position = bisect_left(free_seats, (need, -1))
+                if position < len(free_seats):
+                    seats, number = free_seats.pop(position)
+                elif unused and unused[-1][0] >= need:
+                    seats, number = unused.pop(bisect_left(unused, (need, -1)))
+                elif unused:
+                    seats, number = unused.pop()  # Largest unused bus; the school will be split.
+                elif free_seats:
+                    seats, number = free_seats.pop()  # Out of buses: use the biggest leftover space.
+                else:
+                    unassigned[name] = need
+                    break
+                placed = min(seats, need)
+                loads.setdefault(number, []).append((name, placed))
+                need -= placed
+                if seats > placed:
+                    insort(free_seats, (seats - placed, number))
+
+        assignments = {self.buses[number]: load for number, load in sorted(loads.items())}
+        seated = sum(riders.values()) - sum(unassigned.values())
+        capacity = sum(bus.capacity for bus in assignments)
+        return {
+            'assignments': assignments,
+            'buses_used': len(assignments),
+            'unassigned': unassigned,
+            'utilisation': seated / capacity if capacity else 0.0,
+        }
+
 # Unrelated class that does not derive from Vehicle.
 class Fruit:
     def __init__(self, name, color):
@@ -52,19 +265,82 @@ class Fruit:
         return f"INFO: {self.color} {self.name}"
 
 # --- Q1 OUTPUT ---
-print("\nQ1: Determine if School bus is also an instance of the Vehicle class")
-print("___________________________________________________________________")
-print("------ Testing with a Vehicle instance ------")
-bus = SchoolBus("Mitsubishi L300XV", "2014", 17)  # Create a SchoolBus instance.
-print(bus.start_engine())  # Inherited method from Vehicle demonstrating abstraction.
-print(bus)                 # Demonstrates polymorphism: the overridden __str__ method is called.
-print(f"Is {bus._name} School Bus an instance of Vehicle?", isinstance(bus, Vehicle))
-
-print("\n------ Testing with a Non-Vehicle instance ------")
-fruit = Fruit("Apple", "Red")  # Create a Fruit instance.
-print(fruit)                   # Uses its own __str__ method from the Fruit class.
-print(f"Is {fruit.name} an instance of Vehicle?", isinstance(fruit, Vehicle))
-
-# Uncommenting the next line would raise an AttributeError because 'fruit'
-# does not have a start_engine method (since it is not a Vehicle).
-# print(fruit.start_engine())
\ No newline at end of file
+def demo_q1():
+    # Runs the Q1 demonstration. It is only called when this file is executed
+    # directly, so importing the file defines the classes without printing anything.
+    print("\nQ1: Determine if School bus is also an instance of the Vehicle class")
+    print("___________________________________________________________________")
+    print("------ Testing with a Vehicle instance ------")
+    bus = SchoolBus("Mitsubishi L300XV", "2014", 17)  # Create a SchoolBus instance.
+    print(bus.start_engine())  # Inherited method from Vehicle demonstrating abstraction.
+    print(bus)                 # Demonstrates polymorphism: the overridden __str__ method is called.
+    print(f"Is {bus._name} School Bus an instance of Vehicle?", isinstance(bus, Vehicle))
+
+    print("\n------ Testing with a Non-Vehicle instance ------")
+    fruit = Fruit("Apple", "Red")  # Create a Fruit instance.
+    print(fruit)                   # Uses its own __str__ method from the Fruit class.
+    print(f"Is {fruit.name} an instance of Vehicle?", isinstance(fruit, Vehicle))
+
+    # Uncommenting the next line would raise an AttributeError because 'fruit'
+    # does not have a start_engine method (since it is not a Vehicle).
+    # print(fruit.start_engine())
+
+    # Keep a mixed fleet in an indexed registry and query it by class and by model year.
+    print("\n------ Testing with a Fleet ------")
+    fleet = Fleet([bus, Vehicle("Toyota Hiace", "2014"), SchoolBus("Isuzu NQR", "2019", 30)])
+    fleet.add(SchoolBus("Hino Blue Ribbon", "2014", 45))
+    print("Vehicles in the fleet:", len(fleet))
+    print("School buses:", fleet.count(SchoolBus))
+    print("Plain vehicles only:", fleet.count(Vehicle, include_subclasses=False))
+    print("Total seating capacity:", fleet.total_capacity())
+    print("Vehicles from 2014:", len(fleet.of_model("2014")))
+    for school_bus in fleet.of_type(SchoolBus):
+        print(" ", school_bus)
+    try:
+        fleet.add(fruit)
+    except TypeError as error:
+        print("ERROR:", error)
+
+    # Start a large fleet concurrently; total time is bounded by the concurrency limit rather than
+    # by the sum of every vehicle's round-trip.
+    print("\n------ Starting a fleet concurrently ------")
+    import random
+
+    import asyncio
+
+    class UnreliableBus(SchoolBus):
+        # Stand-in for a bus with a slow, flaky telematics link.
+        async def start_engine_async(self):
+            if random.random() < 0.2:
+                await asyncio.sleep(1)  # Longer than the dispatcher's timeout.
+            return await super().start_engine_async()
+
+    random.seed(1)
+    big_fleet = Fleet(SchoolBus(f"Bus {number}", "2020", 40) for number in range(2_000))
+    for number in range(50):
+        big_fleet.add(UnreliableBus(f"Unreliable {number}", "2012", 20))
+    report = EngineStartDispatcher(concurrency=500, timeout=0.1, retries=2, backoff=0.01).run(big_fleet)
+    print(f"Started {report['started']} of {len(big_fleet)} vehicles in {report['wall_time']:.2f}s "
+          f"({report['attempts']} attempts; one at a time would take ~{len(big_fleet) * Vehicle.telematics_delay:.0f}s)")
+    print("Latency:", ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in report['latency'].items()))
+    print("Queue wait:", ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in report['queue_wait'].items()))
+    for vehicle, error in report['failed']:
+        print(f"  FAILED {vehicle._name}: {error}")
+
+    # Seat the students of several schools on the fleet's buses.
+    print("\n------ Assigning students to school buses ------")
+    planner = SchoolBusPlanner(fleet.of_type(SchoolBus))
+    plan = planner.assign({"Greenwood High": [88, 92, 79, 85, 91], "Maple Leaf School": 40, "Riverside": 22})
+    for school_bus, load in plan['assignments'].items():
+        print(f"  {school_bus._name} ({school_bus.capacity} seats): {load}")
+    print(f"  Buses used: {plan['buses_used']}, utilisation: {plan['utilisation']:.0%}, unassigned: {plan['unassigned']}")
+
+    district_buses = [SchoolBus(f"Bus {number}", "2020", random.choice([17, 30, 45, 60])) for number in range(4_000)]
+    district_schools = {f"School {number}": random.randint(20, 400) for number in range(600)}
+    start = time.perf_counter()
+    plan = SchoolBusPlanner(district_buses).assign(district_schools)
+    print(f"  {sum(district_schools.values()):,} students on {plan['buses_used']:,} of {len(district_buses):,} buses "
+          f"in {time.perf_counter() - start:.3f}s, utilisation {plan['utilisation']:.1%}")
+
+if __name__ == "__main__":
+    demo_q1()
\ No newline at end of file
@@ -11,8 +11,69 @@
 #
 # The multiple ways to construct an instance showcase the flexibility of class methods
 # in providing alternate constructors for different data representations.
+#
+# For large imports there are streaming versions of these constructors (iter_from_lines, iter_from_csv and
+# iter_from_jsonl). They are generators that read the file in large buffered chunks, yield one Employee at
+# a time, and collect malformed rows into a reject list instead of stopping at the first bad row.
+#
+# 'EmployeeDirectory' is a container that indexes employees by emp_id (a dict, so lookups are O(1)) and by
+# department (one dict per department), keeping both indexes consistent on insert, update and delete.
+#
+# 'EmployeeTable' is a memory-compact alternative to a list of Employee objects. It keeps one array per field
+# (struct of arrays): ids as integers, departments as small integer codes, and all names packed into one byte
+# pool. Rows are handed out as read-only EmployeeRecord views with the same attributes and display_info() as
+# Employee objects. The views are not Employee subclasses, so they can use __slots__ and carry no __dict__.
+#
+# Valid departments live in a 'DepartmentRegistry' (a set, so checks are O(1)) that can be changed at run
+# time. It can also validate a whole column of departments at once, and the constructors accept strict=True
+# to reject employees whose department is not registered.
+#
+# 'EmployeeSnapshot' saves a collection of employees in a compact binary file (versioned header, fixed-width
+# records, a string pool and a sorted id index). Reopening it maps the file with mmap, so startup does no
+# parsing at all and each record is only decoded when it is accessed.
+#
+# 'EmployeeReportWriter' renders many employees (display_info text, CSV or JSON Lines) into one reusable
+# in-memory buffer and writes it to the output file in large blocks instead of one write per line.
+
+import csv
+import io
+import json
+import mmap
+import struct
+from array import array
+from collections import Counter
+
+class DepartmentRegistry:
+    def __init__(self, departments=()):
+        # The registered departments, kept in a set for constant-time membership checks.
+        self._departments = set(departments)
+
+    def add(self, department):
+        self._departments.add(department)
+
+    def remove(self, department):
+        self._departments.discard(department)
+
+    def __contains__(self, department):
+        return department in self._departments
+
+    def __iter__(self):
+        return iter(sorted(self._departments))
+
+    def validate_batch(self, departments):
+        # Validate a whole column of departments. Each distinct value is looked up only once;
+        # returns (validity mask in input order, {department: number of occurrences}).
+        departments = list(departments)
+        counts = Counter(departments)
+        valid = {department: department in self._departments for department in counts}
+        return list(map(valid.__getitem__, departments)), dict(counts)
+
 
 class Employee:
+    # Registry used by is_valid_department and by strict construction; change it at run time
+    # with Employee.departments.add(...) / remove(...).
+    departments = DepartmentRegistry(['HR', 'IT', 'Marketing', 'Finance'])
+
     def __init__(self, emp_id, name, department):
         # Primary constructor that initializes an Employee's attributes.
         self.emp_id = emp_id          
@@ -20,50 +81,592 @@ class Employee:
         self.department = department  
 
     @classmethod
-    def from_string(cls, emp_str):
+    def from_string(cls, emp_str, strict=False):
         # Alternative constructor that expects a string formatted as "emp_id-name-department".
-        emp_id, name, department = emp_str.split('-')
+        # The id is everything before the first '-' and the department everything after the last,
+        # so hyphenated names such as "002-Mary-Jane-HR" are kept whole.
+        emp_id, _, rest = emp_str.partition('-')
+        name, _, department = rest.rpartition('-')
+        if not emp_id or not name or not department:
+            raise ValueError(f"Expected 'emp_id-name-department', got {emp_str!r}")
+        if strict:
+            cls._check_department(department)
         return cls(emp_id, name, department)
 
     @classmethod
-    def from_dict(cls, emp_dict):
+    def from_dict(cls, emp_dict, strict=False):
         # Alternative constructor that expects a dictionary with keys: 'emp_id', 'name', 'department'.
+        if strict:
+            cls._check_department(emp_dict['department'])
         return cls(emp_dict['emp_id'], emp_dict['name'], emp_dict['department'])
 
+    @classmethod
+    def _check_department(cls, department):
+        # Strict mode: refuse departments that are not in the registry.
+        if department not in cls.departments:
+            raise ValueError(f"Unknown department {department!r}")
+
+    # Roughly how many bytes of input the streaming constructors read per chunk.
+    READ_CHUNK_SIZE = 1 << 20
+
+    @staticmethod
+    def _read_chunks(fileobj):
+        # Yield lists of lines, about READ_CHUNK_SIZE bytes at a time, so a file of any size is
+        # read in a few large reads without ever holding all of it in memory.
+        return iter(lambda: fileobj.readlines(Employee.READ_CHUNK_SIZE), [])
+
+    @classmethod
+    def iter_from_lines(cls, fileobj, rejects=None, strict=False):
+        # Streaming version of from_string: yields one Employee per "emp_id-name-department" line.
+        # Malformed lines are appended to 'rejects' (if given) as (line number, line, reason).
+        # With strict=True, rows with an unregistered department are rejected as well.
+        departments = cls.departments
+        line_number = 0
+        for lines in cls._read_chunks(fileobj):
+            for line in lines:
+                line_number += 1
+                line = line.strip()
+                if not line:
+                    continue
+                # Same parsing as from_string, inlined to avoid a method call per row.
+                emp_id, _, rest = line.partition('-')
+                name, _, department = rest.rpartition('-')
+                if not (emp_id and name and department):
+                    reason = "expected 'emp_id-name-department'"
+                elif strict and department not in departments:
+                    reason = f"unknown department {department!r}"
+                else:
+                    yield cls(emp_id, name, department)
+                    continue
+                if rejects is not None:
+                    rejects.append((line_number, line, reason))
+
+    @classmethod
+    def iter_from_csv(cls, fileobj, rejects=None, strict=False):
+        # Streaming constructor for CSV files whose header names the emp_id, name and department columns.
+        reader = csv.reader(line for lines in cls._read_chunks(fileobj) for line in lines)
+        header = next(reader, None)
+        if header is None:
+            return
+        try:
+            columns = [header.index(key) for key in ('emp_id', 'name', 'department')]
+        except ValueError:
+            raise ValueError("CSV header must contain emp_id, name and department") from None
+        for row in reader:
+            if not row:
+                continue
+            try:
+                emp_id, name, department = (row[column] for column in columns)
+            except IndexError:
+                reason = "missing columns"
+            else:
+                if not strict or department in cls.departments:
+                    yield cls(emp_id, name, department)
+                    continue
+                reason = f"unknown department {department!r}"
+            if rejects is not None:
+                rejects.append((reader.line_num, ','.join(row), reason))
+
+    @classmethod
+    def iter_from_jsonl(cls, fileobj, rejects=None, strict=False):
+        # Streaming version of from_dict for JSON Lines files (one JSON object per line).
+        line_number = 0
+        for lines in cls._read_chunks(fileobj):
+            for line in lines:
+                line_number += 1
+                if not line.strip():
+                    continue
+                # Only the parsing is guarded: errors raised by the consumer while the generator
+                # is suspended at 'yield' must not be recorded as rejected rows.
+                try:
+                    employee = cls.from_dict(json.loads(line), strict)
+                except (ValueError, KeyError, TypeError) as error:
+                    if rejects is not None:
+                        rejects.append((line_number, line.strip(), f"{type(error).__name__}: {error}"))
+                    continue
+                yield employee
+
     @staticmethod
     def is_valid_department(department):
         # Static method to validate if the given department is one of the allowed ones.
-        valid_departments = ['HR', 'IT', 'Marketing', 'Finance']
-        return department in valid_departments
+        return department in Employee.departments
 
     def display_info(self):
         # Instance method to return a formatted string containing employee information.
         return f"Employee ID: {self.emp_id}, Name: {self.name}, Department: {self.department}"
 
 
-print("Q2: Build a class Employee with multiple constructors")
-print("___________________________________________________________________")
-
-# Using the primary constructor:
-print("\nUsing __init__:")
-emp1 = Employee("001", "Alice", "IT")  # Initializing using __init__
-print(emp1.display_info())
-print("METHOD: initialized using __init__ | Employee('001', 'Alice', 'IT')")
-
-# Using the alternative constructor from a string:
-print("\nUsing from_string:")
-emp1 = Employee.from_string("001-Alice-IT")  # Reassigning emp1 using from_string
-print(emp1.display_info())
-print("METHOD: initialized using from_string() | Employee.from_string('001-Alice-IT')")
-
-# Using the alternative constructor from a dictionary:
-print("\nUsing from_dict:")
-emp1 = Employee.from_dict({'emp_id': "001", 'name': "Alice", 'department': "IT"})  # Reassigning emp1 using from_dict
-print(emp1.display_info())
-print("METHOD: initialized using from_dict() | Employee.from_dict({'emp_id': '001', 'name': 'Alice', 'department': 'IT'})")
-
-# Demonstrate the use of the static method is_valid_department:
-print("\nUsing is_valid_department:")
-dept_to_check = "IT"
-is_valid = Employee.is_valid_department(dept_to_check)
-print(f"Department '{dept_to_check}' is valid: {is_valid}")
+class EmployeeRecord:
+    # A read-only view onto one row of an EmployeeTable; fields are read on access. It does not
+    # inherit from Employee (whose instances have a __dict__), so __slots__ keeps it to two fields.
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    @property
+    def emp_id(self):
+        return self._table._emp_id(self._row)
+
+    @property
+    def name(self):
+        return self._table._name(self._row)
+
+    @property
+    def department(self):
+        return self._table._departments[self._table._department_codes[self._row]]
+
+    # Same formatting as an Employee.
+    display_info = Employee.display_info
+
+
+class EmployeeTable:
+    def __init__(self, employees=()):
+        # emp_id "000042" is stored as the integer 42 plus its width (6) so leading zeros survive.
+        self._ids = array('q')
+        self._id_widths = array('B')
+        # Each department string is stored once; rows keep a small code into _departments.
+        self._departments = []
+        self._department_codes_by_name = {}
+        self._department_codes = array('H')
+        # All names are UTF-8 encoded into one pool; row i spans _name_offsets[i]:_name_offsets[i + 1].
+        self._name_pool = bytearray()
+        self._name_offsets = array('Q', [0])
+        self.extend(employees)
+
+    def append(self, employee):
+        # Every field is checked and encoded before any column changes, so a bad row leaves
+        # the columns untouched (and all the same length).
+        emp_id = employee.emp_id
+        if not isinstance(emp_id, str) or not emp_id.isdigit():
+            raise ValueError(f"EmployeeTable needs numeric emp_id strings, got {emp_id!r}")
+        if len(emp_id) > 255:
+            raise ValueError("EmployeeTable emp_id strings can be at most 255 digits long")
+        value = int(emp_id)
+        if value >= 1 << 63:
+            raise ValueError(f"EmployeeTable emp_id {emp_id!r} is too large")
+        name = employee.name.encode()
+        department = employee.department
+        code = self._department_codes_by_name.get(department)
+        if code is None:
+            if len(self._departments) > 0xFFFF:
+                raise ValueError("EmployeeTable can hold at most 65536 departments")
+            code = len(self._departments)
+        self._ids.append(value)
+        self._id_widths.append(len(emp_id))
+        if code == len(self._departments):
+            self._department_codes_by_name[department] = code
+            self._departments.append(department)
+        self._department_codes.append(code)
+        self._name_pool += name
+        self._name_offsets.append(len(self._name_pool))
+
+    def extend(self, employees):
+        for employee in employees:
+            self.append(employee)
+
+    def _emp_id(self, row):
+        return str(self._ids[row]).zfill(self._id_widths[row])
+
+    def _name(self, row):
+        return self._name_pool[self._name_offsets[row]:self._name_offsets[row + 1]].decode()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, row):
+        # Return a lightweight view of one row (negative indexes count from the end).
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("EmployeeTable index out of range")
+        return EmployeeRecord(self, row)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield EmployeeRecord(self, row)
+
+    def nbytes(self):
+        # Bytes used by the column storage (the department list is a handful of shared strings).
+        columns = (self._ids, self._id_widths, self._department_codes, self._name_offsets)
+        return sum(column.itemsize * len(column) for column in columns) + len(self._name_pool)
+
+
+class EmployeeSnapshot:
+    # File layout (all integers little-endian):
+    #   header      magic, format version, record count, department count and section offsets
+    #   records     one fixed-width entry per employee: (id offset, id length, name offset,
+    #               name length, department code); offsets point into the string pool
+    #   departments (offset, length) of each department name in the string pool
+    #   pool        UTF-8 bytes of every id, name and department
+    #   index       record numbers sorted by emp_id, for binary-search lookups
+    MAGIC = b'EMPS'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHxxQQQQQQ')
+    # Record and department entry layouts for every format version this class can read.
+    RECORD_FORMATS = {1: struct.Struct('<QIQIH')}
+    DEPARTMENT_FORMATS = {1: struct.Struct('<QI')}
+    INDEX_ENTRY = struct.Struct('<Q')
+
+    @classmethod
+    def write(cls, path, employees):
+        # Write 'employees' (any iterable) in a single pass: records stream straight to the file
+        # while the string pool and id index are collected; the header is filled in at the end.
+        record = cls.RECORD_FORMATS[cls.VERSION]
+        department_entry = cls.DEPARTMENT_FORMATS[cls.VERSION]
+        pool = bytearray()
+        department_codes = {}
+        ids = []
+        with open(path, 'wb') as out:
+            out.write(bytes(cls.HEADER.size))
+            for employee in employees:
+                emp_id = employee.emp_id.encode()
+                name = employee.name.encode()
+                code = department_codes.setdefault(employee.department, len(department_codes))
+                out.write(record.pack(len(pool), len(emp_id), len(pool) + len(emp_id), len(name), code))
+                pool += emp_id
+                pool += name
+                ids.append(emp_id)
+            departments_offset = out.tell()
+            for department in department_codes:
+                encoded = department.encode()
+                out.write(department_entry.pack(len(pool), len(encoded)))
+                pool += encoded
+            pool_offset = out.tell()
+            out.write(pool)
+            index_offset = out.tell()
+            for number in sorted(range(len(ids)), key=ids.__getitem__):
+                out.write(cls.INDEX_ENTRY.pack(number))
+            out.seek(0)
+            out.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(ids), len(department_codes),
+                                      cls.HEADER.size, departments_offset, pool_offset, index_offset))
+        return len(ids)
+
+    def __init__(self, path):
+        # Open a snapshot. Only the header and the (tiny) department table are read here.
+        # Any problem with the file raises ValueError, with the file already closed again.
+        self._file = open(path, 'rb')
+        self._map = None
+        try:
+            self._open(path)
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self, path):
+        size = self._file.seek(0, 2)
+        if size < self.HEADER.size:
+            raise ValueError(f"{path!r} is not an employee snapshot (only {size} bytes)")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self._count, department_count, self._records_offset,
+         departments_offset, self._pool_offset, self._index_offset) = self.HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC:
+            raise ValueError(f"{path!r} is not an employee snapshot")
+        if version not in self.RECORD_FORMATS:
+            raise ValueError(f"Unsupported employee snapshot version {version}")
+        if self._index_offset + self._count * self.INDEX_ENTRY.size > size:
+            raise ValueError(f"{path!r} is truncated")
+        self.version = version
+        self._record = self.RECORD_FORMATS[version]
+        department_entry = self.DEPARTMENT_FORMATS[version]
+        self._departments = [
+            self._string(*department_entry.unpack_from(self._map, departments_offset + i * department_entry.size))
+            for i in range(department_count)
+        ]
+
+    def _string(self, offset, length):
+        start = self._pool_offset + offset
+        return self._map[start:start + length].decode()
+
+    def _unpack(self, number):
+        return self._record.unpack_from(self._map, self._records_offset + number * self._record.size)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, number):
+        # Decode record 'number' into an Employee (only this record is read).
+        if number < 0:
+            number += self._count
+        if not 0 <= number < self._count:
+            raise IndexError("EmployeeSnapshot index out of range")
+        id_offset, id_length, name_offset, name_length, code = self._unpack(number)
+        return Employee(self._string(id_offset, id_length), self._string(name_offset, name_length),
+                        self._departments[code])
+
+    def __iter__(self):
+        for number in range(self._count):
+            yield self[number]
+
+    def find(self, emp_id):
+        # Binary search of the id index; returns the Employee or None. Only about
+        # log2(len) ids are decoded along the way.
+        target = emp_id.encode()
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            number = self.INDEX_ENTRY.unpack_from(self._map, self._index_offset + middle * self.INDEX_ENTRY.size)[0]
+            id_offset, id_length = self._unpack(number)[:2]
+            start = self._pool_offset + id_offset
+            candidate = self._map[start:start + id_length]
+            if candidate < target:
+                low = middle + 1
+            elif candidate > target:
+                high = middle
+            else:
+                return self[number]
+        return None
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class EmployeeReportWriter:
+    FORMATS = ('text', 'csv', 'json')
+
+    def __init__(self, fileobj, format='text', buffer_size=1 << 20):
+        # 'fileobj' is any text file object; output is collected in a StringIO buffer and
+        # handed to fileobj.write() whenever roughly 'buffer_size' characters are waiting.
+        if format not in self.FORMATS:
+            raise ValueError(f"format must be one of {', '.join(self.FORMATS)}")
+        self.fileobj = fileobj
+        self.format = format
+        self.buffer_size = buffer_size
+        self._buffer = io.StringIO()
+        self._csv = csv.writer(self._buffer, lineterminator='\n')
+        if format == 'csv':
+            self._csv.writerow(('emp_id', 'name', 'department'))
+
+    def write(self, employees):
+        # Render any iterable of employees (streamed, never collected into a list).
+        # Returns how many employees were written.
+        buffer = self._buffer
+        write = buffer.write
+        count = 0
+        for employee in employees:
+            if self.format == 'text':
+                # One display_info() line per employee (subclasses' overrides are respected).
+                write(employee.display_info())
+                write('\n')
+            elif self.format == 'csv':
+                self._csv.writerow((employee.emp_id, employee.name, employee.department))
+            else:
+                write(json.dumps({'emp_id': employee.emp_id, 'name': employee.name,
+                                  'department': employee.department}))
+                write('\n')
+            count += 1
+            if buffer.tell() >= self.buffer_size:
+                self.flush()
+        return count
+
+    def flush(self):
+        # Hand everything buffered so far to the file in one write, then reuse the buffer.
+        if self._buffer.tell():
+            self.fileobj.write(self._buffer.getvalue())
+            self._buffer.seek(0)
+            self._buffer.truncate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+
+class EmployeeDirectory:
+    def __init__(self, employees=()):
+        # Primary index: emp_id -> Employee.
+        # Secondary index: department -> {emp_id: Employee}, so a department's members can be
+        # listed or counted without looking at anyone else.
+        self._by_id = {}
+        self._by_department = {}
+        self.bulk_load(employees)
+
+    def bulk_load(self, employees):
+        # Add many employees at once (any iterable, including the streaming constructors).
+        by_id = self._by_id
+        by_department = self._by_department
+        for employee in employees:
+            if employee.emp_id in by_id:
+                raise ValueError(f"Duplicate emp_id {employee.emp_id!r}")
+            by_id[employee.emp_id] = employee
+            members = by_department.get(employee.department)
+            if members is None:
+                members = by_department[employee.department] = {}
+            members[employee.emp_id] = employee
+
+    def add(self, employee):
+        self.bulk_load((employee,))
+
+    def remove(self, emp_id):
+        # Delete an employee from both indexes and return it (KeyError if unknown).
+        employee = self._by_id.pop(emp_id)
+        members = self._by_department[employee.department]
+        del members[emp_id]
+        if not members:
+            del self._by_department[employee.department]
+        return employee
+
+    def update(self, emp_id, **changes):
+        # Change an employee's emp_id, name and/or department and re-index them. Changes should go
+        # through here rather than straight to the Employee so the indexes stay correct.
+        unknown = set(changes) - {'emp_id', 'name', 'department'}
+        if unknown:
+            raise TypeError(f"Unknown Employee fields: {', '.join(sorted(unknown))}")
+        new_id = changes.get('emp_id', emp_id)
+        if new_id != emp_id and new_id in self._by_id:
+            raise ValueError(f"Duplicate emp_id {new_id!r}")
+        employee = self.remove(emp_id)
+        for field, value in changes.items():
+            setattr(employee, field, value)
+        self.add(employee)
+        return employee
+
+    def get(self, emp_id, default=None):
+        return self._by_id.get(emp_id, default)
+
+    def __getitem__(self, emp_id):
+        return self._by_id[emp_id]
+
+    def __contains__(self, emp_id):
+        return emp_id in self._by_id
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def in_department(self, department):
+        # Iterate over the employees of one department only.
+        return iter(self._by_department.get(department, {}).values())
+
+    def count(self, department=None):
+        # Number of employees overall, or in one department.
+        if department is None:
+            return len(self._by_id)
+        return len(self._by_department.get(department, ()))
+
+    def departments(self):
+        # {department: number of employees} for every department in the directory.
+        return {department: len(members) for department, members in self._by_department.items()}
+
+# --- Q2 OUTPUT ---
+def demo_q2():
+    # Runs the Q2 demonstration. It is only called when this file is executed
+    # directly, so importing the file defines the classes without printing anything.
+    print("Q2: Build a class Employee with multiple constructors")
+    print("___________________________________________________________________")
+
+    # Using the primary constructor:
+    print("\nUsing __init__:")
+    emp1 = Employee("001", "Alice", "IT")  # Initializing using __init__
+    print(emp1.display_info())
+    print("METHOD: initialized using __init__ | Employee('001', 'Alice', 'IT')")
+
+    # Using the alternative constructor from a string:
+    print("\nUsing from_string:")
+    emp1 = Employee.from_string("001-Alice-IT")  # Reassigning emp1 using from_string
+    print(emp1.display_info())
+    print("METHOD: initialized using from_string() | Employee.from_string('001-Alice-IT')")
+
+    # Using the alternative constructor from a dictionary:
+    print("\nUsing from_dict:")
+    emp1 = Employee.from_dict({'emp_id': "001", 'name': "Alice", 'department': "IT"})  # Reassigning emp1 using from_dict
+    print(emp1.display_info())
+    print("METHOD: initialized using from_dict() | Employee.from_dict({'emp_id': '001', 'name': 'Alice', 'department': 'IT'})")
+
+    # Demonstrate the use of the static method is_valid_department:
+    print("\nUsing is_valid_department:")
+    dept_to_check = "IT"
+    is_valid = Employee.is_valid_department(dept_to_check)
+    print(f"Department '{dept_to_check}' is valid: {is_valid}")
+
+    # Validate a whole column of departments at once, and register a new department at run time.
+    print("\nUsing the department registry:")
+    column = ["IT", "HR", "Legal", "IT", "Sales", "Finance"]
+    mask, counts = Employee.departments.validate_batch(column)
+    print(f"Validity mask: {mask}")
+    print(f"Counts: {counts}")
+    Employee.departments.add("Legal")
+    print(f"After registering Legal: {Employee.departments.validate_batch(column)[0]}")
+    try:
+        Employee.from_string("009-Frank-Sales", strict=True)
+    except ValueError as error:
+        print("ERROR:", error)
+    Employee.departments.remove("Legal")
+
+    # Stream employees from text, CSV and JSON Lines sources, collecting bad rows instead of stopping.
+    print("\nUsing the streaming constructors:")
+    rejects = []
+    text_rows = io.StringIO("002-Mary-Jane-HR\n003-Bob-Finance\nnot a valid row\n004-Carol-IT\n")
+    print([emp.name for emp in Employee.iter_from_lines(text_rows, rejects)])
+    csv_rows = io.StringIO("emp_id,name,department\n005,Dan,Marketing\n006\n")
+    print([emp.name for emp in Employee.iter_from_csv(csv_rows, rejects)])
+    jsonl_rows = io.StringIO('{"emp_id": "007", "name": "Eve", "department": "IT"}\n{"emp_id": "008"}\n')
+    print([emp.name for emp in Employee.iter_from_jsonl(jsonl_rows, rejects)])
+    print("Rejected rows:")
+    for line_number, line, reason in rejects:
+        print(f"  line {line_number}: {line!r} ({reason})")
+
+    # A small fixed roster for the containers below. Throughput and memory at scale are
+    # measured by the benchmark suite instead (python -m oop_questions bench).
+    rows = "".join(f"{i:06d}-Employee {i}-{('HR', 'IT', 'Marketing', 'Finance')[i % 4]}\n" for i in range(1, 13))
+
+    # Keep employees in a directory indexed by id and by department.
+    print("\nUsing EmployeeDirectory:")
+    directory = EmployeeDirectory(Employee.iter_from_lines(io.StringIO(rows)))
+    print(f"Loaded {len(directory):,} employees: {directory.departments()}")
+    print(directory["000006"].display_info())
+    directory.update("000006", department="HR", name="Employee Six")
+    print(directory["000006"].display_info())
+    directory.remove("000006")
+    print(f"After removing 000006: {directory.count('HR'):,} in HR, '000006' in directory: {'000006' in directory}")
+    print("First in Finance:", next(directory.in_department("Finance")).display_info())
+
+    # Store the same employees column by column.
+    print("\nUsing EmployeeTable:")
+    table = EmployeeTable(Employee.iter_from_lines(io.StringIO(rows)))
+    print(table[5].display_info())
+    print(f"Is a table row an Employee? {isinstance(table[5], Employee)}")
+    print(f"{len(table)} records in {table.nbytes()} bytes of columns")
+
+    # Strict mode on the streaming constructor rejects unregistered departments.
+    rejects = []
+    strict_rows = io.StringIO("010-Gina-IT\n011-Hank-Sales\n")
+    print([emp.name for emp in Employee.iter_from_lines(strict_rows, rejects, strict=True)], rejects)
+
+    # Save the employees to a binary snapshot and reopen it without parsing any text.
+    print("\nUsing EmployeeSnapshot:")
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as folder:
+        snapshot_path = os.path.join(folder, "employees.snapshot")
+        written = EmployeeSnapshot.write(snapshot_path, Employee.iter_from_lines(io.StringIO(rows)))
+        with EmployeeSnapshot(snapshot_path) as snapshot:
+            print(f"Wrote {written} employees in {os.path.getsize(snapshot_path)} bytes")
+            print(snapshot[5].display_info())
+            print(snapshot.find("000012").display_info())
+            print(f"Lookup of a missing id: {snapshot.find('999999')}")
+
+    # Render reports through one large buffer instead of one print() per employee.
+    print("\nUsing EmployeeReportWriter:")
+    sample = [Employee("001", "Alice", "IT"), Employee("002", "Smith, Mary-Jane", "HR")]
+    for report_format in EmployeeReportWriter.FORMATS:
+        output = io.StringIO()
+        with EmployeeReportWriter(output, report_format) as writer:
+            writer.write(sample)
+        print(f"{report_format}:\n{output.getvalue()}", end="")
+
+if __name__ == "__main__":
+    demo_q2()
@@ -7,17 +7,139 @@
 #   - Encapsulation: The student grades are stored in a protected attribute (_students).
 #   - Aggregation: Each school contains a list of student grades.
 #   - Nested Class: 'GradeCalculator' is a nested helper class providing static methods to calculate average and GPA.
+#   - Nested Class: 'RunningStats' keeps running totals (count, sum, sum of squares, min, max) that are
+#     updated as grades are added or removed, so the statistics never need to walk the whole roster again.
+#   - Nested Class: 'GradeIndex' counts how many students have each grade from 0 to 100 in a Fenwick tree,
+#     which answers median, percentile, rank and top-N questions without sorting the roster.
+#     Rosters with other grades (fractional, above 100, ...) use 'SortedGrades', a sorted list with the
+#     same interface, instead.
+#   - Multiple grading systems: calculate_gpas() converts one roster under many GPA scales or
+#     conversion tables at once, reusing a cached average that is refreshed only when grades change.
+#
+# Rosters too large for memory can be kept on disk in a 'GradeFile' (one byte per grade) that is read through
+# mmap in fixed-size chunks. School.from_grade_file() builds a school on top of one.
+# 'SchoolBatchRunner' spreads many such roster files over a process pool: workers sum slices of the files
+# and the parent merges those partial sums into each school's average and GPA.
+#
+# A 'District' aggregates many schools. It keeps one NumPy column each of per-school sums, counts and
+# GPA scales, taken from the schools' running totals, so averages and GPAs for all schools come out of a
+# single vectorized pass without copying any grades (rosters backed by a GradeFile stay on disk).
 #
 # This design ensures that every subclass of School implements its own methods for calculating
 # the average and GPA while reusing the common display logic provided in display_stats().
 
 from abc import ABC, abstractmethod  # Import abstract class support
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from numbers import Integral
 
 class School(ABC):
     def __init__(self, name, students):
         # 'name' is public; 'students' (a list of grades) is protected.
         self.name = name            
         self._students = students   
+        # Running totals and the grade index are kept in step with _students
+        # by add_grade() and remove_grade(). Both are built from one count of each distinct grade.
+        counts = School._count_grades(students)
+        self._stats = School.RunningStats.from_counts(counts, students)
+        self._grade_index = School.GradeIndex.build(counts, students)
+        # Bumped on every change so aggregates (such as District) can tell what is stale.
+        self._version = 0
+        # (version, average) pair; the average is recomputed only when the version moves on.
+        self._average_cache = (None, None)
+
+    @staticmethod
+    def _count_grades(students):
+        # How many students have each grade, counted at C speed (a GradeFile chunk by chunk).
+        counts = Counter()
+        if isinstance(students, GradeFile):
+            for chunk in students.chunks():
+                counts.update(chunk)
+        else:
+            counts.update(students)
+        return counts
+
+    @classmethod
+    def from_grade_file(cls, name, path):
+        # Alternative constructor that uses a memory-mapped GradeFile as the (read-only) roster,
+        # so the grades are streamed from disk in chunks instead of being loaded as a list.
+        # Close the school (or use it in a 'with' block) to release the file.
+        return cls(name, GradeFile(path))
+
+    def close(self):
+        # Release the roster's file if it is a GradeFile; nothing to do for a list.
+        if isinstance(self._students, GradeFile):
+            self._students.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        # Number of students, read from the running totals (so a GradeFile roster is not scanned).
+        return self._stats.count
+
+    def _check_writable(self):
+        if isinstance(self._students, GradeFile):
+            raise TypeError(f"{self.name} has a read-only roster (GradeFile); grades cannot be added or removed")
+
+    def add_grade(self, grade):
+        # Add a student's grade and update the running totals in O(1). The roster is changed
+        # first, so the totals and the index stay in step if that fails.
+        self._check_writable()
+        self._students.append(grade)
+        if not self._grade_index.fits(grade):
+            # First grade outside the 0-100 whole-number range: switch to the sorted fallback.
+            self._grade_index = School.SortedGrades(self._students[:-1])
+        self._grade_index.add(grade)
+        self._stats.add(grade)
+        self._version += 1
+
+    def remove_grade(self, grade):
+        # Remove one occurrence of a grade (ValueError if missing) and update the running totals.
+        # The index is updated first, since it is the step that can fail; nothing else has
+        # changed at that point.
+        self._check_writable()
+        index = self._grade_index
+        if not index.fits(grade):
+            # Such as 85.0 for a stored 85: equal for the list, but not a GradeIndex key.
+            index = School.SortedGrades(self._students)
+        index.remove(grade)
+        self._grade_index = index
+        self._students.remove(grade)
+        self._stats.remove(grade, self._students)
+        self._version += 1
+
+    def cached_average(self):
+        # The result of calculate_average(), reused until the grades change.
+        if self._average_cache[0] != self._version:
+            self._average_cache = (self._version, self.calculate_average())
+        return self._average_cache[1]
+
+    def calculate_gpas(self, scales):
+        # GPAs for many grading systems at once. Each entry of 'scales' is either a divisor
+        # (like gpa_scale) or a conversion table {minimum grade: points}. The per-grade counts
+        # come from the grade index, so the roster itself is not traversed at all.
+        return self.GradeCalculator.convert_all(self.cached_average(), self._stats.count,
+                                                self._grade_index.frequencies(), scales)
+
+    def median(self):
+        # Middle grade of the roster (mean of the two middle grades for an even count).
+        return self._grade_index.percentile(50)
+
+    def percentile(self, p):
+        # Grade below which p percent of the roster falls.
+        return self._grade_index.percentile(p)
+
+    def percentile_rank(self, grade):
+        # Percentage of the roster scoring below 'grade' (ties count as half).
+        return self._grade_index.percentile_rank(grade)
+
+    def top_grades(self, n):
+        # The n highest grades, best first.
+        return self._grade_index.top(n)
 
     @abstractmethod
     def calculate_average(self):
@@ -38,12 +160,295 @@ class School(ABC):
         @staticmethod
         def gpa(grades, scale):
             avg = School.GradeCalculator.average(grades)
+            return School.GradeCalculator.gpa_from_average(avg, scale)
+
+        @staticmethod
+        def gpa_from_average(avg, scale):
             # Convert the average grade to a GPA using a provided scale divisor.
             return round(avg / scale, 2)
 
+        @staticmethod
+        def multi_gpa(grades, scales):
+            # GPAs for many scales from a single pass over 'grades': the pass collects the total
+            # and how often each grade occurs, and every scale is converted from those numbers.
+            total = count = 0
+            frequencies = {}
+            for grade in grades:
+                total += grade
+                count += 1
+                frequencies[grade] = frequencies.get(grade, 0) + 1
+            avg = total / count if count else 0
+            return School.GradeCalculator.convert_all(avg, count, frequencies.items(), scales)
+
+        @staticmethod
+        def convert_all(avg, count, frequencies, scales):
+            # Convert one roster, summarised by its average, size and (grade, times) pairs, under
+            # every scale. A number is a divisor like gpa_scale; a dict is a conversion table
+            # {minimum grade: points} where each student earns the points of the highest
+            # threshold they reach (0 below every threshold) and the GPA is the mean.
+            frequencies = list(frequencies)
+            results = []
+            for scale in scales:
+                if isinstance(scale, dict):
+                    thresholds = sorted(scale)
+                    points = 0
+                    for grade, times in frequencies:
+                        position = bisect_right(thresholds, grade)
+                        if position:
+                            points += times * scale[thresholds[position - 1]]
+                    results.append(round(points / count, 2) if count else 0)
+                else:
+                    results.append(School.GradeCalculator.gpa_from_average(avg, scale))
+            return results
+
+    # Nested class that keeps running statistics for a list of grades.
+    class RunningStats:
+        __slots__ = ('count', 'total', 'total_squares', '_minimum', '_maximum', '_grades')
+
+        def __init__(self, grades=()):
+            self.count = 0
+            self.total = 0
+            self.total_squares = 0
+            self._minimum = None
+            self._maximum = None
+            self._grades = None  # Roster to rescan if a removal invalidates min or max.
+            for grade in grades:
+                self.add(grade)
+
+        @classmethod
+        def from_counts(cls, counts, grades):
+            # Build the totals from a Counter of grades in O(distinct grades). Non-integer totals
+            # are summed over 'grades' in roster order, so they match sum(grades) exactly.
+            stats = cls()
+            stats.count = sum(counts.values())
+            if all(isinstance(grade, Integral) for grade in counts):
+                stats.total = sum(grade * times for grade, times in counts.items())
+            else:
+                stats.total = sum(grades)
+            stats.total_squares = sum(grade * grade * times for grade, times in counts.items())
+            if counts:
+                stats._minimum = min(counts)
+                stats._maximum = max(counts)
+            return stats
+
+        def add(self, grade):
+            # Fold one grade into the totals.
+            self.count += 1
+            self.total += grade
+            self.total_squares += grade * grade
+            if self._grades is None:
+                if self._minimum is None or grade < self._minimum:
+                    self._minimum = grade
+                if self._maximum is None or grade > self._maximum:
+                    self._maximum = grade
+
+        def remove(self, grade, remaining_grades):
+            # Take one grade back out of the totals. If it was the current minimum or maximum,
+            # those are recomputed from 'remaining_grades' the next time they are read.
+            self.count -= 1
+            self.total -= grade
+            self.total_squares -= grade * grade
+            if grade == self._minimum or grade == self._maximum:
+                self._grades = remaining_grades
+
+        def _refresh_extremes(self):
+            if self._grades is not None:
+                self._minimum = min(self._grades, default=None)
+                self._maximum = max(self._grades, default=None)
+                self._grades = None
+
+        @property
+        def minimum(self):
+            self._refresh_extremes()
+            return self._minimum
+
+        @property
+        def maximum(self):
+            self._refresh_extremes()
+            return self._maximum
+
+        def average(self):
+            # Same result as GradeCalculator.average, without walking the grades.
+            return self.total / self.count if self.count else 0
+
+        def variance(self):
+            # Population variance from the sum and sum of squares.
+            if not self.count:
+                return 0
+            mean = self.total / self.count
+            return max(self.total_squares / self.count - mean * mean, 0)
+
+    # Nested class that indexes whole-number grades from 0 to 100 for order statistics.
+    # A Fenwick (binary indexed) tree over the 101 possible grades gives prefix counts
+    # and "k-th smallest grade" lookups in O(log 101) steps.
+    class GradeIndex:
+        MAX_GRADE = 100
+
+        def __init__(self, grades=()):
+            self._counts = [0] * (self.MAX_GRADE + 1)
+            self._tree = [0] * (self.MAX_GRADE + 2)  # 1-based Fenwick tree
+            self.count = 0
+            for grade in grades:
+                self.add(grade)
+
+        @classmethod
+        def build(cls, counts, grades):
+            # Index 'grades' (counted in the Counter 'counts') in a GradeIndex, or in a SortedGrades
+            # if any of them does not fit. The tree is built bottom-up in O(MAX_GRADE).
+            index = cls()
+            if not all(map(index.fits, counts)):
+                return School.SortedGrades(grades)
+            for grade, times in counts.items():
+                index._counts[grade] += times
+            index.count = sum(index._counts)
+            tree = index._tree
+            for i in range(1, len(tree)):
+                tree[i] += index._counts[i - 1]
+                parent = i + (i & -i)
+                if parent < len(tree):
+                    tree[parent] += tree[i]
+            return index
+
+        def fits(self, grade):
+            # Whole numbers (including NumPy integers) from 0 to MAX_GRADE can be indexed.
+            return isinstance(grade, Integral) and 0 <= grade <= self.MAX_GRADE
+
+        def _check(self, grade):
+            if not self.fits(grade):
+                raise ValueError(f"Grade must be a whole number from 0 to {self.MAX_GRADE}, got {grade!r}")
+
+        def _update(self, grade, delta):
+            self._counts[grade] += delta
+            self.count += delta
+            i = grade + 1
+            while i < len(self._tree):
+                self._tree[i] += delta
+                i += i & -i
+
+        def add(self, grade):
+            self._check(grade)
+            self._update(int(grade), 1)
+
+        def remove(self, grade):
+            self._check(grade)
+            if not self._counts[grade]:
+                raise ValueError(f"Grade {grade} is not in the index")
+            self._update(int(grade), -1)
+
+        def count_equal(self, grade):
+            return self._counts[grade] if self.fits(grade) else 0
+
+        def frequencies(self):
+            # (grade, number of students) pairs in ascending grade order.
+            return [(grade, times) for grade, times in enumerate(self._counts) if times]
+
+        def count_below(self, grade):
+            # Number of grades strictly lower than 'grade'.
+            if grade <= 0:
+                return 0
+            if grade > self.MAX_GRADE:
+                return self.count
+            i = int(grade)
+            if i < grade:
+                i += 1  # A fractional grade such as 84.5 still counts 84 as below it.
+            total = 0
+            while i > 0:
+                total += self._tree[i]
+                i -= i & -i
+            return total
+
+        def kth(self, k):
+            # The k-th smallest grade (0-based), found by walking down the tree.
+            if not 0 <= k < self.count:
+                raise IndexError("Grade rank out of range")
+            position = 0
+            step = 1 << (len(self._tree) - 1).bit_length()
+            while step:
+                nxt = position + step
+                if nxt < len(self._tree) and self._tree[nxt] <= k:
+                    position = nxt
+                    k -= self._tree[nxt]
+                step >>= 1
+            return position
+
+        def percentile(self, p):
+            # Linear interpolation between the closest ranks (the same rule as statistics.median
+            # for p=50). Returns 0 for an empty index, like GradeCalculator.average.
+            if not 0 <= p <= 100:
+                raise ValueError("Percentile must be between 0 and 100")
+            if not self.count:
+                return 0
+            position = p / 100 * (self.count - 1)
+            lower = int(position)
+            low_grade = self.kth(lower)
+            if lower == position:
+                return low_grade
+            high_grade = self.kth(lower + 1)
+            return low_grade + (high_grade - low_grade) * (position - lower)
+
+        def percentile_rank(self, grade):
+            # Percentage of grades below 'grade', counting equal grades as half.
+            if not self.count:
+                return 0
+            return (self.count_below(grade) + self.count_equal(grade) / 2) / self.count * 100
+
+        def top(self, n):
+            # The n highest grades, best first, read from the per-grade counts.
+            result = []
+            for grade in range(self.MAX_GRADE, -1, -1):
+                if len(result) >= n:
+                    break
+                result.extend([grade] * min(self._counts[grade], n - len(result)))
+            return result
+
+    # Fallback for rosters with grades GradeIndex cannot hold (fractional grades, bonus points above
+    # 100, ...): the grades are kept in a sorted list, so updates cost O(n) instead of O(log 101).
+    # percentile() and percentile_rank() are inherited unchanged.
+    class SortedGrades(GradeIndex):
+        def __init__(self, grades=()):
+            self._sorted = sorted(grades)
+            self.count = len(self._sorted)
+
+        def fits(self, grade):
+            return True
+
+        def add(self, grade):
+            insort(self._sorted, grade)
+            self.count += 1
+
+        def remove(self, grade):
+            i = bisect_left(self._sorted, grade)
+            if i == len(self._sorted) or self._sorted[i] != grade:
+                raise ValueError(f"Grade {grade} is not in the index")
+            del self._sorted[i]
+            self.count -= 1
+
+        def count_below(self, grade):
+            return bisect_left(self._sorted, grade)
+
+        def count_equal(self, grade):
+            return bisect_right(self._sorted, grade) - bisect_left(self._sorted, grade)
+
+        def frequencies(self):
+            result = []
+            for grade in self._sorted:
+                if result and result[-1][0] == grade:
+                    result[-1] = (grade, result[-1][1] + 1)
+                else:
+                    result.append((grade, 1))
+            return result
+
+        def kth(self, k):
+            if not 0 <= k < self.count:
+                raise IndexError("Grade rank out of range")
+            return self._sorted[k]
+
+        def top(self, n):
+            return self._sorted[:-n - 1:-1] if n > 0 else []
+
     def display_stats(self):
         # Display statistics if student data is available.
-        if not self._students:
+        if not self._stats.count:
             print(f"{self.__class__.__name__} - {self.name}: No student data available.\n")
             return
 
@@ -53,8 +458,8 @@ class School(ABC):
             print(f"  Student {idx}: {grade}")
 
         # Compute and show details of the average calculation.
-        total = sum(self._students)
-        count = len(self._students)
+        total = self._stats.total
+        count = self._stats.count
         avg = self.calculate_average()
         print("\n  -- Average Calculation Breakdown --")
         print(f"     Sum of grades = {total}")
@@ -73,29 +478,335 @@ class SchoolOne(School):
     gpa_scale = 25  # Defines the divisor for converting average grade to GPA.
 
     def calculate_average(self):
-        # Uses the nested GradeCalculator to compute the average.
-        return self.GradeCalculator.average(self._students)
+        # Reads the average from the running totals instead of summing the roster again.
+        return self._stats.average()
 
     def calculate_gpa(self):
         # Uses the nested GradeCalculator with SchoolOne's GPA scale.
-        return self.GradeCalculator.gpa(self._students, self.gpa_scale)
+        return self.GradeCalculator.gpa_from_average(self.calculate_average(), self.gpa_scale)
 
 # SchoolTwo with a different GPA scale.
 class SchoolTwo(School):
     gpa_scale = 20  # This scale is different, simulating a different grading system.
 
     def calculate_average(self):
-        return self.GradeCalculator.average(self._students)
+        return self._stats.average()
 
     def calculate_gpa(self):
-        return self.GradeCalculator.gpa(self._students, self.gpa_scale)
+        return self.GradeCalculator.gpa_from_average(self.calculate_average(), self.gpa_scale)
+
+import mmap
+import weakref
+from array import array
+
+class GradeFile:
+    # Default number of grades handed out per chunk while streaming.
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        # Map a binary roster (one unsigned byte per grade) into memory. Pages are only read
+        # from disk when they are touched, so memory use stays bounded for any file size.
+        self.path = path
+        self.chunk_size = chunk_size
+        self._file = open(path, 'rb')
+        size = self._file.seek(0, 2)
+        # mmap cannot map an empty file, so an empty roster uses an empty buffer instead.
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._view = memoryview(self._map)
+        # Iterators still holding a chunk; close() finishes them first.
+        self._iterators = weakref.WeakSet()
+
+    @classmethod
+    def create(cls, path, grades, chunk_size=CHUNK_SIZE):
+        # Write any iterable of grades (0-100) to 'path' in chunks and open the result.
+        # A byte could hold up to 255, so out-of-range grades are rejected here.
+        with open(path, 'wb') as out:
+            buffer = array('B')
+            for grade in grades:
+                if not 0 <= grade <= 100:
+                    raise ValueError(f"Grade must be between 0 and 100, got {grade}")
+                buffer.append(grade)
+                if len(buffer) >= chunk_size:
+                    buffer.tofile(out)
+                    buffer = array('B')
+            buffer.tofile(out)
+        return cls(path, chunk_size)
+
+    @classmethod
+    def from_text(cls, text_path, path, chunk_size=CHUNK_SIZE):
+        # Convert a text or CSV roster (grades separated by commas, spaces or newlines)
+        # into a GradeFile, reading the text one line at a time.
+        def grades():
+            with open(text_path) as roster:
+                for line in roster:
+                    for field in line.replace(',', ' ').split():
+                        yield int(field)
+        return cls.create(path, grades(), chunk_size)
+
+    def chunks(self, start=0, stop=None):
+        # Yield zero-copy memoryview slices of at most chunk_size grades,
+        # optionally limited to the grades between 'start' and 'stop'.
+        stop = len(self._view) if stop is None else min(stop, len(self._view))
+        for begin in range(start, stop, self.chunk_size):
+            yield self._view[begin:min(begin + self.chunk_size, stop)]
+
+    def __iter__(self):
+        iterator = self._iterate()
+        self._iterators.add(iterator)
+        return iterator
+
+    def _iterate(self):
+        # Each chunk is released as soon as it is used up, or when the iterator is closed early,
+        # so a half-consumed iterator does not keep close() from releasing the mapping.
+        for chunk in self.chunks():
+            try:
+                yield from chunk
+            finally:
+                chunk.release()
+
+    def __len__(self):
+        return len(self._view)
+
+    def __getitem__(self, index):
+        return self._view[index]
+
+    def close(self):
+        # Release the mapping and the file handle, after any half-consumed iterators.
+        for iterator in list(self._iterators):
+            iterator.close()
+        self._view.release()
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+import os
+import time
+
+def _sum_grade_range(task):
+    # Worker function (module level so it can be sent to another process): add up the grades
+    # in one slice of a grade file and report which process did the work and how long it took.
+    school_index, path, start, stop = task
+    began = time.perf_counter()
+    total = 0
+    with GradeFile(path) as grades:
+        for chunk in grades.chunks(start, stop):
+            total += sum(chunk)
+            chunk.release()
+    return school_index, stop - start, total, os.getpid(), time.perf_counter() - began
+
+class SchoolBatchRunner:
+    def __init__(self, max_workers=None, grades_per_task=1 << 20, chunksize=8):
+        # max_workers: size of the process pool (None lets Python pick the CPU count).
+        # grades_per_task: large rosters are split into slices of at most this many grades.
+        # chunksize: how many slices are sent to a worker in one message.
+        self.max_workers = max_workers
+        self.grades_per_task = grades_per_task
+        self.chunksize = chunksize
+
+    def _tasks(self, jobs):
+        # Split every roster file into (school index, path, start, stop) slices.
+        for index, (_, _, path) in enumerate(jobs):
+            size = os.path.getsize(path)
+            for start in range(0, size, self.grades_per_task):
+                yield index, path, start, min(start + self.grades_per_task, size)
+
+    def run(self, jobs):
+        # 'jobs' is a list of (School subclass, school name, grade file path). Returns the
+        # (name, average, GPA) of every school plus timing and per-worker throughput.
+        jobs = list(jobs)
+        counts = [0] * len(jobs)
+        totals = [0] * len(jobs)
+        workers = {}
+        # Imported here so that importing this module stays fast for short-lived workers.
+        from concurrent.futures import ProcessPoolExecutor
+
+        began = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            for index, count, total, pid, seconds in executor.map(
+                _sum_grade_range, self._tasks(jobs), chunksize=self.chunksize
+            ):
+                # Merge the partial sums of each slice into its school's totals.
+                counts[index] += count
+                totals[index] += total
+                worker = workers.setdefault(pid, {'tasks': 0, 'grades': 0, 'seconds': 0.0})
+                worker['tasks'] += 1
+                worker['grades'] += count
+                worker['seconds'] += seconds
+        wall_time = time.perf_counter() - began
+
+        results = []
+        for (school_class, name, _), count, total in zip(jobs, counts, totals):
+            # Same arithmetic as RunningStats.average and calculate_gpa, so the numbers match exactly.
+            avg = total / count if count else 0
+            results.append((name, avg, School.GradeCalculator.gpa_from_average(avg, school_class.gpa_scale)))
+        for worker in workers.values():
+            worker['grades_per_second'] = worker['grades'] / worker['seconds'] if worker['seconds'] else 0.0
+        return {'results': results, 'wall_time': wall_time, 'workers': workers}
+
+# NumPy is optional and slow to import: the schools work without it, and it is only
+# loaded the first time District needs it.
+np = None
+
+def _load_numpy(feature):
+    # Import NumPy on first use and return it; raises ImportError naming 'feature' if it is missing.
+    global np
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(f"{feature} requires NumPy") from None
+    return np
+
+class District:
+    def __init__(self, schools=()):
+        # Columnar layout: entry i of each column belongs to school i. Each school's GPA scale sits in 'scales'.
+        _load_numpy("District")
+        self._schools = list(schools)
+        self._versions = [school._version for school in self._schools]
+        self.scales = np.array([school.gpa_scale for school in self._schools], dtype=np.float64)
+        # Per-school sums and counts come from each school's running totals, so they match
+        # calculate_average() exactly and can be refreshed without reading any grades.
+        self._sums = np.array([school._stats.total for school in self._schools], dtype=np.float64)
+        self._counts = np.array([school._stats.count for school in self._schools], dtype=np.int64)
+        self._update_results(np.arange(len(self._schools)))
+
+    def _update_results(self, indices):
+        # Recompute averages and GPAs for the given schools only.
+        if not hasattr(self, '_averages'):
+            self._averages = np.zeros(len(self._schools))
+            self._gpas = np.zeros(len(self._schools))
+        counts = self._counts[indices]
+        averages = np.divide(self._sums[indices], counts, out=np.zeros(len(indices)), where=counts > 0)
+        self._averages[indices] = averages
+        # Python's round() is used for the final step so the GPAs match calculate_gpa() exactly
+        # (np.round can differ on values that sit half-way between two hundredths).
+        self._gpas[indices] = [round(gpa, 2) for gpa in (averages / self.scales[indices]).tolist()]
+
+    def refresh(self):
+        # Find schools whose grades changed since the last refresh and recompute only those,
+        # from their running totals.
+        changed = [i for i, school in enumerate(self._schools) if school._version != self._versions[i]]
+        if not changed:
+            return []
+        for i in changed:
+            school = self._schools[i]
+            self._versions[i] = school._version
+            self._sums[i] = school._stats.total
+            self._counts[i] = school._stats.count
+        self._update_results(np.array(changed))
+        return [self._schools[i].name for i in changed]
+
+    def averages(self):
+        # Average grade of every school, in the order the schools were given.
+        return self._averages
+
+    def gpas(self):
+        # GPA of every school, each using its own class's gpa_scale.
+        return self._gpas
+
+    def results(self):
+        # (school name, average, GPA) for every school.
+        return list(zip((school.name for school in self._schools), self._averages.tolist(), self._gpas.tolist()))
 
 # --- Q3 OUTPUT ---
-print("Q3: Build a two class call SchoolOne and SchoolTwo that")
-print("    display there list of students average grades and GPA.")
-print("___________________________________________________________________")
-school_one = SchoolOne("Greenwood High", [88, 92, 79, 85, 91])
-school_two = SchoolTwo("Maple Leaf School", [75, 84, 90, 68, 82])
-
-school_one.display_stats()
-school_two.display_stats()
\ No newline at end of file
+def demo_q3():
+    # Runs the Q3 demonstration. It is only called when this file is executed
+    # directly, so importing the file defines the classes without printing anything.
+    print("Q3: Build a two class call SchoolOne and SchoolTwo that")
+    print("    display there list of students average grades and GPA.")
+    print("___________________________________________________________________")
+    school_one = SchoolOne("Greenwood High", [88, 92, 79, 85, 91])
+    school_two = SchoolTwo("Maple Leaf School", [75, 84, 90, 68, 82])
+
+    school_one.display_stats()
+    school_two.display_stats()
+
+    # Update a roster incrementally; the running totals follow every change.
+    print("------ Updating Greenwood High incrementally ------")
+    school_one.add_grade(97)
+    school_one.remove_grade(79)
+    stats = school_one._stats
+    print(f"  Grades: {school_one._students}")
+    print(f"  Count = {stats.count}, Sum = {stats.total}, Min = {stats.minimum}, Max = {stats.maximum}")
+    print(f"  Average = {school_one.calculate_average():.2f}, GPA = {school_one.calculate_gpa():.2f}, "
+          f"Std. deviation = {stats.variance() ** 0.5:.2f}\n")
+
+    # Order statistics come from the grade index rather than from sorting the roster.
+    print("------ Order statistics for Maple Leaf School ------")
+    print(f"  Median = {school_two.median()}")
+    print(f"  Quartiles = {school_two.percentile(25)}, {school_two.percentile(50)}, {school_two.percentile(75)}")
+    print(f"  A grade of 84 is at the {school_two.percentile_rank(84):.0f}th percentile")
+    print(f"  Top 3 grades = {school_two.top_grades(3)}\n")
+
+    # Report one roster under several grading systems at once.
+    print("------ Greenwood High under several grading systems ------")
+    letter_table = {90: 4.0, 80: 3.0, 70: 2.0, 60: 1.0}
+    for label, gpa in zip(["Scale 25", "Scale 20", "Letter table"], school_one.calculate_gpas([25, 20, letter_table])):
+        print(f"  {label}: GPA = {gpa:.2f}")
+    print(f"  Single pass over a plain list: {School.GradeCalculator.multi_gpa([75, 84, 90, 68, 82], [25, 20, letter_table])}\n")
+
+    # Aggregate both schools into a district and compute every average and GPA at once.
+    print("------ District-wide statistics ------")
+    try:
+        _load_numpy("District")
+    except ImportError:
+        print("  NumPy is not installed; skipping District demo.\n")
+    else:
+        district = District([school_one, school_two])
+        for name, avg, gpa in district.results():
+            print(f"  {name}: Average = {avg:.2f}, GPA = {gpa:.2f}")
+        school_two.add_grade(100)
+        print(f"  Recomputed after adding a grade to {school_two.name}: {district.refresh()}")
+        for name, avg, gpa in district.results():
+            print(f"  {name}: Average = {avg:.2f}, GPA = {gpa:.2f}")
+        print()
+
+    # Back a school with a memory-mapped grade file and check it matches the in-memory school.
+    print("------ Streaming a roster from a grade file ------")
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as folder:
+        text_roster = os.path.join(folder, "greenwood.csv")
+        with open(text_roster, "w") as roster:
+            roster.write(", ".join(map(str, school_one._students)) + "\n")
+        GradeFile.from_text(text_roster, os.path.join(folder, "greenwood.grades")).close()
+        with SchoolOne.from_grade_file("Greenwood High (from file)", os.path.join(folder, "greenwood.grades")) as file_school:
+            file_school.display_stats()
+            print(f"  Same average and GPA as the in-memory school? "
+                  f"{(file_school.calculate_average(), file_school.calculate_gpa()) == (school_one.calculate_average(), school_one.calculate_gpa())}")
+            print(f"  GradeCalculator.average over the file = {School.GradeCalculator.average(file_school._students):.2f}\n")
+
+    # Fan many roster files out to a process pool and merge the partial sums.
+    print("------ Batch statistics with a process pool ------")
+    import random
+
+    random.seed(3)
+    with tempfile.TemporaryDirectory() as folder:
+        jobs = []
+        for number in range(1, 9):
+            school_class = SchoolOne if number % 2 else SchoolTwo
+            path = os.path.join(folder, f"school_{number}.grades")
+            GradeFile.create(path, (random.randint(50, 100) for _ in range(50_000))).close()
+            jobs.append((school_class, f"School {number}", path))
+
+        report = SchoolBatchRunner(max_workers=2, grades_per_task=20_000).run(jobs)
+        for name, avg, gpa in report['results'][:3]:
+            print(f"  {name}: Average = {avg:.2f}, GPA = {gpa:.2f}")
+        print(f"  ... {len(report['results'])} schools in {report['wall_time']:.3f}s")
+        for pid, worker in sorted(report['workers'].items()):
+            print(f"  Worker {pid}: {worker['tasks']} slices, {worker['grades_per_second']:,.0f} grades/s")
+
+        matches = True
+        for (school_class, name, path), (_, avg, gpa) in zip(jobs, report['results']):
+            with school_class.from_grade_file(name, path) as school:
+                matches = matches and (avg, gpa) == (school.calculate_average(), school.calculate_gpa())
+        print(f"  Same as calculate_average / calculate_gpa? {matches}\n")
+
+if __name__ == "__main__":
+    demo_q3()
\ No newline at end of file
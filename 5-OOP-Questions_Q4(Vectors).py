@@ -7,11 +7,31 @@
 #   - The __repr__ method is provided for an unambiguous representation of the vector.
 #   - A static method (dot_product) computes the dot product of two vectors.
 #   - A class method (origin) is provided as a factory for a vector at the origin.
+#   - __slots__ keeps each Vector compact (no per-instance __dict__), and the in-place operators
+#     (+=, -=, *=) update the vector without allocating a new object.
+#   - A class method (sum) reduces many vectors into a single accumulator; __radd__ also lets the
+#     built-in sum() work by accepting its 0 start value.
 #
 # If an operand that is not a Vector is provided during addition, the code raises a TypeError,
 # ensuring type safety.
+#
+# A companion class 'VectorArray' stores many 2-D vectors in one contiguous (N, 2) NumPy buffer
+# so that addition and dot products run over the whole batch at once instead of one object at a time.
+#
+# 'VectorN' generalises Vector to any number of dimensions. It is an array('d') subclass, so it exports
+# the buffer protocol: memoryview, NumPy, struct and file writes read its components directly without
+# copying them out into a tuple first. VectorN.from_buffer() wraps a caller-supplied buffer (bytearray,
+# mmap, ...) without copying it, in a VectorN.View that supports the same operations.
+#
+# 'VectorGrid' is a spatial index over Vector objects. It buckets them into square cells of a uniform
+# grid, so nearest-neighbour, radius and bounding-box queries only look at nearby cells instead of
+# scanning every vector. A Vector can be changed in place (v += w) while it is in the grid, but the grid
+# only sees the new position after grid.move(v); until then queries still use the position it had.
 
 class Vector:
+    # Only these two (name-mangled) attributes are allowed, so no __dict__ is created per instance.
+    __slots__ = ('__x', '__y')
+
     def __init__(self, x, y):
         # Private attributes: prepending with __ makes them name-mangled.
         self.__x = x  
@@ -22,13 +42,52 @@ class Vector:
         if isinstance(other, Vector):
             # Create and return a new Vector with each corresponding component added together.
             return Vector(self.__x + other.__x, self.__y + other.__y)
+        if isinstance(other, VectorArray):
+            # Let VectorArray.__radd__ broadcast this vector over the batch.
+            return NotImplemented
         # If 'other' is not a Vector, raise an error.
         raise TypeError("Operand must be of type Vector")
 
+    def __radd__(self, other):
+        # Called for '0 + vector', which is how the built-in sum() starts its total.
+        if other == 0:
+            return Vector(self.__x, self.__y)
+        raise TypeError("Operand must be of type Vector")
+
+    def __iadd__(self, other):
+        # Overload '+=' to update this vector in place instead of creating a new one.
+        if isinstance(other, Vector):
+            self.__x += other.__x
+            self.__y += other.__y
+            return self
+        raise TypeError("Operand must be of type Vector")
+
+    def __isub__(self, other):
+        # Overload '-=' to update this vector in place.
+        if isinstance(other, Vector):
+            self.__x -= other.__x
+            self.__y -= other.__y
+            return self
+        raise TypeError("Operand must be of type Vector")
+
+    def __imul__(self, scalar):
+        # Overload '*=' to scale this vector in place by a number.
+        if isinstance(scalar, (int, float)):
+            self.__x *= scalar
+            self.__y *= scalar
+            return self
+        raise TypeError("Operand must be a number")
+
     def __repr__(self):
         # Provide a clear representation of the vector for debugging.
         return f"Vector({self.__x}, {self.__y})"
 
+    def __iter__(self):
+        # Yield the components in order so a Vector can be unpacked (x, y = v) without
+        # exposing the private attributes themselves.
+        yield self.__x
+        yield self.__y
+
     @staticmethod
     def dot_product(v1, v2):
         # Calculate the dot product from two vectors using their private attributes.
@@ -39,28 +98,572 @@ class Vector:
         # Return a new Vector instance at the origin (0,0).
         return cls(0, 0)
 
+    @classmethod
+    def sum(cls, vectors):
+        # Add up any iterable of vectors using two running totals, so no temporary
+        # Vector objects are created along the way; only the result is allocated.
+        total_x = total_y = 0
+        for v in vectors:
+            if not isinstance(v, Vector):
+                raise TypeError("Operand must be of type Vector")
+            total_x += v.__x
+            total_y += v.__y
+        return cls(total_x, total_y)
+
+# NumPy is optional and slow to import: the scalar Vector above works without it, and it is
+# only loaded the first time VectorArray needs it.
+np = None
+
+def _load_numpy(feature):
+    # Import NumPy on first use and return it; raises ImportError naming 'feature' if it is missing.
+    global np
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(f"{feature} requires NumPy") from None
+    return np
+
+class VectorArray:
+    def __init__(self, data):
+        # Store every vector as one row of a contiguous (N, 2) float64 buffer.
+        _load_numpy("VectorArray")
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != 2:
+            raise ValueError("VectorArray data must have shape (N, 2)")
+        self._data = data
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        # Alternative constructor that packs a list of Vector objects into one buffer.
+        _load_numpy("VectorArray")
+        vectors = list(vectors)
+        flat = np.fromiter((c for v in vectors for c in v), dtype=np.float64, count=2 * len(vectors))
+        return cls(flat.reshape(-1, 2))
+
+    @classmethod
+    def origin(cls, n):
+        # Return a VectorArray holding n vectors at the origin (0,0).
+        return cls(_load_numpy("VectorArray").zeros((n, 2)))
+
+    def to_vectors(self):
+        # Convert back to a list of individual Vector objects.
+        return [Vector(x, y) for x, y in self._data.tolist()]
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        # A single index returns a Vector; a slice returns a VectorArray view (no copy).
+        if isinstance(index, slice):
+            return VectorArray(self._data[index])
+        x, y = self._data[index].tolist()
+        return Vector(x, y)
+
+    def __add__(self, other):
+        # Overload the '+' operator for the whole batch at once.
+        if isinstance(other, VectorArray):
+            if len(other) != len(self):
+                raise ValueError("VectorArray operands must have the same length")
+            return VectorArray(self._data + other._data)
+        if isinstance(other, Vector):
+            # Broadcast a single Vector against every row.
+            return VectorArray(self._data + np.array(tuple(other), dtype=np.float64))
+        # Keep the same contract as Vector: anything else is a type error.
+        raise TypeError("Operand must be of type Vector or VectorArray")
+
+    def __radd__(self, other):
+        # Called for 'vector + batch' (addition is commutative) and for the 0 that sum() starts with.
+        if isinstance(other, int) and other == 0:
+            return VectorArray(self._data.copy())
+        return self.__add__(other)
+
+    def __repr__(self):
+        return f"VectorArray({self._data.tolist()})"
+
+    @staticmethod
+    def _as_buffer(value):
+        # Helper that turns either operand type into an array, rejecting anything else.
+        _load_numpy("VectorArray")
+        if isinstance(value, VectorArray):
+            return value._data
+        if isinstance(value, Vector):
+            return np.array(tuple(value), dtype=np.float64)
+        raise TypeError("Operand must be of type Vector or VectorArray")
+
+    @staticmethod
+    def dot_product(a, b):
+        # Element-wise dot product: row i of 'a' with row i of 'b' (or with a single Vector).
+        _load_numpy("VectorArray")
+        a_data = VectorArray._as_buffer(a)
+        b_data = VectorArray._as_buffer(b)
+        if a_data.ndim == 2 and b_data.ndim == 2:
+            if len(a_data) != len(b_data):
+                raise ValueError("VectorArray operands must have the same length")
+            return np.einsum("ij,ij->i", a_data, b_data)
+        return a_data @ b_data if a_data.ndim == 2 else b_data @ a_data
+
+    @staticmethod
+    def pairwise_dot_product(a, b):
+        # Pairwise dot products: entry [i, j] is row i of 'a' dotted with row j of 'b'.
+        if not isinstance(a, VectorArray) or not isinstance(b, VectorArray):
+            raise TypeError("Operands must be of type VectorArray")
+        return a._data @ b._data.T
+
+from array import array
+from operator import mul
+
+def _components(vector):
+    # The memoryview of doubles behind a VectorN or a VectorN.View (TypeError for anything else).
+    if isinstance(vector, VectorN):
+        return memoryview(vector)
+    if isinstance(vector, VectorN.View):
+        return vector._data
+    raise TypeError("Operand must be of type VectorN")
+
+class VectorN(array):
+    # The components are the array's own C doubles; subclassing array gives every VectorN the
+    # buffer protocol on any Python version. No per-instance __dict__ is added.
+    __slots__ = ()
+
+    def __new__(cls, *components):
+        return super().__new__(cls, 'd', components)
+
+    def __reduce__(self):
+        # array's own pickling would call VectorN('d', data); rebuild from the components instead.
+        return (type(self), tuple(self))
+
+    # A vector over a buffer it does not own (see from_buffer). Changes to the buffer show up in
+    # the vector. It has the same operations as VectorN; results are new VectorN objects.
+    class View:
+        __slots__ = ('_data',)
+
+        def __init__(self, data):
+            self._data = data
+
+        def view(self):
+            return self._data
+
+        def __buffer__(self, flags):
+            # Buffer protocol hook (Python 3.12+); on older versions use view().
+            return self._data
+
+        def __len__(self):
+            return len(self._data)
+
+        def __iter__(self):
+            return iter(self._data)
+
+        def __getitem__(self, index):
+            return self._data[index]
+
+        def __add__(self, other):
+            return VectorN.__add__(self, other)
+
+        def __repr__(self):
+            return f"VectorN.View({', '.join(map(str, self._data))})"
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        # Alternative constructor that wraps an existing buffer (bytearray, array, mmap,
+        # NumPy array, ...) in a VectorN.View without copying it.
+        # The buffer must be 1-D and contiguous, and hold either doubles or raw bytes.
+        view = memoryview(buffer)
+        if view.ndim != 1 or not view.c_contiguous:
+            raise ValueError("Buffer must be one-dimensional and contiguous")
+        if view.format in ('B', 'b', 'c'):
+            view = view.cast('B').cast('d')
+        elif view.format != 'd':
+            raise TypeError(f"Buffer must hold doubles ('d') or raw bytes, not format {view.format!r}")
+        return cls.View(view)
+
+    @classmethod
+    def from_vector(cls, vector):
+        # Alternative constructor that converts a 2-D Vector.
+        return cls(*vector)
+
+    @classmethod
+    def origin(cls, dimension=2):
+        # Return a new VectorN at the origin with the requested number of dimensions.
+        return cls(*([0.0] * dimension))
+
+    def view(self):
+        # Return a zero-copy memoryview of the components (format 'd').
+        return memoryview(self)
+
+    def __add__(self, other):
+        # Overload the '+' operator for vectors of the same dimension (array's '+' would
+        # concatenate instead).
+        a, b = _components(self), _components(other)
+        if len(a) != len(b):
+            raise ValueError("Vectors must have the same dimension")
+        return VectorN(*map(float.__add__, a, b))
+
+    def __iadd__(self, other):
+        # Overload '+=' to add in place (array's '+=' would extend the array).
+        b = _components(other)
+        if len(b) != len(self):
+            raise ValueError("Vectors must have the same dimension")
+        for i, value in enumerate(b):
+            self[i] += value
+        return self
+
+    def __mul__(self, other):
+        # array's '*' repeats the array; that makes no sense for a vector.
+        raise TypeError("VectorN does not support '*'")
+
+    __rmul__ = __imul__ = __mul__
+
+    def __repr__(self):
+        return f"VectorN({', '.join(map(str, self))})"
+
+    @staticmethod
+    def dot_product(v1, v2):
+        # Calculate the dot product of two vectors of the same dimension.
+        a, b = _components(v1), _components(v2)
+        if len(a) != len(b):
+            raise ValueError("Vectors must have the same dimension")
+        return sum(map(mul, a, b))
+
+import heapq
+import math
+
+class VectorGrid:
+    def __init__(self, cell_size):
+        # Each cell (column, row) maps to a list of (x, y, vector) entries inside it.
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells = {}
+        self._count = 0
+        # id(vector) -> key of the cell it was put in, so remove() and move() still find a
+        # vector after it has been changed in place.
+        self._cell_of = {}
+        # Number of occupied cells in each column and row, and the (min_col, min_row, max_col,
+        # max_row) bounds of the occupied cells. The bounds are recomputed lazily (None = stale)
+        # only when an edge column or row is emptied.
+        self._col_cells = {}
+        self._row_cells = {}
+        self._bounds = None
+
+    @classmethod
+    def bulk_load(cls, vectors, points_per_cell=4):
+        # Alternative constructor that picks a cell size from the data's bounding box so that
+        # each cell holds about 'points_per_cell' vectors, then inserts everything in one pass.
+        # The longer side also sets a lower bound (about n / points_per_cell cells along it), so
+        # points on a line do not get a microscopic cell size; identical points fall back to 1.0.
+        vectors = list(vectors)
+        if not vectors:
+            return cls(1.0)
+        xs, ys = zip(*vectors)
+        width, height = max(xs) - min(xs), max(ys) - min(ys)
+        share = min(points_per_cell / len(vectors), 1.0)
+        cell_size = max(math.sqrt(width * height * share), max(width, height) * share)
+        grid = cls(cell_size or 1.0)
+        for v in vectors:
+            grid.insert(v)
+        return grid
+
+    def _cell(self, x, y):
+        # Return the (column, row) of the cell containing the point (x, y).
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def __len__(self):
+        return self._count
+
+    def insert(self, vector):
+        # Add a vector to the cell it falls into. Each vector object can be in the grid once.
+        if not isinstance(vector, Vector):
+            raise TypeError("Operand must be of type Vector")
+        if id(vector) in self._cell_of:
+            raise ValueError("Vector is already in the grid")
+        x, y = vector
+        key = self._cell(x, y)
+        entries = self._cells.get(key)
+        if entries is None:
+            entries = self._cells[key] = []
+            self._occupy(key)
+        entries.append((x, y, vector))
+        self._cell_of[id(vector)] = key
+        self._count += 1
+
+    def _occupy(self, key):
+        # Record a newly occupied cell and widen the bounds if they are known.
+        col, row = key
+        self._col_cells[col] = self._col_cells.get(col, 0) + 1
+        self._row_cells[row] = self._row_cells.get(row, 0) + 1
+        if self._bounds is not None:
+            min_col, min_row, max_col, max_row = self._bounds
+            self._bounds = (min(min_col, col), min(min_row, row), max(max_col, col), max(max_row, row))
+        elif len(self._cells) == 1:
+            self._bounds = (col, row, col, row)
+
+    def _vacate(self, key):
+        # Forget an emptied cell; the bounds go stale only if its column or row was on the edge.
+        col, row = key
+        for counts, index in ((self._col_cells, col), (self._row_cells, row)):
+            counts[index] -= 1
+            if not counts[index]:
+                del counts[index]
+                self._bounds = None
+
+    def _occupied_bounds(self):
+        # Return (min_col, min_row, max_col, max_row) of the occupied cells.
+        if self._bounds is None:
+            self._bounds = (min(self._col_cells), min(self._row_cells),
+                            max(self._col_cells), max(self._row_cells))
+        return self._bounds
+
+    def remove(self, vector):
+        # Remove a previously inserted vector (matched by identity). It is looked up in the cell
+        # it was inserted into, not the one its current coordinates fall into.
+        key = self._cell_of.pop(id(vector), None)
+        if key is None:
+            raise ValueError("Vector is not in the grid")
+        entries = self._cells[key]
+        for i, entry in enumerate(entries):
+            if entry[2] is vector:
+                del entries[i]
+                break
+        if not entries:
+            del self._cells[key]
+            self._vacate(key)
+        self._count -= 1
+
+    def move(self, vector):
+        # Re-index a vector after it was changed in place, so queries see its new position.
+        self.remove(vector)
+        self.insert(vector)
+
+    def _entries_in_box(self, min_x, min_y, max_x, max_y):
+        # Yield the (x, y, vector) entries of every cell that overlaps the box. The box is first
+        # clipped to the occupied cells; if it still spans more cells than are occupied, the
+        # occupied cells are scanned instead of the (mostly empty) box.
+        if not self._cells:
+            return
+        low_col, low_row, high_col, high_row = self._occupied_bounds()
+        min_col, min_row = self._cell(min_x, min_y)
+        max_col, max_row = self._cell(max_x, max_y)
+        min_col, min_row = max(min_col, low_col), max(min_row, low_row)
+        max_col, max_row = min(max_col, high_col), min(max_row, high_row)
+        if min_col > max_col or min_row > max_row:
+            return
+        if (max_col - min_col + 1) * (max_row - min_row + 1) > len(self._cells):
+            for (col, row), entries in self._cells.items():
+                if min_col <= col <= max_col and min_row <= row <= max_row:
+                    yield from entries
+            return
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                yield from self._cells.get((col, row), ())
+
+    def in_box(self, min_corner, max_corner):
+        # Return every vector inside the axis-aligned box spanned by the two corners.
+        min_x, min_y = min_corner
+        max_x, max_y = max_corner
+        return [
+            v for x, y, v in self._entries_in_box(min_x, min_y, max_x, max_y)
+            if min_x <= x <= max_x and min_y <= y <= max_y
+        ]
+
+    def within_radius(self, point, radius):
+        # Return every vector whose distance from 'point' is at most 'radius'.
+        px, py = point
+        limit = radius * radius
+        return [
+            v for x, y, v in self._entries_in_box(px - radius, py - radius, px + radius, py + radius)
+            if (x - px) ** 2 + (y - py) ** 2 <= limit
+        ]
+
+    def nearest(self, point, k=1):
+        # Return the k vectors closest to 'point', nearest first. Cells are visited in rings
+        # around the point's cell, clipped to the occupied cells (rings that cannot reach them
+        # are skipped), and the search stops once no unvisited ring can hold anything closer
+        # than the current k-th best match.
+        if self._count == 0 or k <= 0:
+            return []
+        px, py = point
+        center_col, center_row = self._cell(px, py)
+        min_col, min_row, max_col, max_row = self._occupied_bounds()
+        first_ring = max(0, min_col - center_col, center_col - max_col, min_row - center_row, center_row - max_row)
+        last_ring = max(center_col - min_col, max_col - center_col, center_row - min_row, max_row - center_row)
+        best = []  # max-heap of (-distance squared, tie breaker, vector)
+        for ring in range(first_ring, last_ring + 1):
+            top, bottom = center_row - ring, center_row + ring
+            for col in range(max(center_col - ring, min_col), min(center_col + ring, max_col) + 1):
+                if col in (center_col - ring, center_col + ring):
+                    # Left and right edges of the ring: every row.
+                    rows = range(max(top, min_row), min(bottom, max_row) + 1)
+                else:
+                    # Inner columns: only the top and bottom rows of the ring.
+                    rows = [row for row in (top, bottom) if min_row <= row <= max_row]
+                for row in rows:
+                    for x, y, v in self._cells.get((col, row), ()):
+                        item = (-((x - px) ** 2 + (y - py) ** 2), id(v), v)
+                        if len(best) < k:
+                            heapq.heappush(best, item)
+                        elif item > best[0]:
+                            heapq.heapreplace(best, item)
+            if len(best) == k and -best[0][0] <= (ring * self.cell_size) ** 2:
+                break
+        return [v for _, _, v in sorted(best, reverse=True)]
+
 # --- Q4 OUTPUT ---
-print("Q4: Operator Overloading Create a Vector class that supports addition")
-print("    using the + operator, allowing you to add two vectors.")
-print("___________________________________________________________________")
-vector1 = Vector(5, 6)    # Creating the first vector.
-vector2 = Vector(7, 8)  # Creating the second vector.
-vector3 = vector1 + vector2  # Using the overloaded addition operator.
-
-print(f"vector1: {vector1}")
-print(f"vector2: {vector2}")
-print(f"\nvector1 + vector2 = {vector3}")
-
-# Demonstrate the dot product static method.
-print("\nDot Product of vector1 and vector2:", Vector.dot_product(vector1, vector2))
-
-# Demonstrate the class method for obtaining a vector at the origin.
-print("\nOrigin vector:", Vector.origin())
-
-# Testing error handling with non-Vector input.
-print("\n------ Testing with non-Vector input ------")
-try:
-    # This should fail because 5 is not a Vector.
-    result = vector1 + 5
-except TypeError as error:
-    print("ERROR:", error)
\ No newline at end of file
+def demo_q4():
+    # Runs the Q4 demonstration. It is only called when this file is executed
+    # directly, so importing the file defines the classes without printing anything.
+    print("Q4: Operator Overloading Create a Vector class that supports addition")
+    print("    using the + operator, allowing you to add two vectors.")
+    print("___________________________________________________________________")
+    vector1 = Vector(5, 6)    # Creating the first vector.
+    vector2 = Vector(7, 8)  # Creating the second vector.
+    vector3 = vector1 + vector2  # Using the overloaded addition operator.
+
+    print(f"vector1: {vector1}")
+    print(f"vector2: {vector2}")
+    print(f"\nvector1 + vector2 = {vector3}")
+
+    # Demonstrate the dot product static method.
+    print("\nDot Product of vector1 and vector2:", Vector.dot_product(vector1, vector2))
+
+    # Demonstrate the class method for obtaining a vector at the origin.
+    print("\nOrigin vector:", Vector.origin())
+
+    # Testing error handling with non-Vector input.
+    print("\n------ Testing with non-Vector input ------")
+    try:
+        # This should fail because 5 is not a Vector.
+        result = vector1 + 5
+    except TypeError as error:
+        print("ERROR:", error)
+
+    # Demonstrate the in-place operators and the summing helpers.
+    print("\n------ Testing in-place operators and sum ------")
+    moving = Vector(1, 1)
+    moving_id = id(moving)
+    moving += vector1
+    moving -= Vector(1, 1)
+    moving *= 2
+    print("Vector(1, 1) += vector1, -= Vector(1, 1), *= 2 ->", moving)
+    print("Same object after in-place updates?", id(moving) == moving_id)
+    print("Vector.sum([vector1, vector2, vector3]) =", Vector.sum([vector1, vector2, vector3]))
+    print("sum([vector1, vector2, vector3]) =", sum([vector1, vector2, vector3]))
+
+    # Demonstrate the N-dimensional vector and its zero-copy buffer.
+    print("\n------ Testing with VectorN ------")
+    import struct
+
+    point = VectorN(1, 2, 3)
+    print("point:", point)
+    print("point + VectorN(4, 5, 6) =", point + VectorN(4, 5, 6))
+    print("Dot product of point and VectorN(4, 5, 6):", VectorN.dot_product(point, VectorN(4, 5, 6)))
+    print("Origin in 4 dimensions:", VectorN.origin(4))
+    print("From a 2-D Vector:", VectorN.from_vector(vector1))
+    print("Read through struct without copying:", struct.unpack_from("3d", point.view()))
+
+    # Build a vector on top of an existing bytearray; writing to the bytearray updates the vector.
+    raw = bytearray(struct.pack("2d", 7.0, 8.0))
+    shared = VectorN.from_buffer(raw)
+    struct.pack_into("d", raw, 0, 70.0)
+    print("VectorN over a bytearray after changing the bytes:", shared)
+    print("memoryview(point) reads the same storage:", memoryview(point).format, memoryview(point).tolist())
+
+    # Demonstrate the spatial index and compare it with a brute-force scan.
+    print("\n------ Testing with VectorGrid ------")
+    import random
+    import timeit
+
+    random.seed(4)
+    cloud = [Vector(random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(20_000)]
+    grid = VectorGrid.bulk_load(cloud)
+    target = Vector(500, 500)
+    print(f"Indexed {len(grid)} vectors with a cell size of {grid.cell_size:.2f}")
+    print("3 nearest to", target, "->", grid.nearest(target, k=3))
+    print("Vectors within 10 of", target, "->", len(grid.within_radius(target, 10)))
+    print("Vectors inside the box (0, 0)-(10, 10) ->", len(grid.in_box((0, 0), (10, 10))))
+    extra = Vector(500.5, 500.5)
+    grid.insert(extra)
+    print("After inserting", extra, "nearest is", grid.nearest(target)[0])
+    extra += Vector(400, 400)
+    grid.move(extra)
+    print("After moving it to", extra, "nearest is", grid.nearest(target)[0])
+    grid.remove(extra)
+    print("After removing it again, grid holds", len(grid), "vectors")
+
+    def brute_force_nearest(points, point, k):
+        # Reference implementation: measure every point and keep the k closest.
+        px, py = point
+
+        def distance_squared(v):
+            x, y = v
+            return (x - px) ** 2 + (y - py) ** 2
+
+        return heapq.nsmallest(k, points, key=distance_squared)
+
+    queries = [Vector(random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(100)]
+    print("Same answers as brute force?",
+          all(grid.nearest(q, 5) == brute_force_nearest(cloud, q, 5) for q in queries[:10]))
+    grid_time = timeit.timeit(lambda: [grid.nearest(q, 5) for q in queries], number=1)
+    brute_time = timeit.timeit(lambda: [brute_force_nearest(cloud, q, 5) for q in queries], number=1)
+    print(f"100 nearest(k=5) queries over 20,000 vectors: VectorGrid {grid_time:.4f}s, brute force {brute_time:.4f}s")
+
+    # Compare memory and throughput with a plain class that keeps a per-instance __dict__,
+    # which is how Vector was stored before __slots__ was added.
+    print("\n------ Comparing with a __dict__-based vector ------")
+    import sys
+    import tracemalloc
+
+    class PlainVector:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+        def __add__(self, other):
+            return PlainVector(self.x + other.x, self.y + other.y)
+
+    def bytes_per_instance(factory, count=10_000):
+        # Measure the memory allocated while building 'count' instances.
+        tracemalloc.start()
+        items = [factory(i, i) for i in range(count)]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return (size - sys.getsizeof(items)) / len(items)
+
+    print(f"Bytes per instance: PlainVector ~{bytes_per_instance(PlainVector):.0f}, Vector ~{bytes_per_instance(Vector):.0f}")
+
+    plain_items = [PlainVector(i, i) for i in range(10_000)]
+    slot_items = [Vector(i, i) for i in range(10_000)]
+
+    def plain_loop():
+        # The manual loop that allocates a new object for every addition.
+        total = PlainVector(0, 0)
+        for v in plain_items:
+            total = total + v
+        return total
+
+    plain_time = timeit.timeit(plain_loop, number=20)
+    sum_time = timeit.timeit(lambda: Vector.sum(slot_items), number=20)
+    print(f"Summing 10,000 vectors x20: PlainVector loop {plain_time:.4f}s, Vector.sum {sum_time:.4f}s")
+
+    # Demonstrate batch operations with VectorArray (skipped when NumPy is not installed).
+    print("\n------ Testing with VectorArray ------")
+    try:
+        _load_numpy("VectorArray")
+    except ImportError:
+        print("NumPy is not installed; skipping VectorArray demo.")
+    else:
+        batch = VectorArray.from_vectors([vector1, vector2, Vector(1, 2)])
+        print("batch:", batch)
+        print("batch + vector1 =", batch + vector1)
+        print("batch + batch =", batch + batch)
+        print("Element-wise dot product with vector2:", VectorArray.dot_product(batch, vector2).tolist())
+        print("Pairwise dot products:", VectorArray.pairwise_dot_product(batch, batch).tolist())
+        print("Back to Vectors:", batch.to_vectors())
+        try:
+            # This should fail because 5 is neither a Vector nor a VectorArray.
+            result = batch + 5
+        except TypeError as error:
+            print("ERROR:", error)
+
+if __name__ == "__main__":
+    demo_q4()
\ No newline at end of file
@@ -9,6 +9,27 @@
 #
 # This design shows how to build complex objects by composing simpler ones,
 # thereby favoring flexible design over deep inheritance hierarchies.
+#
+# The Book also caches the rendered line of every chapter and a running total of pages (a prefix sum), so
+# printing the book only formats chapters that changed, and "which chapter is page P on?" is a binary search.
+# Changes made through add_chapter, insert_chapter, remove_chapter, replace_chapter or by assigning a new
+# chapter list are picked up automatically; after editing the list or a chapter in place, call invalidate().
+#
+# For very large collections, a 'ChapterStore' can stand in for the chapter list. It keeps chapter titles,
+# page counts and text in a file read through mmap, and only builds Chapter objects when they are accessed
+# (keeping the most recently used ones in a small LRU cache).
+#
+# A 'Library' catalogs many books. It indexes them by author name and keeps an inverted index from each
+# word in a book or chapter title to the matching books and chapters, so term and prefix searches do not
+# walk every book. Books tell the library about new chapters, so the index stays up to date.
+
+import mmap
+import re
+import struct
+from bisect import bisect_left, insort
+from heapq import merge
+from array import array
+from collections import OrderedDict
 
 class Author:
     def __init__(self, name):
@@ -23,9 +44,10 @@ class Author:
 class Book:
     # Nested Chapter class to represent individual chapters.
     class Chapter:
-        def __init__(self, title, num_pages):
+        def __init__(self, title, num_pages, text=None):
             self.title = title          # The chapter’s title.
             self.num_pages = num_pages  # The number of pages in the chapter.
+            self.text = text            # Optional chapter content.
 
         def __str__(self):
             # Returns a string showing the chapter title and its page count.
@@ -35,36 +57,424 @@ class Book:
         # Initialize the Book with a title and an Author object.
         self.title = title      
         self.author = author    # Composition: the Book directly includes an Author instance.
-        # Aggregation: the Book holds a list of chapters.
-        self.chapters = chapters if chapters is not None else []
+        # Aggregation: the Book holds a list of chapters (or a ChapterStore).
+        self._chapters = chapters if chapters is not None else []
+        # Caches kept in step with the chapter list, filled in lazily by _update():
+        #   _rendered[i]  is the "Chapter n: ..." line of chapter i
+        #   _page_ends[i] is the number of pages in chapters 0..i (a prefix sum)
+        #   _valid        is how many leading chapters the two lists above describe correctly
+        #   _text         is ((title, author line), full rendering) of the last rendering,
+        #                 or None when the chapters changed and it must be rebuilt
+        self._rendered = []
+        self._page_ends = []
+        self._valid = 0
+        self._known_length = len(self.chapters)
+        self._text = None
+        # Objects (such as a Library) told about chapters added to or removed from this book.
+        self._watchers = []
+
+    @property
+    def chapters(self):
+        return self._chapters
+
+    @chapters.setter
+    def chapters(self, chapters):
+        # Assigning a new chapter list drops the caches and is reported to the watchers.
+        for watcher in self._watchers:
+            for position, chapter in enumerate(self._chapters):
+                watcher.chapter_removed(self, position, chapter)
+        self._chapters = chapters
+        self._refresh_from(0)
+        for watcher in self._watchers:
+            for position, chapter in enumerate(chapters):
+                watcher.chapter_added(self, position, chapter)
+
+    def invalidate(self):
+        # Drop the cached rendering and page totals. Needed after changes the Book cannot see:
+        # book.chapters[i] = ..., sorting the list, or editing a chapter's title or num_pages.
+        self._refresh_from(0)
+
+    def _refresh_from(self, start):
+        # Mark the chapters from position 'start' onwards as changed; earlier ones stay cached.
+        self._valid = min(self._valid, start)
+        self._known_length = len(self.chapters)
+        self._text = None
+
+    def _update(self):
+        # Render and total only the chapters that changed since the last update.
+        if len(self.chapters) != self._known_length:
+            # The chapter list was changed directly rather than through add_chapter and friends.
+            self._refresh_from(0)
+        start = self._valid
+        if start == len(self.chapters) == len(self._rendered):
+            return
+        del self._rendered[start:]
+        del self._page_ends[start:]
+        total = self._page_ends[-1] if self._page_ends else 0
+        for number in range(start, len(self.chapters)):
+            chapter = self.chapters[number]
+            self._rendered.append(f"Chapter {number + 1}: {chapter}")
+            total += chapter.num_pages
+            self._page_ends.append(total)
+        self._valid = len(self.chapters)
+        self._text = None
 
     def add_chapter(self, chapter: 'Book.Chapter'):
-        # Adds a chapter to the book’s chapter list.
+        # Adds a chapter to the book’s chapter list; only the new chapter will be formatted.
         self.chapters.append(chapter)
+        self._refresh_from(len(self.chapters) - 1)
+        for watcher in self._watchers:
+            watcher.chapter_added(self, len(self.chapters) - 1, chapter)
+
+    def insert_chapter(self, index, chapter: 'Book.Chapter'):
+        # Inserts a chapter before position 'index'; the chapters after it are renumbered.
+        position = index + len(self.chapters) if index < 0 else index
+        position = max(0, min(position, len(self.chapters)))
+        self.chapters.insert(position, chapter)
+        self._refresh_from(position)
+        for watcher in self._watchers:
+            watcher.chapter_added(self, position, chapter)
+
+    def remove_chapter(self, index):
+        # Removes and returns the chapter at 'index'; the chapters after it are renumbered.
+        position = index + len(self.chapters) if index < 0 else index
+        chapter = self.chapters.pop(position)
+        self._refresh_from(position)
+        for watcher in self._watchers:
+            watcher.chapter_removed(self, position, chapter)
+        return chapter
+
+    def replace_chapter(self, index, chapter: 'Book.Chapter'):
+        # Replaces the chapter at 'index' and returns the old one; later chapters keep their cache.
+        position = index + len(self.chapters) if index < 0 else index
+        old_chapter = self.chapters[position]
+        self.chapters[position] = chapter
+        self._refresh_from(position)
+        for watcher in self._watchers:
+            watcher.chapter_removed(self, position, old_chapter)
+            watcher.chapter_added(self, position, chapter)
+        return old_chapter
+
+    @property
+    def total_pages(self):
+        # Total page count, read from the end of the prefix sum.
+        self._update()
+        return self._page_ends[-1] if self._page_ends else 0
+
+    def chapter_at_page(self, page):
+        # Returns the chapter containing page number 'page' (pages are numbered from 1).
+        if not 1 <= page <= self.total_pages:
+            raise IndexError(f"Page {page} is outside this book (1-{self.total_pages})")
+        return self.chapters[bisect_left(self._page_ends, page)]
 
     def __str__(self):
         # Provides a full description of the book including a numbered listing of chapters.
-        chapter_details = "\n  ".join(
-            f"Chapter {i + 1}: {chapter}" for i, chapter in enumerate(self.chapters)
-        )
-        return f"Book: {self.title}\n{self.author}\nChapters:\n  {chapter_details}"
+        # The title and author are public attributes, so the cached text is keyed on them too.
+        self._update()
+        heading = (self.title, str(self.author))
+        if self._text is None or self._text[0] != heading:
+            chapter_details = "\n  ".join(self._rendered)
+            self._text = (heading, f"Book: {heading[0]}\n{heading[1]}\nChapters:\n  {chapter_details}")
+        return self._text[1]
+
+# File-backed, append-only replacement for a Book's list of chapters.
+class ChapterStore:
+    # Each chapter is stored as a fixed header (title length, page count, text length)
+    # followed by the UTF-8 title and text.
+    RECORD = struct.Struct('<IIQ')
+
+    def __init__(self, path, cache_size=256):
+        # Open (or create) the store. Only the small record headers are scanned here, to find
+        # where each chapter starts; titles and texts are not decoded until a chapter is used.
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # chapter number -> Chapter, least recently used first
+        self._file = open(path, 'a+b')
+        self._map = None
+        self._stale = False  # True when chapters were appended after the file was mapped
+        self._offsets = array('Q')
+        self._remap()
+        position = 0
+        while position < len(self._map):
+            self._offsets.append(position)
+            title_length, _, text_length = self.RECORD.unpack_from(self._map, position)
+            position += self.RECORD.size + title_length + text_length
+
+    def _remap(self):
+        # (Re)map the whole file; needed after appends because a mapping has a fixed size.
+        if self._map is not None and len(self._map):
+            self._map.close()
+        self._file.flush()
+        size = self._file.seek(0, 2)
+        # mmap cannot map an empty file, so an empty store uses an empty buffer instead.
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._stale = False
+
+    def append(self, chapter):
+        # Write a chapter to the end of the file (this is what Book.add_chapter calls).
+        title = chapter.title.encode()
+        text = (chapter.text or '').encode()
+        self._offsets.append(self._file.seek(0, 2))
+        self._file.write(self.RECORD.pack(len(title), chapter.num_pages, len(text)) + title + text)
+        self._stale = True
+
+    def insert(self, index, chapter):
+        raise TypeError("ChapterStore is append-only")
+
+    def __setitem__(self, index, chapter):
+        raise TypeError("ChapterStore is append-only")
+
+    def pop(self, index=-1):
+        raise TypeError("ChapterStore is append-only")
+
+    def _load(self, number):
+        # Decode one chapter straight from the mapped file.
+        if self._stale:
+            self._remap()
+        position = self._offsets[number]
+        title_length, num_pages, text_length = self.RECORD.unpack_from(self._map, position)
+        start = position + self.RECORD.size
+        title = bytes(self._map[start:start + title_length]).decode()
+        text = bytes(self._map[start + title_length:start + title_length + text_length]).decode()
+        return Book.Chapter(title, num_pages, text or None)
+
+    def __getitem__(self, index):
+        # Return chapter 'index', from the LRU cache when possible.
+        if isinstance(index, slice):
+            return [self[number] for number in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ChapterStore index out of range")
+        chapter = self._cache.get(index)
+        if chapter is not None:
+            self._cache.move_to_end(index)
+            return chapter
+        chapter = self._cache[index] = self._load(index)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return chapter
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __iter__(self):
+        for number in range(len(self)):
+            yield self[number]
+
+    def close(self):
+        if len(self._map):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# Catalog of books with an author index and a word index over titles.
+class Library:
+    def __init__(self, books=()):
+        self._books_by_author = {}  # author name -> [Book, ...]
+        self._author_names = {}     # id(book) -> author name the book was filed under
+        # Inverted index: word -> {key: (book, chapter reference)}, see _reference() and _key().
+        # A None reference means the word is in the book's own title.
+        self._postings = {}
+        # key -> words it was indexed under, so it can be unindexed even after a title changes.
+        self._indexed_words = {}
+        # Sorted word lists for prefix searches. New words go into the small sorted _new_words
+        # batch, which is merged into _words once it outgrows about sqrt(len(_words)), so adding
+        # a word costs O(sqrt W) amortized. Removed words stay listed (searches skip them) until
+        # they make up half of _words. _listed is the set of words in either list.
+        self._words = []
+        self._new_words = []
+        self._listed = set()
+        self._dead_words = 0
+        for book in books:
+            self.add(book)
+
+    @staticmethod
+    def _tokens(title):
+        # Lower-cased words of a title, each listed once.
+        return set(re.findall(r"\w+", title.lower()))
+
+    @staticmethod
+    def _reference(book, position, chapter):
+        # How the index refers to a chapter. A ChapterStore rebuilds Chapter objects after they
+        # drop out of its cache, and holding them here would defeat that cache, so its chapters
+        # are referred to by position (stable, as the store is append-only) and read back when
+        # they are found. Chapters in a plain list are referred to directly.
+        return position if isinstance(book.chapters, ChapterStore) else chapter
+
+    @staticmethod
+    def _key(book, reference):
+        if reference is None:
+            return (id(book), None)
+        if isinstance(reference, int):
+            return (id(book), 'position', reference)
+        return (id(book), 'chapter', id(reference))
+
+    @staticmethod
+    def _resolve(entries):
+        # Turn (book, reference) index entries into (book, chapter or None) results.
+        return [(book, book.chapters[reference] if isinstance(reference, int) else reference)
+                for book, reference in entries]
+
+    def _index(self, title, book, reference):
+        key = self._key(book, reference)
+        words = self._tokens(title)
+        previous = self._indexed_words.get(key)
+        self._indexed_words[key] = tuple(words.union(previous) if previous else words)
+        for word in words:
+            entries = self._postings.get(word)
+            if entries is None:
+                entries = self._postings[word] = {}
+                self._list_word(word)
+            entries[key] = (book, reference)
+
+    def _unindex(self, book, reference):
+        key = self._key(book, reference)
+        for word in self._indexed_words.pop(key, ()):
+            entries = self._postings.get(word, {})
+            entries.pop(key, None)
+            if not entries and word in self._postings:
+                del self._postings[word]
+                self._dead_words += 1
+                if self._dead_words * 2 > len(self._words) + len(self._new_words):
+                    self._compact_words()
+
+    def _list_word(self, word):
+        # Called when 'word' gets its first posting.
+        if word in self._listed:
+            self._dead_words -= 1  # It was removed earlier but is still listed.
+            return
+        self._listed.add(word)
+        insort(self._new_words, word)
+        if len(self._new_words) ** 2 > max(len(self._words), 1 << 16):
+            self._words = list(merge(self._words, self._new_words))
+            self._new_words = []
+
+    def _compact_words(self):
+        # Drop removed words from the lists.
+        self._words = [word for word in merge(self._words, self._new_words) if word in self._postings]
+        self._new_words = []
+        self._listed = set(self._words)
+        self._dead_words = 0
+
+    def add(self, book):
+        # Catalog a book: index its author, its title and every chapter title, and
+        # watch it so chapters added later are indexed too.
+        self._books_by_author.setdefault(book.author.name, []).append(book)
+        self._author_names[id(book)] = book.author.name
+        self._index(book.title, book, None)
+        for position, chapter in enumerate(book.chapters):
+            self._index(chapter.title, book, self._reference(book, position, chapter))
+        book._watchers.append(self)
+
+    def remove(self, book):
+        # Take a book and all of its chapters out of the catalog. Everything is looked up by what
+        # was indexed, so renaming the book, its chapters or its author in the meantime is fine.
+        author_name = self._author_names.pop(id(book))
+        self._books_by_author[author_name].remove(book)
+        if not self._books_by_author[author_name]:
+            del self._books_by_author[author_name]
+        self._unindex(book, None)
+        for position, chapter in enumerate(book.chapters):
+            self._unindex(book, self._reference(book, position, chapter))
+        book._watchers.remove(self)
+
+    def chapter_added(self, book, position, chapter):
+        # Called by Book when a chapter is added at 'position'.
+        self._index(chapter.title, book, self._reference(book, position, chapter))
+
+    def chapter_removed(self, book, position, chapter):
+        # Called by Book when the chapter at 'position' is removed.
+        self._unindex(book, self._reference(book, position, chapter))
+
+    def books_by(self, author_name):
+        return list(self._books_by_author.get(author_name, []))
+
+    def search(self, term):
+        # (book, chapter) pairs whose title contains the word 'term'; chapter is None
+        # for a match on the book's own title.
+        return self._resolve(self._postings.get(term.lower(), {}).values())
+
+    def search_prefix(self, prefix):
+        # Like search(), for every indexed word starting with 'prefix'.
+        prefix = prefix.lower()
+        matches = {}
+        for words in (self._words, self._new_words):
+            position = bisect_left(words, prefix)
+            while position < len(words) and words[position].startswith(prefix):
+                matches.update(self._postings.get(words[position], {}))
+                position += 1
+        return self._resolve(matches.values())
 
 # --- Q5 OUTPUT ---
-print("Q5: Composition Over Inheritance: Create a Book class with a Author class")
-print("    included within it, demonstrating composition over inheritance.")
-print("___________________________________________________________________")
-# Create an Author instance.
-author = Author("Koyoharu Gotouge")
-# Create a Book instance, here representing Volume 1 of a manga.
-book = Book("Kimetsu no Yaiba: Volume 1", author)
-
-# Add chapters to the book along with their page counts.
-book.add_chapter(Book.Chapter("Cruelty", 55))
-book.add_chapter(Book.Chapter("The Stranger", 25))
-book.add_chapter(Book.Chapter("Return by Dawn", 23))
-book.add_chapter(Book.Chapter("Tanjiro's Journal, Part One", 19))
-book.add_chapter(Book.Chapter("Tanjiro's Journal, Part Two", 19))
-book.add_chapter(Book.Chapter("A Mountain of Hands", 19))
-book.add_chapter(Book.Chapter("Spirits of the Deceased", 21))
-
-print(book)
\ No newline at end of file
+def demo_q5():
+    # Runs the Q5 demonstration. It is only called when this file is executed
+    # directly, so importing the file defines the classes without printing anything.
+    print("Q5: Composition Over Inheritance: Create a Book class with a Author class")
+    print("    included within it, demonstrating composition over inheritance.")
+    print("___________________________________________________________________")
+    # Create an Author instance.
+    author = Author("Koyoharu Gotouge")
+    # Create a Book instance, here representing Volume 1 of a manga.
+    book = Book("Kimetsu no Yaiba: Volume 1", author)
+
+    # Add chapters to the book along with their page counts.
+    book.add_chapter(Book.Chapter("Cruelty", 55))
+    book.add_chapter(Book.Chapter("The Stranger", 25))
+    book.add_chapter(Book.Chapter("Return by Dawn", 23))
+    book.add_chapter(Book.Chapter("Tanjiro's Journal, Part One", 19))
+    book.add_chapter(Book.Chapter("Tanjiro's Journal, Part Two", 19))
+    book.add_chapter(Book.Chapter("A Mountain of Hands", 19))
+    book.add_chapter(Book.Chapter("Spirits of the Deceased", 21))
+
+    print(book)
+
+    # Look up chapters by page number using the running page totals.
+    print(f"\nTotal pages: {book.total_pages}")
+    print(f"Page 1 is in: {book.chapter_at_page(1)}")
+    print(f"Page 56 is in: {book.chapter_at_page(56)}")
+    print(f"Page {book.total_pages} is in: {book.chapter_at_page(book.total_pages)}")
+
+    # Insert and remove chapters; only the chapters after the change are re-rendered.
+    book.insert_chapter(1, Book.Chapter("Bonus Sketches", 4))
+    print(f"\nAfter inserting a chapter at position 2:\n{book}")
+    book.remove_chapter(1)
+    print(f"\nAfter removing it again, total pages: {book.total_pages}")
+
+    # Catalog books and search their titles.
+    print("\n------ Searching a Library ------")
+    volume_two = Book("Kimetsu no Yaiba: Volume 2", author)
+    library = Library([book, volume_two])
+    volume_two.add_chapter(Book.Chapter("It's Tanjiro Kamado!!", 19))
+    print(f"Books by {author.name}: {[listed.title for listed in library.books_by(author.name)]}")
+    for found_book, chapter in library.search("tanjiro"):
+        print(f"  'tanjiro' -> {found_book.title}: {chapter}")
+    for found_book, chapter in library.search_prefix("journ"):
+        print(f"  'journ*'  -> {found_book.title}: {chapter}")
+    print(f"  'volume'  -> {len(library.search('volume'))} book titles")
+
+    # Keep a large series on disk and let the Book read chapters only when it needs them.
+    print("\n------ Storing chapters on disk ------")
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as folder:
+        store_path = os.path.join(folder, "series.chapters")
+        with ChapterStore(store_path) as store:
+            for number in range(1, 20_001):
+                store.append(Book.Chapter(f"Chapter Title {number}", 20 + number % 7, f"Text of chapter {number}."))
+        with ChapterStore(store_path, cache_size=100) as store:
+            series = Book("Kimetsu no Yaiba: Collected Edition", author, store)
+            series.add_chapter(Book.Chapter("Epilogue", 12, "The end."))
+            print(f"Chapters on disk: {len(store)}, cached in memory: {len(store._cache)}")
+            print(f"Page 1000 is in: {series.chapter_at_page(1000)}")
+            print(f"Text of the last chapter: {store[-1].text}")
+            print("\n".join(str(series).splitlines()[:5]))
+            print(f"Chapters cached after printing the whole book: {len(store._cache)}")
+
+if __name__ == "__main__":
+    demo_q5()
\ No newline at end of file
@@ -0,0 +1,47 @@
+# Importable access to the classes of the five OOP questions.
+#
+# The question files have names that cannot be imported directly and they run their demos when
+# executed as scripts. This package wraps each file in a submodule (oop_questions.q1 ... q5) and loads
+# those lazily: "from oop_questions import Vector" only runs the Q4 file, the first time a Q4 name is
+# used, and nothing is printed. The demos are run explicitly with:
+#
+#     python -m oop_questions demo q3
+#
+# Setting OOP_QUESTIONS_PROFILE=1 turns on the instrumentation in instrument.py for the whole run.
+
+import importlib
+import os
+
+# Which question module defines each public name.
+_EXPORTS = {
+    'q1': ('Vehicle', 'SchoolBus', 'Fruit', 'Fleet', 'EngineStartDispatcher', 'SchoolBusPlanner'),
+    'q2': ('Employee', 'DepartmentRegistry', 'EmployeeRecord', 'EmployeeTable', 'EmployeeSnapshot',
+           'EmployeeReportWriter', 'EmployeeDirectory'),
+    'q3': ('School', 'SchoolOne', 'SchoolTwo', 'GradeFile', 'SchoolBatchRunner', 'District'),
+    'q4': ('Vector', 'VectorArray', 'VectorN', 'VectorGrid'),
+    'q5': ('Author', 'Book', 'ChapterStore', 'Library'),
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+QUESTIONS = tuple(_EXPORTS)
+__all__ = sorted(_MODULE_OF)
+
+
+def __getattr__(name):
+    # Called only for names not yet in this module: import the question module that defines
+    # 'name' and keep the result here, so later lookups are ordinary attribute reads.
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if os.environ.get('OOP_QUESTIONS_PROFILE', '0') != '0':
+    from oop_questions import instrument
+    instrument.enable_from_environment()
@@ -0,0 +1,66 @@
+# Command-line entry point:
+#
+#     python -m oop_questions demo q3                 run the demo of one question ("all" runs every one)
+#     python -m oop_questions importtime --max-ms 50  measure cold-start import times
+#     python -m oop_questions bench --baseline old.json  run the benchmark suite (see benchmarks.py)
+
+import argparse
+import importlib
+import sys
+
+from oop_questions import QUESTIONS
+
+SEPARATOR = "\n==================================================================\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m oop_questions")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    demo = commands.add_parser("demo", help="run the demonstration of a question")
+    demo.add_argument("question", choices=QUESTIONS + ("all",))
+
+    timing = commands.add_parser("importtime", help="measure cold-start import time with -X importtime")
+    timing.add_argument("--runs", type=int, default=5, help="fresh interpreters started per target (default: 5)")
+    timing.add_argument("--max-ms", type=float, default=None,
+                        help="exit with status 1 if any target's median import time exceeds this")
+
+    bench = commands.add_parser("bench", help="run the benchmark suite")
+    bench.add_argument("--only", action="append", metavar="NAME",
+                       help="run only this benchmark (repeatable)")
+    bench.add_argument("--sizes", default="100,1000,10000,100000",
+                       help="comma-separated input sizes, up to 10000000 (default: 100,1000,10000,100000)")
+    bench.add_argument("--seed", type=int, default=0, help="seed for the synthetic data (default: 0)")
+    bench.add_argument("--repeat", type=int, default=5,
+                       help="timed samples per measurement, each at least 0.2 s; the best is kept (default: 5)")
+    bench.add_argument("--output", help="write the results as JSON to this file")
+    bench.add_argument("--baseline", help="JSON results to compare against")
+    bench.add_argument("--threshold", type=float, default=0.2,
+                       help="allowed throughput drop before failing, as a fraction (default: 0.2)")
+
+    args = parser.parse_args(argv)
+    if args.command == "demo":
+        questions = QUESTIONS if args.question == "all" else (args.question,)
+        for number, question in enumerate(questions):
+            if number:
+                print(SEPARATOR)
+            module = importlib.import_module(f"oop_questions.{question}")
+            getattr(module, f"demo_{question}")()
+        return 0
+
+    if args.command == "bench":
+        from oop_questions import benchmarks
+        unknown = set(args.only or ()) - set(benchmarks.BENCHMARKS)
+        if unknown:
+            parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}; "
+                         f"choose from {', '.join(benchmarks.BENCHMARKS)}")
+        sizes = [int(size) for size in args.sizes.split(",")]
+        return benchmarks.main(args.only, sizes, args.seed, args.repeat, args.output,
+                               args.baseline, args.threshold)
+
+    from oop_questions.startup import run_benchmark
+    return run_benchmark(args.runs, args.max_ms)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+# Loads a question file into one of the oop_questions.q1 ... q5 modules.
+
+import os
+from importlib.machinery import SourceFileLoader
+
+# The question files live in the repository root, next to this package.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FILES = {
+    'q1': '5-OOP-Questions_Q1(Vehicle-Instance).py',
+    'q2': '5-OOP-Questions_Q2(Multiple-Constructors).py',
+    'q3': '5-OOP-Questions_Q3(Two-Schools-Grades).py',
+    'q4': '5-OOP-Questions_Q4(Vectors).py',
+    'q5': '5-OOP-Questions_Q5(Composition-Inheritance).py',
+}
+
+
+def load_question(module, question):
+    # Execute the question file inside 'module'. The module's __name__ is not "__main__", so
+    # the file defines its classes without running its demo, and everything it defines belongs
+    # to 'module' (which keeps functions picklable, e.g. for SchoolBatchRunner's worker processes).
+    # SourceFileLoader also caches the compiled bytecode in __pycache__ like a normal import.
+    SourceFileLoader(module.__name__, os.path.join(ROOT, FILES[question])).exec_module(module)
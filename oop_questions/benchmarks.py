@@ -0,0 +1,224 @@
+# Benchmark suite for the hot paths of the five model families:
+#
+#     Vector.__add__ / Vector.dot_product           (Q4)
+#     School.GradeCalculator.average / gpa          (Q3)
+#     Employee.from_string / iter_from_lines        (Q2)
+#     EmployeeTable vs a list of Employee objects   (Q2)
+#     EmployeeReportWriter vs one print() per line  (Q2)
+#     Book.__str__                                  (Q5)
+#     Vehicle / SchoolBus construction              (Q1)
+#
+# Every benchmark runs at several input sizes on seeded synthetic data and reports operations per
+# second, peak traced memory, and the bytes and memory blocks the result keeps alive per operation (Python
+# has no counter of every allocation, so temporaries freed during the run are not included). Results can be
+# written as JSON and compared with an earlier results file, failing when throughput drops past a threshold:
+#
+#     python -m oop_questions bench --output baseline.json
+#     python -m oop_questions bench --baseline baseline.json --threshold 0.2
+
+import gc
+import io
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+
+import oop_questions
+
+SIZES = tuple(10 ** power for power in range(2, 8))  # 1e2 ... 1e7
+DEFAULT_SIZES = SIZES[:4]                             # 1e2 ... 1e5; larger sizes take minutes and GBs
+DEPARTMENTS = ('HR', 'IT', 'Marketing', 'Finance')
+
+
+# --- Seeded synthetic data generators (one per model family) ---
+
+def make_vectors(n, rng):
+    Vector = oop_questions.Vector
+    return [Vector(rng.uniform(-1000, 1000), rng.uniform(-1000, 1000)) for _ in range(n)]
+
+
+def make_grades(n, rng):
+    return [rng.randint(0, 100) for _ in range(n)]
+
+
+def make_employee_strings(n, rng):
+    return [f"{i:08d}-Employee {rng.randrange(10 ** 6)}-{rng.choice(DEPARTMENTS)}" for i in range(n)]
+
+
+def make_employee_text(n, rng):
+    return "".join(f"{row}\n" for row in make_employee_strings(n, rng))
+
+
+def make_chapters(n, rng):
+    Chapter = oop_questions.Book.Chapter
+    return [Chapter(f"Chapter Title {rng.randrange(10 ** 6)}", rng.randint(10, 60)) for _ in range(n)]
+
+
+def make_vehicle_specs(n, rng):
+    return [(f"Model {rng.randrange(1000)}", str(rng.randint(1990, 2025)), rng.choice((17, 30, 45, 60)))
+            for _ in range(n)]
+
+
+# --- Benchmarks: name -> (setup(n, rng) returning arguments, run(*arguments) returning a result) ---
+
+def _vector_add(left, right):
+    return [a + b for a, b in zip(left, right)]
+
+
+def _vector_dot(left, right):
+    dot_product = oop_questions.Vector.dot_product
+    return [dot_product(a, b) for a, b in zip(left, right)]
+
+
+def _grade_average(grades):
+    return oop_questions.School.GradeCalculator.average(grades)
+
+
+def _grade_gpa(grades):
+    return oop_questions.School.GradeCalculator.gpa(grades, oop_questions.SchoolOne.gpa_scale)
+
+
+def _employee_from_string(rows):
+    from_string = oop_questions.Employee.from_string
+    return [from_string(row) for row in rows]
+
+
+def _employee_iter_from_lines(text):
+    return list(oop_questions.Employee.iter_from_lines(io.StringIO(text)))
+
+
+def _employee_table_from_lines(text):
+    # Same rows as employee_iter_from_lines, kept as columns: compare their retained bytes per op.
+    return oop_questions.EmployeeTable(oop_questions.Employee.iter_from_lines(io.StringIO(text)))
+
+
+def _employee_print_report(table):
+    with open(os.devnull, 'w') as devnull:
+        for employee in table:
+            print(employee.display_info(), file=devnull)
+
+
+def _employee_report_writer(table):
+    with open(os.devnull, 'w') as devnull, oop_questions.EmployeeReportWriter(devnull) as writer:
+        return writer.write(table)
+
+
+def _make_employee_table(n, rng):
+    Employee = oop_questions.Employee
+    return (oop_questions.EmployeeTable(Employee.from_string(row) for row in make_employee_strings(n, rng)),)
+
+
+def _book_str(chapters):
+    # A fresh Book each time, so the first (uncached) rendering is what gets measured.
+    book = oop_questions.Book("Benchmark Volume", oop_questions.Author("Benchmark Author"), list(chapters))
+    return str(book)
+
+
+def _vehicle_construct(specs):
+    Vehicle = oop_questions.Vehicle
+    return [Vehicle(name, model) for name, model, _ in specs]
+
+
+def _school_bus_construct(specs):
+    SchoolBus = oop_questions.SchoolBus
+    return [SchoolBus(name, model, capacity) for name, model, capacity in specs]
+
+
+BENCHMARKS = {
+    'vector_add': (lambda n, rng: (make_vectors(n, rng), make_vectors(n, rng)), _vector_add),
+    'vector_dot_product': (lambda n, rng: (make_vectors(n, rng), make_vectors(n, rng)), _vector_dot),
+    'grade_average': (lambda n, rng: (make_grades(n, rng),), _grade_average),
+    'grade_gpa': (lambda n, rng: (make_grades(n, rng),), _grade_gpa),
+    'employee_from_string': (lambda n, rng: (make_employee_strings(n, rng),), _employee_from_string),
+    'employee_iter_from_lines': (lambda n, rng: (make_employee_text(n, rng),), _employee_iter_from_lines),
+    'employee_table_from_lines': (lambda n, rng: (make_employee_text(n, rng),), _employee_table_from_lines),
+    'employee_print_report': (_make_employee_table, _employee_print_report),
+    'employee_report_writer': (_make_employee_table, _employee_report_writer),
+    'book_str': (lambda n, rng: (make_chapters(n, rng),), _book_str),
+    'vehicle_construct': (lambda n, rng: (make_vehicle_specs(n, rng),), _vehicle_construct),
+    'school_bus_construct': (lambda n, rng: (make_vehicle_specs(n, rng),), _school_bus_construct),
+}
+
+
+def measure(name, n, seed=0, repeat=5):
+    # Run one benchmark at size n. Each of the 'repeat' samples times as many calls as fill at
+    # least 0.2 s (timeit's autorange), so small sizes are not timed over a few microseconds; the
+    # fastest sample is kept. Memory is measured in one extra call under tracemalloc.
+    # "retained_bytes_per_op" and "retained_blocks_per_op" are the traced bytes and the memory blocks
+    # still allocated after that call (the result is kept alive), divided by n.
+    setup, run = BENCHMARKS[name]
+    arguments = setup(n, random.Random(seed))
+    timer = timeit.Timer(lambda: run(*arguments))
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat, number)) / number
+
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = run(*arguments)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks_before
+    del result
+    return {
+        'benchmark': name,
+        'size': n,
+        'seconds': best,
+        'ops_per_sec': n / best if best else float('inf'),
+        'peak_bytes': peak,
+        'retained_bytes_per_op': retained / n,
+        'retained_blocks_per_op': max(blocks, 0) / n,
+    }
+
+
+def run_suite(names=None, sizes=DEFAULT_SIZES, seed=0, repeat=5, report=print):
+    # Run every selected benchmark at every size; returns the list of result records.
+    results = []
+    for name in names or BENCHMARKS:
+        for n in sizes:
+            record = measure(name, n, seed, repeat)
+            results.append(record)
+            report(f"{name:<26} n={n:<10,} {record['ops_per_sec']:>14,.0f} ops/s "
+                   f"{record['peak_bytes'] / 1024:>12,.1f} KiB peak "
+                   f"{record['retained_bytes_per_op']:>8.1f} retained B/op "
+                   f"{record['retained_blocks_per_op']:>7.2f} retained blocks/op")
+    return results
+
+
+def compare(results, baseline, threshold):
+    # Return the (benchmark, size, baseline ops/s, current ops/s) entries whose throughput fell
+    # by more than 'threshold' (0.2 = 20%) compared with the baseline results.
+    previous = {(record['benchmark'], record['size']): record['ops_per_sec'] for record in baseline['results']}
+    regressions = []
+    for record in results:
+        before = previous.get((record['benchmark'], record['size']))
+        if before and record['ops_per_sec'] < before * (1 - threshold):
+            regressions.append((record['benchmark'], record['size'], before, record['ops_per_sec']))
+    return regressions
+
+
+def main(names=None, sizes=DEFAULT_SIZES, seed=0, repeat=5, output=None, baseline=None, threshold=0.2):
+    # Command-line driver used by "python -m oop_questions bench"; returns an exit status.
+    results = run_suite(names, sizes, seed, repeat)
+    document = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'results': results,
+    }
+    if output:
+        with open(output, 'w') as out:
+            json.dump(document, out, indent=2)
+        print(f"Results written to {output}")
+    if baseline:
+        with open(baseline) as source:
+            regressions = compare(results, json.load(source), threshold)
+        for name, n, before, after in regressions:
+            print(f"REGRESSION {name} n={n:,}: {before:,.0f} -> {after:,.0f} ops/s ({after / before - 1:+.0%})")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {threshold:.0%} compared with {baseline}")
+    return 0
@@ -0,0 +1,248 @@
+# Opt-in instrumentation for the model classes: construction counts per class, timing histograms for
+# selected hot methods and, optionally, sampled call stacks in the "folded" format read by flame graph
+# tools (flamegraph.pl, speedscope, inferno).
+#
+# Nothing here runs unless it is switched on, so the classes pay no cost by default. Switching it on
+# wraps the listed __init__ methods and hot methods in place (so classes already imported elsewhere
+# are instrumented too) and switching it off puts the original functions back.
+#
+#     with instrument.profiling() as profile:    # from code
+#         ...
+#     print(profile.summary())
+#
+#     OOP_QUESTIONS_PROFILE=1 python -m oop_questions demo all             # summary printed at exit
+#     OOP_QUESTIONS_PROFILE=stacks.folded python -m oop_questions demo q4  # summary + stack samples
+
+import atexit
+import contextlib
+import importlib
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from functools import wraps
+
+ENVIRONMENT_VARIABLE = 'OOP_QUESTIONS_PROFILE'
+
+# Classes whose constructions are counted, per question module ('Book.Chapter' is a nested class).
+CONSTRUCTED = {
+    'q1': ('Vehicle', 'SchoolBus', 'Fruit'),
+    'q2': ('Employee', 'EmployeeRecord'),
+    'q3': ('SchoolOne', 'SchoolTwo'),
+    'q4': ('Vector', 'VectorN'),
+    'q5': ('Author', 'Book', 'Book.Chapter'),
+}
+
+# Methods whose calls are timed.
+TIMED = {
+    'q1': ('SchoolBusPlanner.assign',),
+    'q2': ('Employee.from_string', 'Employee.from_dict'),
+    'q3': ('School.display_stats', 'School.GradeCalculator.average', 'School.GradeCalculator.gpa'),
+    'q4': ('Vector.__add__', 'Vector.dot_product'),
+    'q5': ('Book.__str__', 'Book.add_chapter'),
+}
+
+_active = None  # the running Profile, if any
+
+
+class Histogram:
+    # Call durations bucketed by powers of two of nanoseconds: recording a call is one
+    # int.bit_length() and one list increment, and 64 buckets cover any duration.
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.count = 0
+        self.total_ns = 0
+
+    def record(self, elapsed_ns):
+        self.buckets[min(elapsed_ns.bit_length(), 63)] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+
+    def percentile(self, q):
+        # Upper bound (in ns) of the bucket holding the q-th percentile.
+        rank = q / 100 * self.count
+        seen = 0
+        for bucket, hits in enumerate(self.buckets):
+            seen += hits
+            if hits and seen >= rank:
+                return 1 << bucket
+        return 0
+
+
+class StackSampler:
+    # Background thread that records the call stack of one thread every 'interval' seconds.
+    # Stacks are kept as "frame;frame;frame" strings (outermost first) with a sample count each.
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="oop-questions-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{getattr(code, 'co_qualname', code.co_name)}")
+                frame = frame.f_back
+            if stack:
+                self.samples[';'.join(reversed(stack))] += 1
+
+    def write_folded(self, path):
+        with open(path, 'w') as out:
+            for stack, count in self.samples.most_common():
+                out.write(f"{stack} {count}\n")
+
+
+class Profile:
+    def __init__(self, sample_interval=None):
+        self.constructions = Counter()
+        self.timings = {}
+        self.sampler = (StackSampler(threading.get_ident(), sample_interval)
+                        if sample_interval else None)
+        self._restore = []  # (owner, attribute, original value or None if it was inherited)
+
+    # --- Wrapping ---
+
+    def _patch(self, owner, attribute, value):
+        self._restore.append((owner, attribute, owner.__dict__.get(attribute)))
+        setattr(owner, attribute, value)
+
+    def _count_constructions(self, cls, label):
+        # Each listed class gets its own counting __init__ (even when it inherits one) and only
+        # counts objects of exactly that class, so a SchoolBus is not also counted as a Vehicle.
+        original = cls.__init__
+        if original is object.__init__:
+            # The class is built entirely by __new__ (like VectorN, an array subclass), and
+            # object.__init__ rejects the constructor arguments once __init__ is overridden.
+            def original(self, *args, **kwargs):
+                pass
+        constructions = self.constructions
+
+        @wraps(original)
+        def __init__(self, *args, **kwargs):
+            if type(self) is cls:
+                constructions[label] += 1
+            original(self, *args, **kwargs)
+
+        self._patch(cls, '__init__', __init__)
+
+    def _time_calls(self, owner, attribute, label):
+        raw = owner.__dict__[attribute]
+        function = raw.__func__ if isinstance(raw, (classmethod, staticmethod)) else raw
+        histogram = self.timings[label] = Histogram()
+        clock = time.perf_counter_ns
+
+        @wraps(function)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.record(clock() - start)
+
+        self._patch(owner, attribute, type(raw)(timed) if function is not raw else timed)
+
+    def install(self):
+        for question in sorted(set(CONSTRUCTED) | set(TIMED)):
+            module = importlib.import_module(f"oop_questions.{question}")
+            for path in CONSTRUCTED.get(question, ()):
+                self._count_constructions(_resolve(module, path), path)
+            for path in TIMED.get(question, ()):
+                owner_path, _, attribute = path.rpartition('.')
+                self._time_calls(_resolve(module, owner_path), attribute, path)
+        if self.sampler:
+            self.sampler.start()
+
+    def uninstall(self):
+        if self.sampler:
+            self.sampler.stop()
+        # Undo in reverse order; attributes that were inherited are deleted again.
+        while self._restore:
+            owner, attribute, original = self._restore.pop()
+            if original is None:
+                delattr(owner, attribute)
+            else:
+                setattr(owner, attribute, original)
+
+    # --- Reporting ---
+
+    def summary(self):
+        lines = ["Constructions:"]
+        for label, count in self.constructions.most_common():
+            lines.append(f"  {label:<32} {count:>12,}")
+        lines.append("Timed calls:                          calls     total ms    mean us  p50 <= us  p99 <= us")
+        for label, histogram in sorted(self.timings.items(), key=lambda item: -item[1].total_ns):
+            if histogram.count:
+                lines.append(f"  {label:<32} {histogram.count:>10,} {histogram.total_ns / 1e6:>12.3f} "
+                             f"{histogram.total_ns / histogram.count / 1e3:>10.2f} "
+                             f"{histogram.percentile(50) / 1e3:>10.2f} {histogram.percentile(99) / 1e3:>10.2f}")
+        if self.sampler:
+            lines.append(f"Stack samples: {sum(self.sampler.samples.values()):,}")
+        return "\n".join(lines)
+
+
+def _resolve(module, path):
+    target = module
+    for name in path.split('.'):
+        target = getattr(target, name)
+    return target
+
+
+def enable(sample_interval=None):
+    # Start instrumenting; returns the new Profile. Only one can be active at a time.
+    global _active
+    if _active is not None:
+        raise RuntimeError("Instrumentation is already enabled")
+    _active = Profile(sample_interval)
+    _active.install()
+    return _active
+
+
+def disable():
+    # Stop instrumenting and return the finished Profile (None if it was not enabled).
+    global _active
+    profile, _active = _active, None
+    if profile is not None:
+        profile.uninstall()
+    return profile
+
+
+@contextlib.contextmanager
+def profiling(sample_interval=None):
+    profile = enable(sample_interval)
+    try:
+        yield profile
+    finally:
+        disable()
+
+
+def enable_from_environment():
+    # OOP_QUESTIONS_PROFILE=1 prints a summary to stderr at exit; any other value is taken as a file
+    # name for the folded stack samples as well.
+    setting = os.environ.get(ENVIRONMENT_VARIABLE, '')
+    if setting in ('', '0'):
+        return
+    stacks_path = None if setting == '1' else setting
+    enable(sample_interval=0.001 if stacks_path else None)
+
+    def report():
+        profile = disable()
+        if profile is None:
+            return
+        print(profile.summary(), file=sys.stderr)
+        if stacks_path:
+            profile.sampler.write_folded(stacks_path)
+            print(f"Stack samples written to {stacks_path}", file=sys.stderr)
+
+    atexit.register(report)
@@ -0,0 +1,7 @@
+# Classes from "5-OOP-Questions_Q2(Multiple-Constructors).py" (imported without running its demo).
+
+import sys
+
+from oop_questions._loader import load_question
+
+load_question(sys.modules[__name__], 'q2')
@@ -0,0 +1,61 @@
+# Cold-start import benchmark. Each target is imported in a fresh interpreter started with
+# "-X importtime", and the import times it reports are added up, minus what a bare interpreter
+# spends on its own startup imports (site, encodings, ...). Short-lived workers pay this cost on
+# every start, so a budget (--max-ms) turns slow imports into a failing check.
+
+import os
+import statistics
+import subprocess
+import sys
+
+from oop_questions import _EXPORTS
+from oop_questions._loader import ROOT
+
+# What each target imports: the bare package, then one class from every question module. The
+# question modules are imported with an import statement, not through the package's lazy
+# __getattr__ (importlib.import_module), because -X importtime only reports the former.
+TARGETS = {"oop_questions": "import oop_questions"}
+TARGETS.update(
+    (f"oop_questions.{module}.{names[0]}", f"from oop_questions.{module} import {names[0]}")
+    for module, names in _EXPORTS.items()
+)
+
+
+def measure(statement):
+    # Run 'statement' in a new interpreter and return (total import time in ms, {module: ms})
+    # for the top-level imports it triggered, as reported by -X importtime.
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, env=env, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        # Lines look like "import time:  self [us] | cumulative | name"; nested imports are
+        # indented in the name column, so only unindented names are counted towards the total.
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            modules[name.strip()] = int(cumulative) / 1000
+    return sum(modules.values()), modules
+
+
+def run_benchmark(runs=5, max_ms=None):
+    # Print the median import time of every target (plus its heaviest imports) and return an exit
+    # status: 1 if a budget was given and any target went over it, otherwise 0.
+    for statement in TARGETS.values():
+        measure(statement)  # Warm up: make sure bytecode caches exist before timing.
+    bare = [measure("pass") for _ in range(runs)]
+    baseline = statistics.median(total for total, _ in bare)
+    startup_modules = set(bare[-1][1])
+    print(f"{'bare interpreter (subtracted)':<40} {baseline:8.2f} ms")
+    failed = False
+    for target, statement in TARGETS.items():
+        samples = [measure(statement) for _ in range(runs)]
+        median = max(statistics.median(total for total, _ in samples) - baseline, 0.0)
+        heaviest = sorted(((name, ms) for name, ms in samples[-1][1].items() if name not in startup_modules),
+                          key=lambda item: item[1], reverse=True)[:3]
+        over = max_ms is not None and median > max_ms
+        failed = failed or over
+        print(f"{target:<40} {median:8.2f} ms{'  OVER BUDGET' if over else ''}")
+        print(f"{'':<40} heaviest: {', '.join(f'{name} {ms:.1f} ms' for name, ms in heaviest)}")
+    return 1 if failed else 0